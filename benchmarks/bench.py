@@ -0,0 +1,224 @@
+"""
+Benchmark suite of board phases, brain inference, reproduction and whole simulation steps.
+
+Run from the repository root:
+
+python -m benchmarks.bench --sizes 100 1000 10000 --output results.json
+python -m benchmarks.bench --sizes 100 1000 10000 --baseline results.json
+
+Every result is keyed by scenario, agents number and metric, results are written as JSON and compared with
+a baseline written by a previous run, the process exits with code 1 if any metric regressed more than `--tolerance`.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Sequence
+
+import numpy
+
+# pygame prints its banner to stdout on import, which would break JSON results written there.
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import eevolve
+from benchmarks.scenarios import Scenarios
+
+
+class Benchmark:
+    DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+    DEFAULT_STEPS = 20
+    DEFAULT_WARMUP_STEPS = 5
+    DEFAULT_TOLERANCE = 0.1
+    PER_AGENT_LIMIT = 10_000
+
+    @staticmethod
+    def steps(scenario: str, agents_number: int, steps: int, warmup_steps: int, seed: int) -> list[dict[str, Any]]:
+        """
+        Measures board phases, every task and whole steps of the scenario with `Game.stats`.
+
+        :return: Mean milliseconds per call of every section and agent steps per second of whole steps.
+        """
+        game = Scenarios.build(scenario, agents_number, seed)
+
+        game.run_steps(warmup_steps, Scenarios.STEP_MS)
+        game.stats.clear()
+
+        start = time.perf_counter()
+        game.run_steps(steps, Scenarios.STEP_MS)
+        elapsed = time.perf_counter() - start
+
+        results = []
+        task_indexes = {task: index for index, task in enumerate(game.scheduler.tasks)}
+
+        for section, report in game.stats.report().items():
+            name = eevolve.TimingStats.name_of(section)
+
+            # Handler names are not unique, the registration index and type tell tasks with the same handler apart.
+            if not isinstance(section, str):
+                name = f"task.{task_indexes.get(section, 'removed')}.{type(section).__name__}.{name}"
+
+            results.append(Benchmark._result(scenario, agents_number, f"{name}.mean_ms", report["mean"] * 1000, "lower"))
+            results.append(Benchmark._result(scenario, agents_number, f"{name}.p95_ms", report["p95"] * 1000, "lower"))
+
+        results.append(Benchmark._result(scenario, agents_number, "step.agent_steps_per_second",
+                                         agents_number * steps / elapsed, "higher"))
+
+        return results
+
+    @staticmethod
+    def brain(agents_number: int, seed: int) -> list[dict[str, Any]]:
+        """
+        Measures inference of the `examples/war` brain, one `Brain` call per agent and one `PopulationBrain` call for
+        the whole population. Per agent calls are limited to `PER_AGENT_LIMIT` agents.
+
+        :return: Inferences per second of both ways.
+        """
+        eevolve.NumbersGenerator.seed(seed)
+
+        brains = [Scenarios.war_brain() for _ in range(agents_number)]
+        observations = eevolve.NumbersGenerator.uniform((agents_number, 16), offset=-1.0, scaler=2.0)
+
+        number = min(agents_number, Benchmark.PER_AGENT_LIMIT)
+        start = time.perf_counter()
+
+        for brain, observation in zip(brains[:number], observations):
+            brain(observation)
+
+        per_agent = number / (time.perf_counter() - start)
+
+        population = eevolve.PopulationBrain(brains)
+        population(observations)
+
+        start = time.perf_counter()
+        population(observations)
+        batched = agents_number / (time.perf_counter() - start)
+
+        return [
+            Benchmark._result("brain", agents_number, "forward.inferences_per_second", per_agent, "higher"),
+            Benchmark._result("brain", agents_number, "population.inferences_per_second", batched, "higher"),
+        ]
+
+    @staticmethod
+    def reproduction(agents_number: int, seed: int) -> list[dict[str, Any]]:
+        """
+        Measures `new_like_me` of `examples/war` agents followed by adding children to the board, as
+        `Game._agents_reproduce` does. Limited to `PER_AGENT_LIMIT` children.
+
+        :return: Children per second.
+        """
+        game = Scenarios.war(agents_number, seed)
+        parents = list(game.agents)[:min(agents_number, Benchmark.PER_AGENT_LIMIT)]
+
+        start = time.perf_counter()
+
+        for parent in parents:
+            game.add_agent(parent.new_like_me())
+
+        children = len(parents) / (time.perf_counter() - start)
+
+        return [Benchmark._result("reproduction", agents_number, "children_per_second", children, "higher")]
+
+    @staticmethod
+    def run(sizes: Sequence[int], scenarios: Sequence[str], steps: int, warmup_steps: int,
+            seed: int) -> dict[str, Any]:
+        results = []
+
+        for agents_number in sizes:
+            for scenario in scenarios:
+                print(f"[{scenario}] {agents_number} agents...", file=sys.stderr)
+                results.extend(Benchmark.steps(scenario, agents_number, steps, warmup_steps, seed))
+
+            print(f"[brain, reproduction] {agents_number} agents...", file=sys.stderr)
+            results.extend(Benchmark.brain(agents_number, seed))
+            results.extend(Benchmark.reproduction(agents_number, seed))
+
+        return {
+            "meta": {
+                "python": platform.python_version(),
+                "numpy": numpy.__version__,
+                "platform": platform.platform(),
+                "seed": seed,
+                "steps": steps,
+                "warmup_steps": warmup_steps,
+                "step_ms": Scenarios.STEP_MS,
+            },
+            "results": results,
+        }
+
+    @staticmethod
+    def compare(results: dict[str, Any], baseline: dict[str, Any],
+                tolerance: float = DEFAULT_TOLERANCE) -> list[tuple[str, float, float, float]]:
+        """
+        Compares results with the baseline, metrics missing in any of them are skipped.
+
+        :param results: Results of the current run.
+        :param baseline: Results of a previous run.
+        :param tolerance: Allowed relative slowdown, 0.1 means 10%.
+        :return: List of regressions as (key, baseline value, current value, relative slowdown).
+        """
+        baseline_values = {Benchmark._key(result): result for result in baseline["results"]}
+        regressions = []
+
+        for result in results["results"]:
+            key = Benchmark._key(result)
+            previous = baseline_values.get(key)
+
+            if previous is None or not previous["value"] or not numpy.isfinite(result["value"]):
+                continue
+
+            if result["better"] == "higher":
+                slowdown = previous["value"] / result["value"] - 1.0 if result["value"] else numpy.inf
+            else:
+                slowdown = result["value"] / previous["value"] - 1.0
+
+            print(f"{key}: {previous['value']:.4g} -> {result['value']:.4g} ({slowdown:+.1%} slower)", file=sys.stderr)
+
+            if slowdown > tolerance:
+                regressions.append((key, previous["value"], result["value"], slowdown))
+
+        return regressions
+
+    @staticmethod
+    def _key(result: dict[str, Any]) -> str:
+        return f"{result['scenario']}/{result['agents']}/{result['metric']}"
+
+    @staticmethod
+    def _result(scenario: str, agents_number: int, metric: str, value: float, better: str) -> dict[str, Any]:
+        return {"scenario": scenario, "agents": agents_number, "metric": metric, "value": float(value),
+                "better": better}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="EEvolve benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=Benchmark.DEFAULT_SIZES)
+    parser.add_argument("--scenarios", nargs="+", default=Scenarios.names(), choices=Scenarios.names())
+    parser.add_argument("--steps", type=int, default=Benchmark.DEFAULT_STEPS)
+    parser.add_argument("--warmup-steps", type=int, default=Benchmark.DEFAULT_WARMUP_STEPS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Path of JSON file to write results to.")
+    parser.add_argument("--baseline", help="Path of JSON results of a previous run to compare with.")
+    parser.add_argument("--tolerance", type=float, default=Benchmark.DEFAULT_TOLERANCE)
+    arguments = parser.parse_args()
+
+    results = Benchmark.run(arguments.sizes, arguments.scenarios, arguments.steps, arguments.warmup_steps,
+                            arguments.seed)
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+
+    if arguments.baseline:
+        with open(arguments.baseline, "r", encoding="utf-8") as file:
+            regressions = Benchmark.compare(results, json.load(file), arguments.tolerance)
+
+        if regressions:
+            print(f"{len(regressions)} metrics regressed more than {arguments.tolerance:.0%}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
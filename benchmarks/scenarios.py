@@ -0,0 +1,109 @@
+import math
+
+import numpy
+
+import eevolve
+from examples.space.source.simulation import Simulation as SpaceSimulation
+from examples.space.source.space_agent import SpaceAgent
+from examples.war.source.simulation import Simulation as WarSimulation
+from examples.war.source.war_agent import WarAgent
+
+
+class Scenarios:
+    """
+    Headless, seeded games modelled on `examples/war` and `examples/space`, the display grows with the population,
+    so agents density and therefore collisions and neighbours number per agent stay the same for all sizes.
+
+    Example:
+
+    game = Scenarios.war(10_000, seed=0)
+    game.run_steps(100, Scenarios.STEP_MS)
+    """
+
+    STEP_MS = 16
+    SECTOR_SIZE = 64
+    BACKGROUND = numpy.zeros((1, 1, 3), dtype=numpy.uint8)
+
+    WAR_AREA_PER_AGENT = 96 * 96
+    WAR_AGENT_SIZE = (16, 16)
+    WAR_ASSETS_PATH = "examples/war/assets/"
+    WAR_MAPPING = numpy.array([[i * 10, j * 10] for i in range(-1, 2) for j in range(-1, 2)])
+
+    SPACE_AREA_PER_AGENT = 1920 * 1080 // 150
+    SPACE_ASSET = "examples/space/assets/star.png"
+
+    @staticmethod
+    def names() -> tuple[str, ...]:
+        return "war", "space"
+
+    @staticmethod
+    def build(name: str, agents_number: int, seed: int = 0) -> eevolve.Game:
+        if name == "war":
+            return Scenarios.war(agents_number, seed)
+        elif name == "space":
+            return Scenarios.space(agents_number, seed)
+        else:
+            raise ValueError(f"Unknown scenario, expected one of {Scenarios.names()}. {name} given instead!")
+
+    @staticmethod
+    def war_brain() -> eevolve.Brain:
+        brain = eevolve.Brain(Scenarios.WAR_MAPPING)
+        brain.add_layers([
+            eevolve.Dense((16, 8), activation=eevolve.Relu()),
+            eevolve.Dense((8, 8), activation=eevolve.Relu()),
+            eevolve.Dense((8, len(Scenarios.WAR_MAPPING)), activation=eevolve.Softmax()),
+            eevolve.Argmax(return_int=True),
+        ])
+
+        return brain
+
+    @staticmethod
+    def war(agents_number: int, seed: int = 0) -> eevolve.Game:
+        game = Scenarios._game(agents_number, Scenarios.WAR_AREA_PER_AGENT, seed, collision_timeout=50)
+        brain = Scenarios.war_brain()
+        half = agents_number // 2
+
+        for name, number in (("Blue", half), ("Red", agents_number - half)):
+            agent = WarAgent(Scenarios.WAR_AGENT_SIZE, (0, 0), name, f"{Scenarios.WAR_ASSETS_PATH}{name.lower()}.png",
+                             brain)
+            game.add_agents(number, eevolve.AgentGenerator.like(agent, number, lambda index: f"{name}_{index}"))
+
+        game.add_tasks((
+            eevolve.AroundAgentTask(WarSimulation.movement_handler, 100),
+            eevolve.CollisionTask(WarSimulation.collision_handler, 0),
+            eevolve.AgentTask(WarSimulation.check_reproduce_handler, 0),
+            eevolve.AgentTask(WarSimulation.age_handler, 250),
+            eevolve.AgentTask(WarSimulation.die_handler, 0),
+            eevolve.BorderCollisionTask(WarSimulation.border_collision, 0),
+        ))
+
+        return game
+
+    @staticmethod
+    def space(agents_number: int, seed: int = 0) -> eevolve.Game:
+        game = Scenarios._game(agents_number, Scenarios.SPACE_AREA_PER_AGENT, seed, collision_timeout=500)
+
+        agent = SpaceAgent(0.0, agent_surface=Scenarios.SPACE_ASSET)
+        generators = {
+            "size": eevolve.NumbersGenerator.hypercube_generator(agents_number, 2, 10.0, 25.0, dtype=int),
+            "velocity": eevolve.NumbersGenerator.normal_generator(agents_number, shape=(2,), scaler=100.0),
+        }
+
+        game.add_agents(agents_number, eevolve.AgentGenerator.like_with_generators(agent, agents_number, generators))
+        game.add_tasks((
+            eevolve.NBodyTask(None, 0, priority=eevolve.HIGHEST_TASK_PRIORITY + 2, theta=SpaceSimulation.THETA,
+                              softening=SpaceSimulation.SOFTENING, masses="mass"),
+            eevolve.BorderCollisionTask(SpaceSimulation.board_handler, 0, priority=eevolve.HIGHEST_TASK_PRIORITY + 2),
+            eevolve.CollisionTask(SpaceSimulation.collision_handler, 0),
+        ))
+
+        return game
+
+    @staticmethod
+    def _game(agents_number: int, area_per_agent: int, seed: int, collision_timeout: int) -> eevolve.Game:
+        side = max(Scenarios.SECTOR_SIZE, math.ceil(math.sqrt(agents_number * area_per_agent)))
+        display_size = (side, side)
+
+        return eevolve.Game(display_size, display_size, "benchmark", Scenarios.BACKGROUND,
+                            max(1, side // Scenarios.SECTOR_SIZE), collision_timeout=collision_timeout,
+                            headless=True, seed=seed)
@@ -1,12 +1,23 @@
-from .brain import Brain
+from .brain import Brain, PopulationBrain
+from .store import AgentStore
+from .pool import AgentPool
 from .agent import Agent
 from .board import Board
-from .task import Task, CollisionTask, AgentTask, FrameEndTask, PairTask, BorderCollisionTask, AroundAgentTask
+from .spatial import SpatialIndex, GridIndex, HashedGridIndex, QuadTreeIndex
+from .task import Task, CollisionTask, AgentTask, FrameEndTask, PairTask, BorderCollisionTask, AroundAgentTask, \
+    BatchAgentTask, BatchAroundAgentTask, BatchPairTask, BatchCollisionTask, NBodyTask
+from .stats import TimingStats
+from .scheduler import TaskScheduler
 from .game import Game
 from .generator import PositionGenerator, AgentGenerator, ColorGenerator
 from .numbers import NumbersGenerator
 from .eemath import Math
-from .loader import Loader
+from .collision import SweepAndPrune, CollisionShapes
+from .neighbours import CellList, VerletList
+from .nbody import BarnesHut
+from .timeouts import CollisionTimeouts
+from .loader import Loader, SurfaceCache
+from .render import Renderer
 from .layers import Layer, Dense, Conv1D, Argmax
 from .activations import Activation, Tanh, Relu, ParametricRelu, Softmax, Sigmoid
 from .constants import *
@@ -7,10 +7,66 @@ import pygame
 from eevolve.brain import Brain
 from eevolve.loader import Loader
 from eevolve.eemath import Math
-from eevolve.constants import MAGNITUDE_EPSILON, COLLISION_UP, COLLISION_RIGHT, COLLISION_DOWN, COLLISION_LEFT
+from eevolve.store import AgentStore
+from eevolve.collision import CollisionShapes
+from eevolve.constants import MAGNITUDE_EPSILON, COLLISION_UP, COLLISION_RIGHT, COLLISION_DOWN, COLLISION_LEFT, \
+    CLONE_SHARE, CLONE_COPY, CLONE_REGENERATE, CLONE_RESET, SHAPE_AABB, SHAPE_CIRCLE, SHAPE_CUSTOM
+
+
+_IMMUTABLE_TYPES = (int, float, complex, str, bytes, tuple, frozenset, type(None))
+_RESETTABLE_TYPES = (list, dict, set, int, float, str, tuple)
+_CLONE_POLICIES: dict[type, dict[str, str]] = {}
+_COLLISION_SHAPES: dict[type, int] = {}
+_DIRECTIONS_ORDER = (COLLISION_RIGHT, COLLISION_LEFT, COLLISION_DOWN, COLLISION_UP)
 
 
 class Agent:
+    """
+    Cloning of agents by `clone`, `new_like_me` and the default reproduce function is driven by `CLONE_POLICY`,
+    a mapping of attribute names to policies, which is merged along the class MRO, so subclasses only declare their
+    own attributes:
+
+    - `CLONE_SHARE`: the clone refers to the same object;
+    - `CLONE_COPY`: the clone gets its own copy, immutable values are shared, arrays and containers are copied
+      shallowly, surfaces from `Loader.cache` stay shared, anything else is deep-copied;
+    - `CLONE_REGENERATE`: the clone gets `value.new_like_me()`, e.g. a new random brain;
+    - `CLONE_RESET`: the clone gets an empty value of the same built-in type, or None.
+
+    Attributes without a policy get `new_like_me()` if they have it, otherwise a deep copy.
+
+    Example:
+
+    class WarAgent(eevolve.Agent):
+        CLONE_POLICY = {"_health": eevolve.CLONE_COPY, "_damage": eevolve.CLONE_COPY}
+
+    Collisions of agents are tested by `Board` in bulk according to `COLLISION_SHAPE`: `SHAPE_AABB` is the agent
+    rectangle, `SHAPE_CIRCLE` is the circle of `collision_radius` around its center, by default the circle inscribed
+    into the rectangle. Agents with `SHAPE_CUSTOM` are tested one pair
+    at a time with their `is_collide`. Classes which override `is_collide` without declaring a shape are custom,
+    the default `is_collide` treats them as rectangles.
+
+    class Star(eevolve.Agent):
+        COLLISION_SHAPE = eevolve.SHAPE_CIRCLE
+    """
+
+    _STORE_ATTRIBUTES = ("_store", "_row")
+
+    COLLISION_SHAPE = SHAPE_AABB
+
+    CLONE_POLICY = {
+        "_agent_size": CLONE_COPY,
+        "_agent_name": CLONE_SHARE,
+        "_agent_surface": CLONE_COPY,
+        "_brain": CLONE_REGENERATE,
+        "_colliding": CLONE_RESET,
+        "_reproduce_metric": CLONE_COPY,
+        "_reproduce_threshold": CLONE_SHARE,
+        "_reproduce_count": CLONE_SHARE,
+        "_reproduce_function": CLONE_SHARE,
+        "_reproduced": CLONE_RESET,
+        "_children": CLONE_RESET,
+    }
+
     def __init__(self, agent_size: tuple[int | float, int | float] | numpy.ndarray = (0, 0),
                  agent_position: tuple[int | float, int | float] | numpy.ndarray = (0, 0),
                  agent_name: str = "", agent_surface: str | pygame.Surface | numpy.ndarray = pygame.Surface((0, 0)),
@@ -22,9 +78,14 @@ class Agent:
         :param agent_position: The initial position of the Agent.
         :param agent_name: The name of the agent.
         :param agent_surface: If passes string image by this path will be loaded,
-        numpy bitmap array will be converted to pygame.Surface, pygame.Surface will be loaded directly.
+        numpy bitmap array will be converted to pygame.Surface, pygame.Surface will be loaded directly. Surfaces
+        loaded from a path or an array are shared with other agents through `Loader.cache`, call
+        `make_surface_private` before drawing on it.
         :param brain: The Brain class instance for the Agent.
 
+        Position, size, velocity, dead flag and border collisions of the Agent are kept in a row of `AgentStore`,
+        which belongs to the `Board` the Agent was added to. Properties of the Agent read and write that row.
+
         Example:
             brain_instance = Brain(...)
 
@@ -33,15 +94,16 @@ class Agent:
         self._agent_size = agent_size
         self._agent_name = agent_name
 
-        self._agent_surface = Loader.load_surface(agent_surface, agent_size)
-        self._rect = pygame.FRect(agent_position, agent_size)
-        self._sector_index = None
+        self._agent_surface = Loader.load_surface(agent_surface, agent_size, private=False)
+        self._bind(None, -1)
+        AgentStore.detached().attach(self)
+
+        self._store.positions[self._row] = agent_position[0], agent_position[1]
+        self._store.sizes[self._row] = agent_size[0], agent_size[1]
+        self._store.uids[self._row] = AgentStore.new_uid()
 
         self._brain = brain if brain is not None else Brain([])
-        self._is_dead = False
-        self._is_colliding_border = False
         self._colliding: Union["Agent", None, Any] = None
-        self._colliding_directions = []
 
         self._reproduce_metric = 0
         self._reproduce_threshold = reproduce_threshold
@@ -50,8 +112,6 @@ class Agent:
         self._reproduced = False
         self._children: list["Agent"] = []
 
-        self._velocity = numpy.zeros((2,), dtype=float)
-
     def accelerate_by(self, delta: tuple[int | float, int | float] | numpy.ndarray,
                       velocity_bounds: tuple[float, float] = (float("-inf"), float("inf"))) -> None:
         """
@@ -65,10 +125,10 @@ class Agent:
         :param delta: Delta X and Y which will be added to current Agent position.
         :return: None
         """
-        delta = delta if isinstance(delta, numpy.ndarray) else numpy.array(delta)
+        velocity = self._store.velocities[self._row]
 
-        self._velocity += delta
-        self._velocity = numpy.clip(self._velocity, velocity_bounds[0], velocity_bounds[1])
+        velocity += delta
+        numpy.clip(velocity, velocity_bounds[0], velocity_bounds[1], out=velocity)
 
     def move_to(self, position: tuple[int | float, int | float] | numpy.ndarray) -> None:
         """
@@ -81,8 +141,7 @@ class Agent:
         :param position: New X and Y coordinate of Agent.
         :return: None
         """
-        self._rect.x = position[0]
-        self._rect.y = position[1]
+        self._store.positions[self._row] = position[0], position[1]
 
     def accelerate_toward(self, point: Sequence[float | int] | numpy.ndarray | Any, value: float | int) -> None:
         if isinstance(point, Agent):
@@ -107,32 +166,40 @@ class Agent:
         self.accelerate_by((x * value, y * value))
 
     def move(self, delta_time: float, lower: tuple[int, int], upper: tuple[int, int], reset_velocity: bool = False) -> None:
-        if upper[0] < self._rect.width or upper[0] < self._rect.height:
+        width, height = self.size
+
+        if upper[0] < width or upper[0] < height:
             raise ValueError(f"Upper bound minimum value is Agent size. {upper} given instead!")
         lower = (0, 0) if lower is None else lower
         upper = upper if upper is not None else (float('inf'), float('inf'))
 
-        self._rect.x, collide_x = Math.clip(self._rect.x + self._velocity[0] * delta_time,
-                                            lower[0], upper[0] - self._rect.width, return_bool=True)
-        self._rect.y, collide_y = Math.clip(self._rect.y + self._velocity[1] * delta_time,
-                                            lower[1], upper[1] - self._rect.height, return_bool=True)
-        self._colliding_directions.clear()
-        self._is_colliding_border = collide_x or collide_y
+        position = self._store.positions[self._row]
+        velocity = self._store.velocities[self._row]
+
+        x, collide_x = Math.clip(float(position[0] + velocity[0] * delta_time),
+                                 lower[0], upper[0] - width, return_bool=True)
+        y, collide_y = Math.clip(float(position[1] + velocity[1] * delta_time),
+                                 lower[1], upper[1] - height, return_bool=True)
+        position[0], position[1] = x, y
+        border = 0
 
         if collide_x:
-            if self._rect.x >= upper[0] - self._rect.width:
-                self._colliding_directions.append(COLLISION_RIGHT)
-            elif self._rect.x <= lower[0]:
-                self._colliding_directions.append(COLLISION_LEFT)
+            if x >= upper[0] - width:
+                border |= 1 << COLLISION_RIGHT
+            elif x <= lower[0]:
+                border |= 1 << COLLISION_LEFT
 
         if collide_y:
-            if self._rect.y >= upper[1] - self._rect.height:
-                self._colliding_directions.append(COLLISION_DOWN)
-            elif self._rect.y <= lower[1]:
-                self._colliding_directions.append(COLLISION_UP)
+            if y >= upper[1] - height:
+                border |= 1 << COLLISION_DOWN
+            elif y <= lower[1]:
+                border |= 1 << COLLISION_UP
+
+        self._store.border[self._row] = border
+        self._store.border_flags[self._row] = False
 
         if reset_velocity:
-            self._velocity = numpy.zeros(self._velocity.shape, dtype=float)
+            velocity[:] = 0.0
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -159,34 +226,168 @@ class Agent:
         :param agent: Agent instance to check collision with.
         :return: True if the agents collide, False otherwise.
         """
-        return self._rect.colliderect(agent.rect)
+        shape = Agent.collision_shape_of(type(self))
+        other_shape = Agent.collision_shape_of(type(agent))
+
+        if shape != SHAPE_CIRCLE and other_shape != SHAPE_CIRCLE:
+            return self.rect.colliderect(agent.rect)
+
+        shape = SHAPE_AABB if shape == SHAPE_CUSTOM else shape
+        other_shape = SHAPE_AABB if other_shape == SHAPE_CUSTOM else other_shape
+
+        boxes = numpy.array([[*self.position, *self.size], [*agent.position, *agent.size]], dtype=float)
+        shapes = numpy.array([shape, other_shape])
+        radii = numpy.array([self._store.radii[self._row], agent.store.radii[agent.row]])
+
+        return bool(CollisionShapes.collide_mask(boxes, shapes, numpy.array([0]), numpy.array([1]), radii)[0])
+
+    @staticmethod
+    def collision_shape_of(agent_type: type) -> int:
+        """
+        :param agent_type: Agent class.
+        :return: `COLLISION_SHAPE` of the class, `SHAPE_CUSTOM` if `is_collide` is overridden closer in the MRO than
+        the shape is declared.
+        """
+        shape = _COLLISION_SHAPES.get(agent_type)
+
+        if shape is None:
+            shape = SHAPE_AABB
+
+            for base in agent_type.__mro__:
+                if "COLLISION_SHAPE" in base.__dict__:
+                    shape = base.__dict__["COLLISION_SHAPE"]
+                    break
+                if "is_collide" in base.__dict__:
+                    shape = SHAPE_CUSTOM
+                    break
+
+            _COLLISION_SHAPES[agent_type] = shape
+
+        return shape
 
     def decide(self, observation: Sequence[Any], *args, **kwargs) -> Any:
         return self._brain(observation, self, *args, **kwargs)
 
     def die(self) -> None:
-        self._is_dead = True
+        self._store.dead[self._row] = True
 
     def new_like_me(self) -> "Agent":
-        new_agent = type(self)(agent_size=self._agent_size, agent_position=self.position, agent_name=self._agent_name,
-                               agent_surface=deepcopy(self._agent_surface), brain=self._brain.new_like_me(),
-                               reproduce_threshold=self._reproduce_threshold, reproduce_count=self._reproduce_count,
-                               reproduce_function=self._reproduce_function)
+        return self.clone()
+
+    def clone(self, policy: dict[str, str] = None) -> "Agent":
+        """
+        Creates a new Agent of the same type according to `CLONE_POLICY`, without calling the constructor.
+        The clone gets a row of the detached store with the same position, size and velocity and a new unique id.
+
+        Example:
+
+        child = agent.clone({"_brain": eevolve.CLONE_COPY})
+        child.brain.mutate()
+
+        :param policy: Policies overriding `CLONE_POLICY` for this call.
+        :return: New Agent.
+        """
+        policies = Agent._clone_policy_of(type(self))
+
+        if policy:
+            policies = {**policies, **policy}
+
+        pool = self._store.pool if self._store is not None else None
+        new_agent = pool.acquire(type(self)) if pool is not None else None
+
+        if new_agent is not None:
+            new_agent._recycle_from(self, policies)
+
+            return new_agent
+
+        new_agent = type(self).__new__(type(self))
 
         for attribute, value in self.__dict__.items():
-            if attribute.startswith("__"):
-                continue
+            if attribute not in Agent._STORE_ATTRIBUTES:
+                new_agent.__dict__[attribute] = Agent._clone_value(policies.get(attribute), value)
+
+        new_agent._bind(None, -1)
 
-            if hasattr(value, "new_like_me"):
-                setattr(new_agent, attribute, value.new_like_me())
-            else:
-                setattr(new_agent, attribute, deepcopy(value))
+        AgentStore.detached().attach(new_agent)
+        new_agent._copy_row_from(self)
 
         return new_agent
 
+    def _recycle_from(self, parent: "Agent", policies: dict[str, str]) -> None:
+        for attribute, value in parent.__dict__.items():
+            if attribute not in Agent._STORE_ATTRIBUTES:
+                self.__dict__[attribute] = Agent._recycle_value(policies.get(attribute), value,
+                                                                self.__dict__.get(attribute))
+
+        self._copy_row_from(parent)
+
+    @staticmethod
+    def _recycle_value(policy: str | None, value: Any, old: Any) -> Any:
+        if old is None or old is value:
+            return Agent._clone_value(policy, value)
+
+        if policy == CLONE_COPY:
+            if (isinstance(value, numpy.ndarray) and isinstance(old, numpy.ndarray)
+                    and old.shape == value.shape and old.dtype == value.dtype):
+                old[...] = value
+                return old
+            elif isinstance(value, Brain) and isinstance(old, Brain) and old.copy_from(value):
+                return old
+        elif policy == CLONE_RESET and isinstance(old, (list, dict, set)) and type(old) is type(value):
+            old.clear()
+            return old
+
+        return Agent._clone_value(policy, value)
+
+    @staticmethod
+    def _clone_policy_of(agent_type: type) -> dict[str, str]:
+        policies = _CLONE_POLICIES.get(agent_type)
+
+        if policies is None:
+            policies = {}
+
+            for base in reversed(agent_type.__mro__):
+                policies.update(base.__dict__.get("CLONE_POLICY", {}))
+
+            _CLONE_POLICIES[agent_type] = policies
+
+        return policies
+
+    @staticmethod
+    def _clone_value(policy: str | None, value: Any) -> Any:
+        if policy == CLONE_SHARE:
+            return value
+        elif policy == CLONE_COPY:
+            if isinstance(value, _IMMUTABLE_TYPES):
+                return value
+            elif isinstance(value, numpy.ndarray):
+                return value.copy()
+            elif isinstance(value, pygame.Surface):
+                return value if Loader.is_shared(value) else value.copy()
+            elif isinstance(value, (list, dict, set)):
+                return value.copy()
+
+            return deepcopy(value)
+        elif policy == CLONE_RESET:
+            return type(value)() if isinstance(value, _RESETTABLE_TYPES) else None
+        elif policy is not None and policy != CLONE_REGENERATE:
+            raise ValueError(f"Clone policy must be one of {(CLONE_SHARE, CLONE_COPY, CLONE_REGENERATE, CLONE_RESET)}. "
+                             f"{policy} given instead!")
+
+        return value.new_like_me() if hasattr(value, "new_like_me") else deepcopy(value)
+
+    def make_surface_private(self) -> None:
+        """
+        Replaces the surface shared with other agents through `Loader.cache` with a private copy, so it can be drawn
+        on without changing other agents.
+
+        :return: None
+        """
+        if Loader.is_shared(self._agent_surface):
+            self._agent_surface = self._agent_surface.copy()
+
     def stop(self) -> None:
-        self._velocity[0] = 0.0
-        self._velocity[1] = 0.0
+        self._store.velocities[self._row] = 0.0
 
     def reproduce(self) -> None:
         if self._reproduce_metric < self._reproduce_threshold or self._reproduced:
@@ -202,18 +403,45 @@ class Agent:
 
     @staticmethod
     def _default_reproduce(parent: Union["Agent", Any]) -> Union["Agent", Any]:
-        child = deepcopy(parent)
+        child = parent.clone({"_brain": CLONE_COPY})
         child.brain.mutate()
 
         return child
 
+    def _bind(self, store: AgentStore | None, row: int) -> None:
+        self._store = store
+        self._row = row
+
+    def _copy_row_from(self, other: "Agent") -> None:
+        self._store.copy_row(other.store, other.row, self._row)
+        self._store.uids[self._row] = AgentStore.new_uid()
+
+    @property
+    def store(self) -> AgentStore | None:
+        return self._store
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    @property
+    def uid(self) -> int:
+        return int(self._store.uids[self._row])
+
     @property
     def position(self) -> tuple[int | float, int | float]:
-        return self._rect.topleft
+        x, y = self._store.positions[self._row].tolist()
+
+        return x, y
 
     @property
     def rect(self) -> pygame.FRect:
-        return self._rect
+        """
+        `pygame.FRect` built from the Agent position and size. Changing the rect, e.g. `agent.rect.x = 10` or
+        `agent.rect.move_ip(5, 5)`, writes new position and size back to the Agent, rects returned by its
+        methods, e.g. `agent.rect.move(5, 5)`, are plain copies.
+        """
+        return _AgentRect.of(self)
 
     @property
     def name(self) -> str:
@@ -225,60 +453,99 @@ class Agent:
 
     @property
     def size(self) -> tuple[int | float, int | float]:
-        return self._rect.size
+        width, height = self._store.sizes[self._row].tolist()
+
+        return width, height
 
     @size.setter
     def size(self, value: tuple[int | float, int | float]) -> None:
-        self._rect.size = value
+        self._store.sizes[self._row] = value[0], value[1]
         self._agent_size = value
 
+    @property
+    def collision_radius(self) -> float:
+        """
+        Radius of the `SHAPE_CIRCLE` collision circle around the Agent center, a half of the smaller side of the Agent
+        unless set. Setting None returns to the default.
+        """
+        radius = float(self._store.radii[self._row])
+
+        return min(self.size) / 2 if numpy.isnan(radius) else radius
+
+    @collision_radius.setter
+    def collision_radius(self, value: float | None) -> None:
+        if value is not None and value < 0:
+            raise ValueError(f"Collision radius must be non-negative. {value} given instead!")
+
+        self._store.radii[self._row] = value if value is not None else numpy.nan
+
     @property
     def is_dead(self) -> bool:
-        return self._is_dead
+        return bool(self._store.dead[self._row])
 
     @is_dead.setter
     def is_dead(self, value: bool) -> None:
-        self._is_dead = value
+        self._store.dead[self._row] = value
 
     @property
     def sector_index(self) -> tuple[int, int] | None:
-        return self._sector_index
+        x_i, y_i = self._store.sectors[self._row].tolist()
+
+        return (x_i, y_i) if x_i >= 0 else None
 
     @sector_index.setter
-    def sector_index(self, value: tuple[int, int]):
-        self._sector_index = value
+    def sector_index(self, value: tuple[int, int] | None):
+        self._store.sectors[self._row] = value if value is not None else (-1, -1)
 
     @property
     def brain(self) -> Brain:
         return self._brain
 
+    @property
+    def surface(self) -> pygame.Surface:
+        return self._agent_surface
+
     @property
     def velocity(self) -> numpy.ndarray:
-        return self._velocity
+        """
+        View of the Agent velocity row, changing it in place changes the Agent velocity.
+        """
+        return self._store.velocities[self._row]
 
     @velocity.setter
     def velocity(self, value: numpy.ndarray) -> None:
-        self._velocity = value
+        self._store.velocities[self._row] = value
 
     @property
     def velocity_norm(self) -> float:
-        return numpy.sqrt((self._velocity ** 2).sum())
+        return numpy.sqrt((self._store.velocities[self._row] ** 2).sum())
 
     @property
     def colliding_border(self) -> bool:
-        return self._is_colliding_border
+        return bool(self._store.border[self._row]) or bool(self._store.border_flags[self._row])
 
     @colliding_border.setter
     def colliding_border(self, value: bool) -> None:
-        self._is_colliding_border = value
+        if not value:
+            self._store.border[self._row] = 0
+
+        self._store.border_flags[self._row] = value
 
     @property
     def collision_directions(self) -> list[Any]:
-        return self._colliding_directions
+        border = int(self._store.border[self._row])
+
+        return [direction for direction in _DIRECTIONS_ORDER if border & (1 << direction)]
 
     @collision_directions.setter
     def collision_directions(self, value: list[int, ...]) -> None:
-        self._colliding_directions = value
+        border = 0
+
+        for direction in value:
+            border |= 1 << direction
+
+        self._store.border[self._row] = border
+        self._store.border_flags[self._row] = False
 
     @property
     def colliding(self) -> Union["Agent", None, Any]:
@@ -303,8 +570,92 @@ class Agent:
     def __str__(self) -> str:
         return f"<{self._agent_name}: ({self.position[0]}, {self.position[1]})>"
 
+    def __copy__(self) -> "Agent":
+        new_agent = type(self).__new__(type(self))
+        new_agent.__dict__.update(self.__dict__)
+        new_agent._bind(None, -1)
+
+        AgentStore.detached().attach(new_agent)
+        new_agent._copy_row_from(self)
+
+        return new_agent
+
+    def __deepcopy__(self, memodict: dict) -> "Agent":
+        new_agent = type(self).__new__(type(self))
+        memodict[id(self)] = new_agent
+
+        if Loader.is_shared(self._agent_surface):
+            memodict[id(self._agent_surface)] = self._agent_surface
+
+        for attribute, value in self.__dict__.items():
+            if attribute not in Agent._STORE_ATTRIBUTES:
+                new_agent.__dict__[attribute] = deepcopy(value, memodict)
+
+        new_agent._bind(None, -1)
+
+        AgentStore.detached().attach(new_agent)
+        new_agent._copy_row_from(self)
+
+        return new_agent
+
     def __repr__(self) -> str:
         return str(self)
 
     def __len__(self) -> int:
         return 0
+
+
+class _AgentRect(pygame.FRect):
+    """
+    `pygame.FRect` which writes its position and size back to the Agent it was built from.
+    """
+
+    __slots__ = ("_agent",)
+
+    @staticmethod
+    def of(agent: Agent) -> "_AgentRect":
+        rect = _AgentRect(agent.position, agent.size)
+        rect._agent = agent
+
+        return rect
+
+    def _write_back(self) -> None:
+        agent = getattr(self, "_agent", None)
+
+        if agent is None:
+            return
+
+        agent.move_to(self.topleft)
+
+        if agent.size != self.size:
+            agent.size = self.size
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        if name != "_agent":
+            self._write_back()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._write_back()
+
+
+def _writing_back(name: str) -> Callable[..., None]:
+    method = getattr(pygame.FRect, name)
+
+    def wrapper(self: _AgentRect, *args: Any, **kwargs: Any) -> None:
+        method(self, *args, **kwargs)
+        self._write_back()
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+
+    return wrapper
+
+
+for _name in ("move_ip", "inflate_ip", "scale_by_ip", "clamp_ip", "union_ip", "unionall_ip", "normalize", "update"):
+    if hasattr(pygame.FRect, _name):
+        setattr(_AgentRect, _name, _writing_back(_name))
+
+del _name
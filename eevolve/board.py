@@ -1,23 +1,51 @@
 import math
-from itertools import combinations, chain
-from typing import Any, Sequence, Callable
+from typing import Any, Sequence, Callable, Literal
+
+import numpy
 
 from eevolve.agent import Agent
+from eevolve.constants import COLLISION_UP, COLLISION_RIGHT, COLLISION_DOWN, COLLISION_LEFT, SHAPE_AABB, SHAPE_CIRCLE, \
+    SHAPE_CUSTOM
+from eevolve.collision import SweepAndPrune, CollisionShapes
+from eevolve.neighbours import CellList, VerletList
+from eevolve.store import AgentStore
+from eevolve.spatial import SpatialIndex, GridIndex, HashedGridIndex, QuadTreeIndex
+from eevolve.timeouts import CollisionTimeouts
 
 
 class Board:
     def __init__(self, sector_size: tuple[int | float, int | float] = (0, 0), sectors_number: int = -1,
-                 collision_timeout: Callable[[Agent | Any, Agent | Any], int] | int | float = None) -> None:
+                 collision_timeout: Callable[[Agent | Any, Agent | Any], int] | int | float = None,
+                 collision_backend: Literal["sectors", "sweep_and_prune"] = "sectors",
+                 spatial_index: SpatialIndex | Literal["grid", "hashed_grid", "quadtree"] = "grid",
+                 neighbour_list: VerletList | None = None, pair_cutoff: float | None = None) -> None:
+        """
+        :param neighbour_list: If given, sector pairs and around agent lists are agents whose centers are not
+        farther than `cutoff` of the list from each other, instead of agents of the same and surrounding sectors.
+        The candidates are cached by the list across frames, collision candidates are taken from it as well when
+        `cutoff` is not less than the largest agent diagonal.
+        :param pair_cutoff: If given and there is no neighbour list, sector pairs are all agents whose centers are not
+        farther than `pair_cutoff` from each other, across sector borders, see `cutoff_pairs`.
+        """
+        if pair_cutoff is not None and pair_cutoff <= 0:
+            raise ValueError(f"Pair cutoff must be positive. {pair_cutoff} given instead!")
+
         self._sector_width, self._sector_height = sector_size
         self._sectors_number = sectors_number
         self._display_size = (self._sector_width * self._sectors_number - 1,
                               self._sector_height * self._sectors_number - 1)
-        self._board: list[list[list[Agent]]] = [[[] for _ in range(sectors_number)] for _ in range(sectors_number)]
+        self._index = self._create_index(spatial_index)
         self._collided: list[tuple[Agent, Agent]] = []
-        self._collision_timer: dict[tuple[Agent, Agent], int] = {}
+        self._collision_timeouts = CollisionTimeouts()
         self._sector_pairs: list[tuple[Agent, Agent]] = []
         self._dead_agents: list[Agent] = []
         self._agents: dict[Agent, list[Any]] = {}
+        self._store = AgentStore()
+        self._neighbour_list = neighbour_list
+        self._neighbour_rows: tuple[numpy.ndarray, numpy.ndarray] | None = None
+        self._pair_cutoff = pair_cutoff
+        self._cutoff_rows: tuple[numpy.ndarray, numpy.ndarray] | None = None
+        self._shapes: numpy.ndarray | None = None
 
         if collision_timeout is None:
             self._collision_timeout = lambda x, y: 250
@@ -29,19 +57,41 @@ class Board:
             raise ValueError(f"`collision_timeout` must be function that takes [Agent, Agent] and return timeout "
                              f"or constant timeout value (int or float). {type(collision_timeout)} given instead!")
 
+        if collision_backend not in ("sectors", "sweep_and_prune"):
+            raise ValueError(f"`collision_backend` must be one of 'sectors', 'sweep_and_prune'. "
+                             f"{collision_backend} given instead!")
+
+        self._collision_backend = collision_backend
+
         self.__string = ""
 
+    def _create_index(self, spatial_index: SpatialIndex | str) -> SpatialIndex:
+        if isinstance(spatial_index, SpatialIndex):
+            return spatial_index
+        elif spatial_index == "grid":
+            return GridIndex((self._sector_width, self._sector_height), self._sectors_number)
+        elif spatial_index == "hashed_grid":
+            return HashedGridIndex((self._sector_width, self._sector_height))
+        elif spatial_index == "quadtree":
+            return QuadTreeIndex((0, 0, self._sector_width * self._sectors_number,
+                                  self._sector_height * self._sectors_number))
+        else:
+            raise ValueError(f"`spatial_index` must be `SpatialIndex` instance or one of 'grid', 'hashed_grid', "
+                             f"'quadtree'. {spatial_index} given instead!")
+
+    def _sector_of(self, position: Sequence[float | int]) -> tuple[int, int]:
+        return math.floor(position[0] / self._sector_width), math.floor(position[1] / self._sector_height)
+
     def add_agent(self, agent: Agent) -> None:
         if agent in self._agents:
             return
-        x, y = agent.position
-        x_i = math.floor(x / self._sector_width)
-        y_i = math.floor(y / self._sector_height)
-
-        agent.sector_index = (x_i, y_i)
+        self._store.attach(agent)
+        agent.sector_index = self._sector_of(agent.position)
 
-        self._board[x_i][y_i].append(agent)
+        self._index.insert(agent)
         self._agents[agent] = []
+        self._invalidate_pairs()
+        self._shapes = None
 
     def add_agents(self, agents: Sequence[Agent]) -> None:
         for agent in agents:
@@ -51,10 +101,12 @@ class Board:
         if agent not in self.agents:
             return
 
-        x_i, y_i = agent.sector_index
-
-        self._board[x_i][y_i].remove(agent)
+        self._index.remove(agent)
+        self._collision_timeouts.purge(agent)
+        self._store.detach(agent)
         self._agents.pop(agent, None)
+        self._invalidate_pairs()
+        self._shapes = None
 
     def move_agent(self, agent: Agent, delta_time: float) -> None:
         if agent not in self._agents:
@@ -62,59 +114,224 @@ class Board:
 
         agent.move(delta_time, (0, 0), self._display_size)
 
-        x0_i, y0_i = agent.sector_index
+        agent.sector_index = self._sector_of(agent.position)
+        self._index.move(agent)
+        self._invalidate_pairs()
 
-        x1, y1 = agent.position
+    def move_agents(self, delta_time: float) -> None:
+        """
+        Integrates all agents at once: advances positions by `velocity * delta_time`, clips them to the board bounds,
+        writes border collision bitmasks and sector indexes into the store and re-bins the spatial index.
+
+        :param delta_time: Time step in seconds.
+        :return: None
+        """
+        if len(self._store) == 0:
+            return
 
-        x1_i = math.floor(x1 / self._sector_width)
-        y1_i = math.floor(y1 / self._sector_height)
+        positions = self._store.positions
+        upper = numpy.subtract(self._display_size, self._store.sizes)
 
-        if (x0_i, y0_i) != (x1_i, y1_i):
-            self._board[x0_i][y0_i].remove(agent)
-            self._board[x1_i][y1_i].append(agent)
+        if (upper < 0).any():
+            raise ValueError(f"Upper bound minimum value is Agent size. {self._display_size} given instead!")
 
-            agent.sector_index = (x1_i, y1_i)
+        moved = positions + self._store.velocities * delta_time
+        collide = (moved < 0) | (moved > upper)
 
-    def move_agents(self, delta_time: float) -> None:
-        for agent in self._agents:
-            self.move_agent(agent, delta_time)
+        numpy.clip(moved, 0, upper, out=positions)
+
+        high = collide & (positions >= upper)
+        low = collide & ~high & (positions <= 0)
+
+        border = self._store.border
+        border[:] = high[:, 0] << COLLISION_RIGHT
+        border |= low[:, 0].astype(numpy.uint8) << COLLISION_LEFT
+        border |= high[:, 1].astype(numpy.uint8) << COLLISION_DOWN
+        border |= low[:, 1].astype(numpy.uint8) << COLLISION_UP
+        self._store.border_flags[:] = False
+
+        self._store.sectors[:] = numpy.floor(positions / (self._sector_width, self._sector_height))
+
+        self._index.move_many(self._store.agents, positions)
+        self._invalidate_pairs()
+
+    def _invalidate_pairs(self) -> None:
+        self._neighbour_rows = None
+        self._cutoff_rows = None
+
+    def cutoff_pairs(self, radius: float) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Finds pairs of agents whose centers are not farther than `radius` from each other, no matter which sectors
+        they are in. Agents are binned into cells with side `radius` and matched with a half stencil, see
+        `CellList.cutoff_pairs`.
+
+        Example:
+
+        first, second = board.cutoff_pairs(50.0)
+        deltas = board.store.positions[second] - board.store.positions[first]
+
+        :param radius: Maximum distance between centers of paired agents.
+        :return: Two arrays of `board.store` rows, every pair is reported once.
+        """
+        first, second, _ = CellList.cutoff_pairs(self._store.positions + self._store.sizes / 2, radius)
+
+        return first, second
+
+    def cutoff_pair_agents(self, radius: float) -> list[tuple[Agent | Any, Agent | Any]]:
+        """
+        Same as `cutoff_pairs`, but pairs of agents are returned as tuples.
+
+        :param radius: Maximum distance between centers of paired agents.
+        :return: List of agent pairs, every pair is reported once.
+        """
+        agents = self._store.agents
+        first, second = self.cutoff_pairs(radius)
+
+        return [(agents[i], agents[j]) for i, j in zip(first.tolist(), second.tolist())]
+
+    def _pair_rows(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        if self._neighbour_list is not None:
+            return self.neighbour_rows()
+
+        if self._cutoff_rows is None:
+            self._cutoff_rows = self.cutoff_pairs(self._pair_cutoff)
+
+        return self._cutoff_rows
+
+    def neighbour_rows(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Pairs of agents whose centers are not farther than `cutoff` of the neighbour list from each other, the list
+        is updated at most once per move of the agents.
+
+        :return: Two arrays of `board.store` rows, every pair is reported once.
+        """
+        if self._neighbour_list is None:
+            raise ValueError("Neighbour list is not set, pass `neighbour_list` to the `Board`!")
+
+        if self._neighbour_rows is None:
+            centers = self._store.positions + self._store.sizes / 2
+
+            self._neighbour_list.update(centers, self._store.uids)
+            self._neighbour_rows = self._neighbour_list.pairs(centers)
+
+        return self._neighbour_rows
 
     def check_collision(self) -> None:
+        """
+        Finds colliding agents. Candidate pairs come from the neighbour list if it covers the agents, from
+        `SweepAndPrune` with "sweep_and_prune" backend or when all agents have declared shapes, otherwise from
+        range queries of the spatial index. Candidates are tested in bulk according to the agents
+        `COLLISION_SHAPE`, only pairs with a custom shape call `is_collide`.
+
+        :return: None
+        """
         self._collided.clear()
 
         if len(self._agents) < 2:
             return
 
-        for agent in self._agents:
-            x0_i, y0_i = agent.sector_index
+        bounds = self._collision_bounds()
+
+        if self._neighbour_list is not None and \
+                numpy.sqrt((bounds[:, 2:] ** 2).sum(axis=1)).max() <= self._neighbour_list.cutoff:
+            first, second = self.neighbour_rows()
+        elif self._collision_backend == "sweep_and_prune" or not (self.collision_shapes() == SHAPE_CUSTOM).any():
+            first, second = SweepAndPrune.overlapping_pairs(bounds)
+        else:
+            first, second = self._sector_collision_candidates(bounds)
+
+        self._narrow_phase(first, second)
+
+    def _collision_bounds(self) -> numpy.ndarray:
+        positions, sizes = self._store.positions, self._store.sizes
+        bounds = numpy.hstack((positions, sizes))
+
+        radii = self._store.radii
+        circles = (self.collision_shapes() == SHAPE_CIRCLE) & ~numpy.isnan(radii)
+
+        # Custom agents test circles by their rectangles, so the bounds cover both the circle and the rectangle.
+        if circles.any():
+            centers = positions[circles] + sizes[circles] / 2
+            radius = radii[circles, None]
+
+            lower = numpy.minimum(positions[circles], centers - radius)
+            upper = numpy.maximum(positions[circles] + sizes[circles], centers + radius)
+
+            bounds[circles] = numpy.hstack((lower, upper - lower))
+
+        return bounds
+
+    def _sector_collision_candidates(self, bounds: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+        # The index holds agents by their positions, bounds of circles may start before or end after the rectangle.
+        offsets = bounds[:, :2] - self._store.positions
+        lower_offset = offsets.min(axis=0)
+        upper_offset = (offsets + bounds[:, 2:]).max(axis=0)
 
-            x, y = agent.position
-            width, height = agent.size
+        agents = self._store.agents
+        rows = []
 
-            indexes_to_check = [(x0_i, y0_i)]
+        for row, (x, y, width, height) in enumerate(bounds.tolist()):
+            agent = agents[row]
 
-            if x + width > x0_i * self._sector_width:
-                x0_i = min(x0_i + 1, self._sectors_number - 1)
-                indexes_to_check.append((x0_i, y0_i))
-            if y + height > y0_i * self._sector_height:
-                y0_i = min(y0_i + 1, self._sectors_number - 1)
-                indexes_to_check.append((x0_i, y0_i))
+            rows.extend((row, other.row) for other in self._index.query_range(
+                (x - upper_offset[0], y - upper_offset[1]),
+                (x + width - lower_offset[0], y + height - lower_offset[1])) if other is not agent)
 
-            for other in filter(lambda other_agent: other_agent is not agent,
-                                chain(*(self._board[i][j] for i, j in indexes_to_check))):
-                if agent.is_collide(other):
-                    if (self._collision_timer.get((agent, other), 0) == 0 or
-                            self._collision_timer.get((other, agent), 0) == 0):
-                        self._collided.append((agent, other))
+        rows = numpy.array(rows, dtype=numpy.intp).reshape(-1, 2)
+        number = len(self._store)
+        keys = numpy.unique(rows.min(axis=1) * number + rows.max(axis=1))
 
-                        timeout = self._collision_timeout(agent, other)
+        return keys // number, keys % number
 
-                        self._collision_timer[(agent, other)] = timeout
-                        self._collision_timer[(other, agent)] = timeout
+    def collision_shapes(self) -> numpy.ndarray:
+        """
+        :return: Array of `COLLISION_SHAPE` of all agents in `board.store` rows order, cached until agents are added
+        or removed.
+        """
+        if self._shapes is None:
+            shape_of = Agent.collision_shape_of
+            self._shapes = numpy.fromiter((shape_of(type(agent)) for agent in self._store.agents), dtype=numpy.int8,
+                                          count=len(self._store))
+
+        return self._shapes
+
+    def _narrow_phase(self, first: numpy.ndarray, second: numpy.ndarray) -> None:
+        agents = self._store.agents
+        shapes = self.collision_shapes()
+        boxes = numpy.hstack((self._store.positions, self._store.sizes))
+
+        if (shapes == SHAPE_AABB).all():
+            mask = SweepAndPrune.overlap_mask(boxes, first, second)
+
+            for i, j in zip(first[mask].tolist(), second[mask].tolist()):
+                self._register_collision(agents[i], agents[j])
+
+            return
+
+        mask = CollisionShapes.collide_mask(boxes, shapes, first, second, self._store.radii)
+        first, second = first[mask], second[mask]
+
+        custom_first = (shapes[first] == SHAPE_CUSTOM).tolist()
+        custom_second = (shapes[second] == SHAPE_CUSTOM).tolist()
+
+        for i, j, is_custom_first, is_custom_second in zip(first.tolist(), second.tolist(), custom_first,
+                                                           custom_second):
+            agent, other = agents[i], agents[j]
+
+            if is_custom_first and not agent.is_collide(other):
+                continue
+            if not is_custom_first and is_custom_second and not other.is_collide(agent):
+                continue
+
+            self._register_collision(agent, other)
+
+    def _register_collision(self, agent: Agent, other: Agent) -> None:
+        if not self._collision_timeouts.is_active(agent, other):
+            self._collided.append((agent, other))
+            self._collision_timeouts.activate(agent, other, self._collision_timeout(agent, other))
 
     def decrease_timeout(self, dt: int) -> None:
-        for pair in self._collision_timer:
-            self._collision_timer[pair] = max(self._collision_timer[pair] - dt, 0)
+        self._collision_timeouts.advance(dt)
 
     def check_sector_pairs(self) -> None:
         self._sector_pairs.clear()
@@ -122,55 +339,185 @@ class Board:
         if len(self._agents) < 2:
             return
 
-        for row in self._board:
-            for sector in row:
-                if len(sector) < 2:
-                    continue
+        if self._neighbour_list is not None or self._pair_cutoff is not None:
+            agents = self._store.agents
+            first, second = self._pair_rows()
+
+            self._sector_pairs.extend((agents[i], agents[j]) for i, j in zip(first.tolist(), second.tolist()))
+            return
 
-                for pair in combinations(sector, 2):
-                    self._sector_pairs.append(pair)
+        self._sector_pairs.extend(self._index.query_pairs())
+
+    def border_colliding(self) -> list[Agent | Any]:
+        agents = self._store.agents
+
+        return [agents[row] for row in numpy.flatnonzero(self._store.border | self._store.border_flags).tolist()]
 
     def check_dead(self) -> None:
         self._dead_agents.clear()
 
-        for agent in self._agents:
-            if agent.is_dead:
-                self._dead_agents.append(agent)
+        agents = self._store.agents
+
+        for row in numpy.flatnonzero(self._store.dead).tolist():
+            self._dead_agents.append(agents[row])
 
     def scan_around_agents(self, radius: int = 0, hold_previous: bool = False) -> None:
+        """
+        Collects agents of the surrounding sectors of every agent into `agents[agent]`.
+
+        With `radius` greater than 0 the window is sectors from `x - radius` to `x + radius - 1` along both axes,
+        with 0 it is the agent's own sector.
+
+        :param radius: Number of surrounding sectors to include, 0 means only the agent's own sector. Ignored when
+        the neighbour list is set, neighbours are the agents within its `cutoff` then.
+        :param hold_previous: If True, previously collected agents are kept.
+        :return: None
+        """
         if radius < 0:
             raise ValueError(f"Radius must be a non-negative integer. {radius} given instead!")
 
+        if self._neighbour_list is not None:
+            self._scan_around_neighbours(hold_previous)
+            return
+
+        reach = max(radius, 1)
+
         for agent, other in self._agents.items():
             x_i, y_i = agent.sector_index
 
             if not hold_previous:
                 other.clear()
 
-            if radius:
-                x_min = max(x_i - radius, 0)
-                x_max = min(x_i + radius, self._sectors_number)
-                y_min = max(y_i - radius, 0)
-                y_max = min(y_i + radius, self._sectors_number)
-
-                other.extend(chain(*[self._board[i][j]
-                                    for i in range(x_min, x_max)
-                                    for j in range(y_min, y_max)]))
-            else:
-                other.extend(self._board[x_i][y_i])
+            other.extend(self._index.query_range(
+                ((x_i - radius) * self._sector_width, (y_i - radius) * self._sector_height),
+                ((x_i + reach) * self._sector_width, (y_i + reach) * self._sector_height)))
 
             if agent in other:
                 other.remove(agent)
 
+    def _scan_around_neighbours(self, hold_previous: bool) -> None:
+        agents = self._store.agents
+        offsets, neighbours = self._neighbour_csr()
+        offsets, neighbours = offsets.tolist(), neighbours.tolist()
+
+        for row, agent in enumerate(agents):
+            other = self._agents[agent]
+
+            if not hold_previous:
+                other.clear()
+
+            other.extend(agents[i] for i in neighbours[offsets[row]:offsets[row + 1]])
+
+    def _neighbour_csr(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        first, second = self.neighbour_rows()
+
+        first, second = numpy.concatenate((first, second)), numpy.concatenate((second, first))
+        order = numpy.argsort(first, kind="stable")
+
+        return CellList.to_csr(first[order], second[order], len(self._store))
+
+    def around_agents(self, radius: int = 0) -> tuple[numpy.ndarray, tuple[numpy.ndarray, numpy.ndarray]]:
+        """
+        Batched counterpart of `scan_around_agents`, finds agents of the surrounding `radius` sectors for all agents
+        at once, the window of sectors is the same.
+
+        :param radius: Number of surrounding sectors to include, 0 means only the agent's own sector. Ignored when
+        the neighbour list is set, neighbours are the agents within its `cutoff` then.
+        :return: Array of `board.store` rows and neighbours packed as compressed sparse rows `(offsets, neighbours)`.
+        """
+        if self._neighbour_list is not None:
+            return numpy.arange(len(self._store)), self._neighbour_csr()
+
+        number = len(self._store)
+        first, second = CellList.window_pairs(self._store.sectors, -radius, max(radius, 1) - 1)
+
+        return numpy.arange(number), CellList.to_csr(first, second, number)
+
+    def sector_pair_rows(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Batched counterpart of `check_sector_pairs`.
+
+        :return: Two arrays of `board.store` rows, every pair of agents sharing a cell is reported once.
+        """
+        if self._neighbour_list is not None or self._pair_cutoff is not None:
+            return self._pair_rows()
+
+        if isinstance(self._index, HashedGridIndex) and self._index.cell_size == self.sector_size:
+            first, second = CellList.cell_pairs(self._store.sectors, 0)
+            mask = first < second
+
+            return first[mask], second[mask]
+
+        return Board._rows_of(self._index.query_pairs())
+
+    def collided_rows(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        return Board._rows_of(self._collided)
+
+    @staticmethod
+    def _rows_of(pairs: Sequence[tuple[Agent, Agent]]) -> tuple[numpy.ndarray, numpy.ndarray]:
+        rows = numpy.array([(agent.row, other.row) for agent, other in pairs], dtype=numpy.intp).reshape(-1, 2)
+
+        return rows[:, 0], rows[:, 1]
+
+    def nearest_neighbours(self, k: int, radius: float, sentinel: int = -1) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Finds up to `k` nearest neighbours within `radius` for all agents at once. Rows and neighbour indexes
+        are `board.store` rows, distances are measured between agents centers, the same as in `cutoff_pairs`.
+
+        Example:
+
+        indexes, distances = board.nearest_neighbours(16, 200.0)
+        observation = board.gather("color_code", indexes)       # (N, 16)
+
+        :param k: Number of neighbours to find for every agent.
+        :param radius: Maximum distance to a neighbour.
+        :param sentinel: Index used to pad rows of agents which have less than `k` neighbours.
+        :return: Array of shape (N, k) with neighbour indexes sorted by distance and array of shape (N, k)
+        with distances to them, padded with `sentinel` and `inf` respectively.
+        """
+        return CellList.nearest(self._store.positions + self._store.sizes / 2, k, radius, sentinel)
+
+    def gather(self, values: str | Callable[[Agent | Any], Any] | numpy.ndarray, indexes: numpy.ndarray,
+               fill: Any = 0.0, sentinel: int = -1) -> numpy.ndarray:
+        """
+        Turns per-agent values into a feature tensor shaped like `indexes`.
+
+        :param values: Agent attribute name, function which takes an agent and returns its value or array
+        with values of all agents in `board.store` rows order.
+        :param indexes: Integer array of agents indexes, as returned by `nearest_neighbours`.
+        :param fill: Value placed where `indexes` hold `sentinel`, the result has a dtype which can hold both values
+        and `fill`.
+        :param sentinel: Index which marks missing neighbours.
+        :return: Array of shape `(*indexes.shape, *value_shape)`.
+        """
+        if isinstance(values, str):
+            values = numpy.array([getattr(agent, values) for agent in self._store.agents])
+        elif callable(values):
+            values = numpy.array([values(agent) for agent in self._store.agents])
+        else:
+            values = numpy.asarray(values)
+
+        indexes = numpy.asarray(indexes)
+        missing = indexes == sentinel
+
+        if len(values) == 0:
+            return numpy.full((*indexes.shape, *values.shape[1:]), fill)
+
+        # Strings are dtype names for `result_type`, a string fill is passed as an array.
+        dtype = numpy.result_type(values, numpy.asarray(fill) if isinstance(fill, (str, bytes)) else fill)
+        result = values[numpy.where(missing, 0, indexes)].astype(dtype, copy=False)
+        result[missing] = fill
+
+        return result
+
     def __str__(self) -> str:
         self.__string = ""
         self.__string += "-" * 128 + "\n"
         self.__string += " " * 57 + "<Board>\n"
 
-        for i in range(self._sectors_number):
+        for key, _, agents in self._index.cells():
             self.__string += "-" * 128 + "\n"
-            for j in range(self._sectors_number):
-                self.__string += f"[{i}, {j}]: {', '.join([str(agent) for agent in self._board[i][j]])}\n"
+            self.__string += f"{list(key)}: {', '.join([str(agent) for agent in agents])}\n"
 
         self.__string += "-" * 128 + "\n"
         return self.__string
@@ -183,6 +530,14 @@ class Board:
     def sector_size(self) -> tuple[int, int]:
         return self._sector_width, self._sector_height
 
+    @property
+    def collision_backend(self) -> str:
+        return self._collision_backend
+
+    @property
+    def collision_timeouts(self) -> CollisionTimeouts:
+        return self._collision_timeouts
+
     @property
     def collided(self) -> list[tuple[Agent | Any, Agent | Any]]:
         return self._collided
@@ -193,7 +548,37 @@ class Board:
 
     @property
     def agents_board(self) -> list[list[list[Agent | Any]]]:
-        return self._board
+        """
+        `sectors_number x sectors_number` grid of agent lists. With the default grid index it is the index itself,
+        with other indexes a new grid is built from the agent sectors on every access, changing it does not move
+        the agents.
+        """
+        if isinstance(self._index, GridIndex):
+            return self._index.grid
+
+        grid = [[[] for _ in range(self._sectors_number)] for _ in range(self._sectors_number)]
+        sectors = numpy.clip(self._store.sectors, 0, self._sectors_number - 1).tolist()
+
+        for agent, (x_i, y_i) in zip(self._store.agents, sectors):
+            grid[x_i][y_i].append(agent)
+
+        return grid
+
+    @property
+    def index(self) -> SpatialIndex:
+        return self._index
+
+    @property
+    def pair_cutoff(self) -> float | None:
+        return self._pair_cutoff
+
+    @property
+    def neighbour_list(self) -> VerletList | None:
+        return self._neighbour_list
+
+    @property
+    def store(self) -> AgentStore:
+        return self._store
 
     @property
     def agents(self) -> dict[Agent | Any, list[Any]]:
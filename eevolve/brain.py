@@ -4,6 +4,9 @@ from typing import Sequence, Any, Callable
 import numpy
 
 from eevolve.layers import Layer
+from eevolve.numbers import NumbersGenerator
+
+GenomeLayout = tuple[list[tuple[tuple[slice, tuple[int, ...]], ...]], numpy.ndarray, numpy.ndarray]
 
 
 class Brain:
@@ -14,11 +17,15 @@ class Brain:
 
         self._layers: list[Layer] = []
 
+        self._genome: numpy.ndarray | None = None
+        self._layout: GenomeLayout | None = None
+
     def add_layer(self, layer: Layer) -> None:
         if not isinstance(layer, Layer):
             raise ValueError(f"`layer` must be `Layer` type or it subclass. {type(layer)} given instead!")
 
         self._layers.append(layer)
+        self._genome, self._layout = None, None
 
     def add_layers(self, layers: list[Layer]) -> None:
         for layer in layers:
@@ -49,7 +56,78 @@ class Brain:
         else:
             raise ValueError(f"Mapping format is not supported `{type(self._mapping)}`")
 
+    def flatten(self, genome: numpy.ndarray | None = None) -> numpy.ndarray:
+        """
+        Packs weights and biases of all layers into one contiguous genome, layers are rebound to reshaped views of it.
+
+        Once flattened, `mutate`, `combine`, `new_like_me` and deep copying work on the whole genome with single
+        NumPy operations: weights are mutated with their layer `mutation_scaler`, `combine` picks every gene from
+        either parent independently and `new_like_me` draws weights, and biases of layers which use them,
+        uniformly. Assigning a new array to layer `weights` or `biases` detaches it from the genome,
+        call `flatten` again afterwards.
+
+        Example:
+
+        brain.flatten()
+        child = brain.combine(another)    # `another` must be flattened too, otherwise layers are combined one by one
+
+        :param genome: One-dimensional buffer of `genome_size` length to pack into, a new one is allocated if None.
+        :return: Genome of the brain.
+        """
+        layout = self._genome_layout()
+        size = len(layout[1])
+
+        if genome is None:
+            genome = numpy.empty((size,), dtype=float)
+        elif genome.shape != (size,):
+            raise ValueError(f"Genome shape must be ({size},). {genome.shape} given instead!")
+
+        for layer, ((weights_slice, _), (biases_slice, _)) in zip(self._layers, layout[0]):
+            genome[weights_slice] = numpy.ravel(layer.weights)
+            genome[biases_slice] = numpy.ravel(layer.biases)
+
+        self._bind_genome(genome, layout)
+
+        return genome
+
+    def copy_from(self, another: "Brain") -> bool:
+        """
+        Copies mapping and parameters of a brain with the same structure into buffers of this brain.
+
+        :param another: Brain to copy from.
+        :return: False if structures differ and nothing was copied.
+        """
+        if len(self._layers) != len(another.layers):
+            return False
+
+        if self._same_layout(another):
+            self._genome[...] = another.genome
+        else:
+            for layer_1, layer_2 in zip(self._layers, another.layers):
+                if (type(layer_1) is not type(layer_2)
+                        or numpy.shape(layer_1.weights) != numpy.shape(layer_2.weights)
+                        or numpy.shape(layer_1.biases) != numpy.shape(layer_2.biases)):
+                    return False
+
+            for layer_1, layer_2 in zip(self._layers, another.layers):
+                layer_1.weights[...] = layer_2.weights
+                layer_1.biases[...] = layer_2.biases
+
+        self._mapping = another.mapping
+
+        return True
+
+    def genome_hash(self) -> int:
+        return hash(self._flat_genome().tobytes())
+
+    def same_genome(self, another: "Brain") -> bool:
+        return numpy.array_equal(self._flat_genome(), another._flat_genome())
+
     def mutate(self) -> None:
+        if self._genome is not None:
+            self._genome += NumbersGenerator.normal(self._genome.shape) * self._layout[1]
+            return
+
         for layer in self._layers:
             layer.mutate()
 
@@ -58,6 +136,11 @@ class Brain:
             raise ValueError(f"Lengths of the layers must match for both objects. "
                              f"{len(self._layers)} vs {len(another.layers)} instead!")
 
+        if self._same_layout(another):
+            mask = NumbersGenerator.uniform(self._genome.shape) < 0.5
+
+            return self._from_genome(numpy.where(mask, self._genome, another.genome))
+
         new_brain = type(self)(self._mapping)
 
         for layer_1, layer_2 in zip(self._layers, another.layers):
@@ -66,6 +149,9 @@ class Brain:
         return new_brain
 
     def new_like_me(self) -> "Brain":
+        if self._genome is not None:
+            return self._from_genome(NumbersGenerator.weights(self._genome.shape) * self._layout[2])
+
         new_brain = type(self)(self._mapping)
 
         for layer in self._layers:
@@ -85,6 +171,81 @@ class Brain:
     def layers(self) -> list[Layer]:
         return self._layers
 
+    @property
+    def mapping(self) -> Sequence[Any] | dict[float | int, Any] | Callable:
+        return self._mapping
+
+    @property
+    def genome(self) -> numpy.ndarray | None:
+        return self._genome
+
+    @property
+    def genome_size(self) -> int:
+        return sum(numpy.size(layer.weights) + numpy.size(layer.biases) for layer in self._layers)
+
+    @property
+    def mutation_scalers(self) -> numpy.ndarray:
+        return self._genome_layout()[1]
+
+    @property
+    def genome_layout(self) -> list[tuple[tuple[slice, tuple[int, ...]], ...]]:
+        return self._genome_layout()[0]
+
+    def _genome_layout(self) -> GenomeLayout:
+        if self._layout is not None:
+            return self._layout
+
+        segments, scalers, fresh = [], [], []
+        offset = 0
+
+        for layer in self._layers:
+            weights_shape, biases_shape = numpy.shape(layer.weights), numpy.shape(layer.biases)
+            weights_size, biases_size = int(numpy.prod(weights_shape)), int(numpy.prod(biases_shape))
+
+            weights_slice = slice(offset, offset + weights_size)
+            biases_slice = slice(offset + weights_size, offset + weights_size + biases_size)
+            offset += weights_size + biases_size
+
+            segments.append(((weights_slice, weights_shape), (biases_slice, biases_shape)))
+
+            scalers.append(numpy.full((weights_size,), layer.mutation_scaler))
+            scalers.append(numpy.zeros((biases_size,)))
+
+            fresh.append(numpy.ones((weights_size,)))
+            fresh.append(numpy.full((biases_size,), 1.0 if layer.use_bias else 0.0))
+
+        self._layout = segments, numpy.concatenate(scalers + [numpy.empty((0,))]), \
+            numpy.concatenate(fresh + [numpy.empty((0,))])
+
+        return self._layout
+
+    def _bind_genome(self, genome: numpy.ndarray, layout: GenomeLayout) -> None:
+        for layer, ((weights_slice, weights_shape), (biases_slice, biases_shape)) in zip(self._layers, layout[0]):
+            layer.weights = genome[weights_slice].reshape(weights_shape)
+            layer.biases = genome[biases_slice].reshape(biases_shape)
+
+        self._genome, self._layout = genome, layout
+
+    def _from_genome(self, genome: numpy.ndarray) -> "Brain":
+        new_brain = type(self)(self._mapping)
+        new_brain._layers = [layer.shallow_clone() for layer in self._layers]
+        new_brain._bind_genome(genome, self._layout)
+
+        return new_brain
+
+    def _same_layout(self, another: "Brain") -> bool:
+        if self._genome is None or another.genome is None or self._genome.shape != another.genome.shape:
+            return False
+
+        return all(type(layer_1) is type(layer_2) and layer_1.shape == layer_2.shape
+                   for layer_1, layer_2 in zip(self._layers, another.layers))
+
+    def _flat_genome(self) -> numpy.ndarray:
+        if self._genome is None:
+            raise ValueError("Brain genome is not flattened, call `flatten` first!")
+
+        return self._genome
+
     def __call__(self, observation: Sequence[Any] | numpy.ndarray | Any, owner: Any = None,
                  output_function: Callable[[numpy.ndarray], Any] = lambda x: x, *args, **kwargs) -> Any:
         self.forward(observation, owner, output_function, *args, **kwargs)
@@ -98,9 +259,164 @@ class Brain:
         return new_brain
 
     def __deepcopy__(self, memodict: dict) -> "Brain":
+        if self._genome is not None:
+            return self._from_genome(self._genome.copy())
+
         new_brain = type(self)(self._mapping)
 
         for layer in self._layers:
             new_brain.add_layer(copy.deepcopy(layer))
 
         return new_brain
+
+
+class PopulationBrain:
+    """
+    Evaluates a population of structurally identical brains at once.
+
+    Genomes of all brains are packed into one matrix of shape (P, G), every brain is flattened into its row
+    with `Brain.flatten`, weights and biases of every layer are views of shape (P, *weights.shape) into the matrix.
+    Every brain stays usable on its own, in-place changes like `Brain.mutate` are visible for the population and
+    vice versa, while assigning a new array to a layer detaches it until `update` is called. Observations of all
+    brains are evaluated with one batched `matmul` per layer, activations of the first brain layers are used for
+    the whole population. The whole population is mutated at once with `mutate`.
+
+    Example:
+
+    population = PopulationBrain([agent.brain for agent in agents])
+    decisions = population(observations)    # observations shape is (len(agents), input_size)
+    """
+
+    def __init__(self, brains: Sequence[Brain]) -> None:
+        self._brains: list[Brain] = []
+        self._genomes = numpy.empty((0, 0), dtype=float)
+        self._scalers = numpy.empty((0,), dtype=float)
+        self._weights: list[numpy.ndarray] = []
+        self._biases: list[numpy.ndarray] = []
+        self._output = None
+
+        self.update(brains)
+
+    def update(self, brains: Sequence[Brain] = None) -> None:
+        """
+        Restacks parameters of the population, after brains were added, removed or their layer arrays replaced.
+
+        :param brains: New population, current population is restacked if None.
+        :return: None
+        """
+        brains = list(self._brains if brains is None else brains)
+
+        if len(brains) > 0:
+            template = brains[0]
+
+            for brain in brains[1:]:
+                PopulationBrain._check_compatible(template, brain)
+
+        self._brains = brains
+        self._weights.clear()
+        self._biases.clear()
+
+        if len(brains) == 0:
+            self._genomes = numpy.empty((0, 0), dtype=float)
+            self._scalers = numpy.empty((0,), dtype=float)
+            return
+
+        self._genomes = numpy.empty((len(brains), brains[0].genome_size), dtype=float)
+
+        for member, brain in enumerate(brains):
+            brain.flatten(self._genomes[member])
+
+        self._scalers = brains[0].mutation_scalers
+
+        for (weights_slice, weights_shape), (biases_slice, biases_shape) in brains[0].genome_layout:
+            self._weights.append(self._genomes[:, weights_slice].reshape((len(brains), *weights_shape)))
+            self._biases.append(self._genomes[:, biases_slice].reshape((len(brains), *biases_shape)))
+
+    def mutate(self) -> None:
+        """
+        Mutates genomes of the whole population with one operation, same as calling `Brain.mutate` for every brain.
+
+        :return: None
+        """
+        self._genomes += NumbersGenerator.normal(self._genomes.shape) * self._scalers
+
+    def add_brains(self, brains: Sequence[Brain]) -> None:
+        self.update(self._brains + list(brains))
+
+    def remove_brains(self, brains: Sequence[Brain]) -> None:
+        to_remove = set(map(id, brains))
+
+        self.update([brain for brain in self._brains if id(brain) not in to_remove])
+
+    def forward(self, observations: Sequence[Any] | numpy.ndarray) -> None:
+        if len(self._brains) == 0:
+            raise ValueError("Population is empty!")
+
+        observations = numpy.array(observations, dtype=float)
+
+        if len(observations) != len(self._brains):
+            raise ValueError(f"Number of observations must match population size. "
+                             f"{len(observations)} vs {len(self._brains)} given instead!")
+
+        if len(observations.shape) == 2:
+            observations = numpy.expand_dims(observations, axis=1)
+
+        self._output = observations
+
+        for layer, weights, biases in zip(self._brains[0].layers, self._weights, self._biases):
+            self._output = layer.batch_call(self._output, weights, biases)
+
+    def decide(self) -> Any:
+        mapping = self._brains[0].mapping if len(self._brains) > 0 else None
+
+        if mapping is None:
+            return None
+
+        if isinstance(mapping, numpy.ndarray):
+            return mapping[numpy.asarray(self._output, dtype=int)]
+        elif isinstance(mapping, (list, tuple)):
+            return [mapping[int(output)] for output in self._output]
+        elif isinstance(mapping, dict):
+            return [mapping.get(output) for output in self._output]
+        elif callable(mapping):
+            return [mapping(output) for output in self._output]
+        else:
+            raise ValueError(f"Mapping format is not supported `{type(mapping)}`")
+
+    @staticmethod
+    def _check_compatible(template: Brain, brain: Brain) -> None:
+        if len(template.layers) != len(brain.layers):
+            raise ValueError(f"Lengths of the layers must match for all brains. "
+                             f"{len(template.layers)} vs {len(brain.layers)} instead!")
+
+        for layer_1, layer_2 in zip(template.layers, brain.layers):
+            if type(layer_1) is not type(layer_2) or layer_1.shape != layer_2.shape:
+                raise ValueError(f"Layers must be identical for all brains. {layer_1} vs {layer_2} given instead!")
+
+    @property
+    def brains(self) -> list[Brain]:
+        return self._brains
+
+    @property
+    def genomes(self) -> numpy.ndarray:
+        return self._genomes
+
+    @property
+    def weights(self) -> list[numpy.ndarray]:
+        return self._weights
+
+    @property
+    def biases(self) -> list[numpy.ndarray]:
+        return self._biases
+
+    @property
+    def output(self) -> Any:
+        return self._output
+
+    def __call__(self, observations: Sequence[Any] | numpy.ndarray) -> Any:
+        self.forward(observations)
+
+        return self.decide()
+
+    def __len__(self) -> int:
+        return len(self._brains)
@@ -5,12 +5,27 @@ RED_COLOR = (212, 89, 80)
 DEFAULT_FONT = "Arial"
 DEFAULT_FONT_SCALE_FACTOR = 75
 DEFAULT_FONT_COLOR = (0, 0, 0)
+STATS_LINES_NUMBER = 8
+DEFAULT_FAST_FORWARD_FPS = 60
 
 # Tasks
 
 HIGHEST_TASK_PRIORITY = 0
 LOWEST_TASK_PRIORITY = 15
 
+# Cloning Policies
+
+CLONE_SHARE = "share"
+CLONE_COPY = "copy"
+CLONE_REGENERATE = "regenerate"
+CLONE_RESET = "reset"
+
+# Collision Shapes
+
+SHAPE_AABB = 0
+SHAPE_CIRCLE = 1
+SHAPE_CUSTOM = 2
+
 # Collision Directions
 
 COLLISION_UP = 0
@@ -1,5 +1,6 @@
 import math
 import sys
+import time
 from typing import Sequence, Callable, Any, Literal
 
 import numpy
@@ -7,14 +8,21 @@ import pygame
 
 from eevolve.agent import Agent
 from eevolve.board import Board
-from eevolve.generator import PositionGenerator, ColorGenerator
-from eevolve.task import Task, FrameEndTask, CollisionTask, AgentTask, PairTask, BorderCollisionTask, AroundAgentTask
+from eevolve.spatial import SpatialIndex
+from eevolve.neighbours import VerletList
+from eevolve.generator import PositionGenerator
+from eevolve.task import Task, FrameEndTask, CollisionTask, AgentTask, PairTask, BorderCollisionTask, AroundAgentTask, \
+    BatchAgentTask, BatchAroundAgentTask, BatchPairTask, BatchCollisionTask, NBodyTask
+from eevolve.nbody import BarnesHut
 from eevolve.loader import Loader
+from eevolve.render import Renderer
+from eevolve.pool import AgentPool
+from eevolve.scheduler import TaskScheduler
+from eevolve.stats import TimingStats
+from eevolve.numbers import NumbersGenerator
 from eevolve.constants import TOP_LEFT, LOWEST_TASK_PRIORITY, HIGHEST_TASK_PRIORITY, DEFAULT_FONT, \
-    DEFAULT_FONT_SCALE_FACTOR, DEFAULT_FONT_COLOR, RED_COLOR
-
-pygame.init()
-pygame.font.init()
+    DEFAULT_FONT_SCALE_FACTOR, DEFAULT_FONT_COLOR, RED_COLOR, STATS_LINES_NUMBER, \
+    DEFAULT_FAST_FORWARD_FPS
 
 
 class Game:
@@ -30,11 +38,55 @@ class Game:
                  draw_velocities: bool = False,
                  fps_limit: int = 60,
                  collision_timeout: Callable[[Agent | Any, Agent | Any], int] | int | float = None,
-                 board_checks: Sequence[Literal["collision", "sector_pair", "around_agent"]] = ("collision", "sector_pair", "around_agent")):
-        self._task_priorities = LOWEST_TASK_PRIORITY - HIGHEST_TASK_PRIORITY + 1
-
-        self._display = pygame.Surface(display_size)
-        self._screen = pygame.display.set_mode(screen_size)
+                 board_checks: Sequence[Literal["collision", "sector_pair", "around_agent"]] = ("collision", "sector_pair", "around_agent"),
+                 collision_backend: Literal["sectors", "sweep_and_prune"] = "sectors",
+                 spatial_index: SpatialIndex | Literal["grid", "hashed_grid", "quadtree"] = "grid",
+                 headless: bool = False,
+                 seed: int | None = None,
+                 collect_stats: bool = True,
+                 draw_stats: bool = False,
+                 agent_pool: AgentPool | None = None,
+                 neighbour_list: VerletList | None = None,
+                 pair_cutoff: float | None = None,
+                 fast_forward: bool = False,
+                 steps_per_frame: int = 1,
+                 step_budget_ms: int | float | None = None,
+                 fast_forward_delta_time_ms: int | float | None = None):
+        """
+        :param headless: If True, no window, display surfaces or font are created and nothing is drawn, events
+        are not polled and the frame rate is not limited, so the simulation runs as fast as CPU allows. Use `stop`
+        to finish `run` in this mode.
+        :param seed: If given, seeds `NumbersGenerator` before anything is generated, see `NumbersGenerator.seed`.
+        :param collect_stats: If True, wall time of board phases, tasks, drawing and frames is recorded into `stats`.
+        :param draw_stats: If True, the slowest sections of `stats` are drawn instead of time and fps info,
+        can be toggled with `T` key.
+        :param agent_pool: If given, dead agents are released into the pool and reused for clones and children of
+        the board agents, see `AgentPool`.
+        :param neighbour_list: If given, pair, around agent and collision tasks get the neighbours from the cached
+        list, see `Board` and `VerletList`.
+        :param pair_cutoff: If given, pair tasks get all pairs of agents whose centers are not farther than
+        `pair_cutoff` from each other instead of pairs of agents sharing a sector, see `Board.cutoff_pairs`.
+        :param fast_forward: If True, `run` performs several fixed simulation steps between rendered frames instead
+        of one step per frame, can be toggled with `F` key.
+        :param steps_per_frame: Number of steps per rendered frame in fast-forward mode, `]` and `[` keys double and
+        halve it.
+        :param step_budget_ms: If given, fast-forward mode performs as many steps as fit into this wall time per
+        frame, at least one, instead of `steps_per_frame`. `]` and `[` keys double and halve the budget.
+        :param fast_forward_delta_time_ms: Simulated timestep of fast-forward steps in milliseconds, defaults to
+        `1000 / fps_limit`, or to `1000 / 60` if FPS is not limited.
+        """
+        if seed is not None:
+            NumbersGenerator.seed(seed)
+
+        self._headless = headless
+        self._seed = seed
+
+        if not headless:
+            pygame.init()
+            pygame.font.init()
+
+        self._display = pygame.Surface(display_size) if not headless else None
+        self._screen = pygame.display.set_mode(screen_size) if not headless else None
         self._clock = pygame.Clock()
 
         self._display_size = display_size
@@ -43,26 +95,63 @@ class Game:
         self._board_checks = board_checks
 
         self._agents_list = []
-        self._tasks: list[list[Task]] = [[] for _ in range(self._task_priorities)]
+        self._stats = TimingStats(enabled=collect_stats)
+        self._scheduler = TaskScheduler(self._stats)
+        self._dispatchers: dict[type, Callable[[Task], None]] = {
+            CollisionTask: self._dispatch_collision,
+            AgentTask: self._dispatch_agent,
+            PairTask: self._dispatch_pair,
+            BorderCollisionTask: self._dispatch_border_collision,
+            AroundAgentTask: self._dispatch_around_agent,
+            BatchCollisionTask: self._dispatch_batch_collision,
+            BatchAgentTask: self._dispatch_batch_agent,
+            BatchPairTask: self._dispatch_batch_pair,
+            BatchAroundAgentTask: self._dispatch_batch_around_agent,
+            NBodyTask: self._dispatch_n_body,
+        }
 
         self._delta_time_ms = 0
         self._delta_time = 0.0
         self._time = 0.0
+        self._fixed_delta_time_ms = None
+        self._internal_tasks_initialized = False
+
+        if steps_per_frame < 1:
+            raise ValueError(f"Steps per frame must be positive. {steps_per_frame} given instead!")
+        if step_budget_ms is not None and step_budget_ms <= 0:
+            raise ValueError(f"Step budget must be positive. {step_budget_ms} given instead!")
+        if fast_forward_delta_time_ms is not None and fast_forward_delta_time_ms < 0:
+            raise ValueError(f"Timestep must be non-negative. {fast_forward_delta_time_ms} given instead!")
+
+        self._fast_forward = fast_forward
+        self._steps_per_frame = steps_per_frame
+        self._step_budget_ms = step_budget_ms
+        self._fast_forward_delta_time_ms = fast_forward_delta_time_ms \
+            if fast_forward_delta_time_ms is not None \
+            else 1000 / (fps_limit if fps_limit > 0 else DEFAULT_FAST_FORWARD_FPS)
+        self._frame_steps = 1
 
         self._background = Loader.load_surface(display_background, display_size)
         self._board = Board(
             (math.ceil(self.display_size[0] / board_sectors_number),
              math.ceil(self.display_size[1] / board_sectors_number)),
-            board_sectors_number, collision_timeout)
+            board_sectors_number, collision_timeout, collision_backend, spatial_index, neighbour_list,
+            pair_cutoff)
         self._sectors_number = board_sectors_number
-        self._sector_rects = []
-        self._sector_colors = []
+        self._agent_pool = agent_pool
+        self._board.store.pool = agent_pool
+        self._sector_colors = {}
+        self._sector_overlay: pygame.Surface | None = None
+        self._sector_overlay_cells: list[tuple[Any, tuple[float, float, float, float]]] = []
 
         self._to_draw_sectors = draw_sectors
         self._to_draw_info = draw_info
+        self._to_draw_stats = draw_stats
         self._to_draw_velocities = draw_velocities
 
-        self._font = pygame.font.SysFont(DEFAULT_FONT, screen_size[0] // DEFAULT_FONT_SCALE_FACTOR)
+        self._font = pygame.font.SysFont(DEFAULT_FONT, screen_size[0] // DEFAULT_FONT_SCALE_FACTOR) \
+            if not headless \
+            else None
         self._timer_position = (screen_size[0] // DEFAULT_FONT_SCALE_FACTOR, screen_size[1] // DEFAULT_FONT_SCALE_FACTOR)
         self._fps_position = (screen_size[0] // DEFAULT_FONT_SCALE_FACTOR, screen_size[1] // DEFAULT_FONT_SCALE_FACTOR * 3)
 
@@ -76,17 +165,22 @@ class Game:
             self._board.add_agent(agent)
 
     def _init_internal_tasks(self) -> None:
-        self.add_task(FrameEndTask(self._timer, priority=HIGHEST_TASK_PRIORITY))
+        if self._internal_tasks_initialized:
+            return
+
         self.add_task(FrameEndTask(self._board_task_handler, priority=HIGHEST_TASK_PRIORITY))
         self.add_task(FrameEndTask(self._check_dead, priority=LOWEST_TASK_PRIORITY))
         self.add_task(FrameEndTask(self._agents_reproduce, priority=LOWEST_TASK_PRIORITY))
-        self.add_task(FrameEndTask(self._draw, priority=LOWEST_TASK_PRIORITY))
-        self.add_task(FrameEndTask(self._update_display, priority=LOWEST_TASK_PRIORITY))
+
+        self._internal_tasks_initialized = True
 
     def _draw(self) -> None:
         self._display.blit(self._background, TOP_LEFT)
 
-        for agent in self._board.agents:
+        sequence, custom = Renderer.agent_blits(self._board.store.agents, self._board.store.positions, Agent.draw)
+        self._display.fblits(sequence)
+
+        for agent in custom:
             agent.draw(self._display)
 
         if self._to_draw_sectors:
@@ -95,79 +189,157 @@ class Game:
             self._draw_velocities()
 
     def _board_task_handler(self) -> None:
+        start = time.perf_counter()
         self._board.decrease_timeout(self._delta_time_ms)
         self._board.move_agents(self._delta_time)
 
+        checkpoint = time.perf_counter()
+        self._stats.record("board.move", checkpoint - start)
+
         if "collision" in self._board_checks:
             self._board.check_collision()
+
+            start, checkpoint = checkpoint, time.perf_counter()
+            self._stats.record("board.collision", checkpoint - start)
         if "sector_pair" in self._board_checks:
             self._board.check_sector_pairs()
+
+            start, checkpoint = checkpoint, time.perf_counter()
+            self._stats.record("board.sector_pair", checkpoint - start)
         if "around_agent" in self._board_checks:
             self._board.scan_around_agents()
 
+            start, checkpoint = checkpoint, time.perf_counter()
+            self._stats.record("board.around_agent", checkpoint - start)
+
     def _do_tasks(self) -> None:
-        to_remove = []
-
-        for priority in range(self._task_priorities):
-            for task in self._tasks[priority]:
-                task.timer += self._delta_time_ms
-
-                if task.timer >= task.period:
-
-                    if isinstance(task, CollisionTask):
-                        for collision_pair in self._board.collided:
-                            task(collision_pair, task.timer_seconds)
-                    elif isinstance(task, AgentTask):
-                        for agent in self._board.agents:
-                            task(agent, task.timer_seconds)
-                    elif isinstance(task, PairTask):
-                        for pair in self._board.sector_pairs:
-                            task(pair, task.timer_seconds)
-                    elif isinstance(task, BorderCollisionTask):
-                        for agent in filter(lambda x: x.colliding_border, self._board.agents):
-                            task(agent)
-                    elif isinstance(task, AroundAgentTask):
-                        for agent, around in self._board.agents.items():
-                            task(agent, around, task.timer_seconds)
-                    elif isinstance(task, FrameEndTask):
-                        task()
-                    else:
-                        task()
-
-                    if task.is_dead:
-                        to_remove.append(task)
-                    task.timer = 0
-
-        self.remove_tasks(to_remove)
+        start = time.perf_counter()
+        self._timer()
+
+        self._scheduler.advance(self._delta_time_ms)
+        self._scheduler.run_due()
+
+        self._stats.record("tasks", time.perf_counter() - start)
+
+    def _dispatcher_of(self, task: Task) -> Callable[[Task], None]:
+        for task_type in type(task).__mro__:
+            dispatcher = self._dispatchers.get(task_type)
+
+            if dispatcher is not None:
+                return dispatcher
+
+        return Game._dispatch_plain
+
+    @staticmethod
+    def _dispatch_plain(task: Task) -> None:
+        task()
+
+    def _dispatch_collision(self, task: Task) -> None:
+        for collision_pair in self._board.collided:
+            task(collision_pair, task.timer_seconds)
+
+    def _dispatch_agent(self, task: Task) -> None:
+        if task.slices > 1:
+            agents, dt = self._slice_agents(task)
+        else:
+            agents, dt = self._board.agents, task.timer_seconds
+
+        for agent in agents:
+            task(agent, dt)
+
+    def _dispatch_pair(self, task: Task) -> None:
+        for pair in self._board.sector_pairs:
+            task(pair, task.timer_seconds)
+
+    def _dispatch_border_collision(self, task: Task) -> None:
+        for agent in self._board.border_colliding():
+            task(agent)
+
+    def _dispatch_around_agent(self, task: Task) -> None:
+        if task.slices > 1:
+            board_agents = self._board.agents
+            agents, dt = self._slice_agents(task)
+
+            for agent in agents:
+                task(agent, board_agents[agent], dt)
+
+            return
+
+        for agent, around in self._board.agents.items():
+            task(agent, around, task.timer_seconds)
+
+    def _slice_agents(self, task: Task) -> tuple[list[Agent], float]:
+        index, dt = task.next_slice()
+
+        store = self._board.store
+        agents = store.agents
+
+        return [agents[row] for row in numpy.flatnonzero(store.uids % task.slices == index).tolist()], dt
+
+    def _dispatch_batch_collision(self, task: Task) -> None:
+        task(*self._board.collided_rows(), task.timer_seconds)
+
+    def _dispatch_batch_agent(self, task: Task) -> None:
+        task(numpy.arange(len(self._board.store)), task.timer_seconds)
+
+    def _dispatch_batch_pair(self, task: Task) -> None:
+        task(*self._board.sector_pair_rows(), task.timer_seconds)
+
+    def _dispatch_batch_around_agent(self, task: Task) -> None:
+        task(*self._board.around_agents(), task.timer_seconds)
+
+    def _dispatch_n_body(self, task: NBodyTask) -> None:
+        store = self._board.store
+        dt = task.timer_seconds
+
+        accelerations = BarnesHut.accelerations(store.positions + store.sizes / 2, task.masses_of(store), task.theta,
+                                                task.gravity, task.softening)
+        store.velocities[:] += accelerations * dt
+
+        task(numpy.arange(len(store)), accelerations, dt)
+
+    @staticmethod
+    def _sector_color(key: Any) -> numpy.ndarray:
+        # Colors are derived from the cell key with a private generator, so drawing sectors does not consume
+        # the global random state used by seeded runs.
+        return numpy.random.default_rng(hash(key) & 0xFFFFFFFFFFFFFFFF).integers(0, 255, (3,))
 
     def _draw_sectors(self) -> None:
-        if len(self._sector_rects) == 0:
-            width, height = self._board.sector_size
+        store = self._board.store
+        colors = numpy.zeros((len(store), 3), dtype=numpy.uint8)
+        cells = []
+
+        sector_colors = {}
+
+        for key, bounds, sector in self._board.index.cells():
+            color = self._sector_colors.get(key)
+
+            if color is None:
+                color = Game._sector_color(key)
 
-            for i in range(self._sectors_number):
-                for j in range(self._sectors_number):
-                    self._sector_rects.append(pygame.FRect((i * width, j * height), (width, height)))
+            sector_colors[key] = color
+            cells.append((key, bounds))
 
-        if len(self._sector_colors) == 0:
-            for color in ColorGenerator.random(self._sectors_number ** 2):
-                self._sector_colors.append(color)
+            if sector:
+                colors[[agent.row for agent in sector]] = color
 
-        for i, row in enumerate(self._board.agents_board):
-            for j, sector in enumerate(row):
-                index = i * self._sectors_number + j
-                color = self._sector_colors[index]
+        self._sector_colors = sector_colors
 
-                pygame.draw.rect(self._display, color, self._sector_rects[index], width=1)
+        if cells != self._sector_overlay_cells:
+            self._sector_overlay = pygame.Surface(self._display_size, pygame.SRCALPHA)
+            self._sector_overlay_cells = cells
 
-                for agent in sector:
-                    pygame.draw.rect(self._display, color, agent.rect, width=1)
+            for key, bounds in cells:
+                pygame.draw.rect(self._sector_overlay, self._sector_colors[key], bounds, width=1)
+
+        self._display.blit(self._sector_overlay, TOP_LEFT)
+        Renderer.rect_outlines(self._display, numpy.hstack((store.positions, store.sizes)), colors)
 
     def _draw_velocities(self) -> None:
-        for index, agent in enumerate(self._board.agents):
-            x, y = agent.rect.center
-            v_x, v_y = agent.velocity
+        store = self._board.store
+        centers = store.positions + store.sizes / 2
 
-            pygame.draw.line(self._display, RED_COLOR, (x, y), (x + v_x, y + v_y), 3)
+        Renderer.lines(self._display, centers, centers + store.velocities, RED_COLOR, 3)
 
     def _check_dead(self) -> None:
         self._board.check_dead()
@@ -175,22 +347,85 @@ class Game:
         for agent in self._board.dead:
             self._board.remove_agent(agent)
 
+            if self._agent_pool is not None:
+                self._agent_pool.release(agent)
+
     def _update_display(self) -> None:
         self._blit_function()
 
-        if self._to_draw_info:
+        if self._to_draw_stats:
+            self._draw_stats()
+        elif self._to_draw_info:
             self._screen.blit(
                 self._font.render(f"time: {self._time / 1000}", False, DEFAULT_FONT_COLOR),
                 self._timer_position)
             self._screen.blit(
-                self._font.render(f"fps: {math.floor(self._clock.get_fps())}", False, DEFAULT_FONT_COLOR),
+                self._font.render(f"fps: {math.floor(self._clock.get_fps())}{self._fast_forward_info()}", False,
+                                  DEFAULT_FONT_COLOR),
                 self._fps_position)
 
-        self._clock.tick(self._fps_limit)
         pygame.display.update()
 
+    def _draw_stats(self) -> None:
+        report = self._stats.report((50, 95))
+        sections = sorted(report, key=lambda section: report[section]["p50"], reverse=True)[:STATS_LINES_NUMBER]
+
+        lines = [f"fps: {math.floor(self._clock.get_fps())}{self._fast_forward_info()}  "
+                 f"time: {self._time / 1000:.1f}"] + [
+            f"{TimingStats.name_of(section)}: p50 {report[section]['p50'] * 1000:.2f} ms, "
+            f"p95 {report[section]['p95'] * 1000:.2f} ms"
+            for section in sections
+        ]
+
+        x, y = self._timer_position
+        step = self._font.get_linesize()
+
+        for index, line in enumerate(lines):
+            self._screen.blit(self._font.render(line, False, DEFAULT_FONT_COLOR), (x, y + index * step))
+
+    def _fast_forward_info(self) -> str:
+        if not self._fast_forward:
+            return ""
+
+        return f"  x{self._frame_steps}" if self._step_budget_ms is None \
+            else f"  x{self._frame_steps} ({self._step_budget_ms:g} ms)"
+
+    def _simulate_frame(self) -> None:
+        if not self._fast_forward:
+            self._frame_steps = 1
+            self._do_tasks()
+            return
+
+        self._fixed_delta_time_ms = self._fast_forward_delta_time_ms
+        steps = 0
+
+        deadline = time.perf_counter() + self._step_budget_ms / 1000 if self._step_budget_ms is not None else None
+
+        try:
+            while self._game_running:
+                self._do_tasks()
+                steps += 1
+
+                if deadline is None:
+                    if steps >= self._steps_per_frame:
+                        break
+                elif time.perf_counter() >= deadline:
+                    break
+        finally:
+            self._fixed_delta_time_ms = None
+
+        self._frame_steps = steps
+
+    def _scale_fast_forward(self, factor: float) -> None:
+        if self._step_budget_ms is None:
+            self._steps_per_frame = max(1, int(self._steps_per_frame * factor))
+        else:
+            self._step_budget_ms = max(1.0, self._step_budget_ms * factor)
+
     def _timer(self) -> None:
-        self._delta_time_ms = self._clock.get_time()
+        self._delta_time_ms = self._clock.get_time() \
+            if self._fixed_delta_time_ms is None \
+            else self._fixed_delta_time_ms
         self._delta_time = self._delta_time_ms / 1000.0
         self._time += self._delta_time_ms
 
@@ -206,6 +441,17 @@ class Game:
 
     def run(self) -> None:
         self._init_internal_tasks()
+        self._game_running = True
+
+        if self._headless:
+            while self._game_running:
+                start = time.perf_counter()
+                self._do_tasks()
+
+                self._stats.record("frame", time.perf_counter() - start)
+                self._clock.tick()
+
+            return
 
         if self._display_size != self._screen_size:
             self._blit_function = lambda: self._screen.blit(
@@ -226,25 +472,101 @@ class Game:
                         self._to_draw_sectors = not self._to_draw_sectors
                     if event.key == pygame.K_v:
                         self._to_draw_velocities = not self._to_draw_velocities
+                    if event.key == pygame.K_t:
+                        self._to_draw_stats = not self._to_draw_stats
+                    if event.key == pygame.K_f:
+                        self._fast_forward = not self._fast_forward
+                    if event.key == pygame.K_RIGHTBRACKET:
+                        self._scale_fast_forward(2)
+                    if event.key == pygame.K_LEFTBRACKET:
+                        self._scale_fast_forward(0.5)
+
+            frame_start = time.perf_counter()
+            self._simulate_frame()
+
+            start = time.perf_counter()
+            self._draw()
+
+            checkpoint = time.perf_counter()
+            self._stats.record("draw", checkpoint - start)
+
+            self._update_display()
+
+            end = time.perf_counter()
+            self._stats.record("display", end - checkpoint)
+            self._stats.record("frame", end - frame_start)
+
+            self._clock.tick(self._fps_limit)
+
+    def step(self, delta_time_ms: int | float) -> None:
+        """
+        Advances the simulation by fixed `delta_time_ms` of simulated time: board is updated and all due tasks are
+        performed exactly as in one `run` frame, but events are not polled and nothing is drawn. Together with
+        `seed` results depend only on the timestep, not on the wall-clock speed.
+
+        Example:
+
+        game = eevolve.Game(..., headless=True, seed=42)
+        game.add_agents(100, eevolve.AgentGenerator.default(game, 100))
 
+        game.run_steps(10_000, 16)    # 160 simulated seconds
+
+        :param delta_time_ms: Simulated timestep in milliseconds.
+        :return: None
+        """
+        if delta_time_ms < 0:
+            raise ValueError(f"Timestep must be non-negative. {delta_time_ms} given instead!")
+
+        self._init_internal_tasks()
+
+        self._fixed_delta_time_ms = delta_time_ms
+
+        start = time.perf_counter()
+
+        try:
             self._do_tasks()
+        finally:
+            self._fixed_delta_time_ms = None
+
+        self._stats.record("frame", time.perf_counter() - start)
+
+    def run_steps(self, steps_number: int, delta_time_ms: int | float) -> None:
+        """
+        Performs `steps_number` of `step` calls with the same timestep, stops early if `stop` was called.
+
+        :param steps_number: Number of steps to perform.
+        :param delta_time_ms: Simulated timestep in milliseconds.
+        :return: None
+        """
+        self._game_running = True
+
+        for _ in range(steps_number):
+            if not self._game_running:
+                break
+
+            self.step(delta_time_ms)
+
+    def stop(self) -> None:
+        """
+        Finishes `run` loop after the current frame.
+
+        :return: None
+        """
+        self._game_running = False
 
     def add_task(self, task: Task) -> None:
         if not isinstance(task, Task):
             raise ValueError("Argument must be instance of Task")
 
-        self._tasks[task.priority].append(task)
+        self._scheduler.add(task, self._dispatcher_of(task))
 
     def add_tasks(self, tasks: Sequence[Task]) -> None:
         for task in tasks:
             self.add_task(task)
 
     def remove_task(self, task: Task) -> None:
-        if task not in self._tasks[task.priority]:
+        if not self._scheduler.remove(task):
             print(f"[WARNING] Trying to remove {task} which not in tasks list!")
-            return
-
-        self._tasks[task.priority].remove(task)
 
     def remove_tasks(self, tasks: Sequence[Task]) -> None:
         for task in tasks:
@@ -286,6 +608,71 @@ class Game:
     def display_background(self, display_background: str | pygame.Surface | numpy.ndarray) -> None:
         self._background = Loader.load_surface(display_background, self._display_size)
 
+    @property
+    def headless(self) -> bool:
+        return self._headless
+
+    @property
+    def seed(self) -> int | None:
+        return self._seed
+
+    @property
+    def time(self) -> float:
+        return self._time
+
+    @property
+    def running(self) -> bool:
+        return self._game_running
+
+    @property
+    def fast_forward(self) -> bool:
+        return self._fast_forward
+
+    @fast_forward.setter
+    def fast_forward(self, fast_forward: bool) -> None:
+        self._fast_forward = fast_forward
+
+    @property
+    def steps_per_frame(self) -> int:
+        return self._steps_per_frame
+
+    @steps_per_frame.setter
+    def steps_per_frame(self, steps_per_frame: int) -> None:
+        if steps_per_frame < 1:
+            raise ValueError(f"Steps per frame must be positive. {steps_per_frame} given instead!")
+
+        self._steps_per_frame = steps_per_frame
+
+    @property
+    def step_budget_ms(self) -> int | float | None:
+        return self._step_budget_ms
+
+    @step_budget_ms.setter
+    def step_budget_ms(self, step_budget_ms: int | float | None) -> None:
+        if step_budget_ms is not None and step_budget_ms <= 0:
+            raise ValueError(f"Step budget must be positive. {step_budget_ms} given instead!")
+
+        self._step_budget_ms = step_budget_ms
+
+    @property
+    def frame_steps(self) -> int:
+        """
+        :return: Number of simulation steps performed in the last rendered frame.
+        """
+        return self._frame_steps
+
+    @property
+    def agent_pool(self) -> AgentPool | None:
+        return self._agent_pool
+
+    @property
+    def stats(self) -> TimingStats:
+        return self._stats
+
+    @property
+    def scheduler(self) -> TaskScheduler:
+        return self._scheduler
+
     @property
     def board(self) -> Board | None:
         return self._board
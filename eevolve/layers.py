@@ -20,6 +20,17 @@ class Layer:
     def __call__(self, sample: numpy.ndarray) -> numpy.ndarray:
         return sample
 
+    def batch_call(self, samples: numpy.ndarray, weights: numpy.ndarray, biases: numpy.ndarray) -> numpy.ndarray:
+        """
+        Evaluates the layer for a whole population at once, used by `PopulationBrain`.
+
+        :param samples: Array of shape (P, ...), one sample per population member.
+        :param weights: Stacked weights of all population members, shape (P, *weights.shape).
+        :param biases: Stacked biases of all population members, shape (P, *biases.shape).
+        :return: Array of shape (P, ...), one output per population member.
+        """
+        return samples
+
     def mutate(self) -> None:
         self._weights += NumbersGenerator.normal(self._shape, scaler=self._sigma)
 
@@ -70,6 +81,29 @@ class Layer:
     def shape(self) -> tuple[int, ...]:
         return self._shape
 
+    @property
+    def activation(self) -> Activation:
+        return self._activation
+
+    @property
+    def use_bias(self) -> bool:
+        return self._use_bias
+
+    @property
+    def mutation_scaler(self) -> float:
+        return self._sigma
+
+    def shallow_clone(self) -> "Layer":
+        """
+        Copies the layer without calling the constructor, parameters arrays are shared with the original layer.
+
+        :return: New layer of the same type.
+        """
+        new_layer = object.__new__(type(self))
+        new_layer.__dict__.update(self.__dict__)
+
+        return new_layer
+
     def __str__(self) -> str:
         return f"<{self.__class__.__name__}: {self._shape}, {self._activation}>"
 
@@ -77,18 +111,13 @@ class Layer:
         return str(self)
 
     def __copy__(self) -> "Layer":
-        new_layer = type(self)(self._shape, self._activation, self._use_bias, self._sigma)
-
-        new_layer.weights = self._weights
-        new_layer.biases = self._bias
-
-        return new_layer
+        return self.shallow_clone()
 
     def __deepcopy__(self, memodict: dict) -> "Layer":
-        new_layer = type(self)(self._shape, self._activation, self._use_bias, self._sigma)
+        new_layer = self.shallow_clone()
 
-        new_layer.weights = copy.deepcopy(self._weights)
-        new_layer.biases = copy.deepcopy(self._bias)
+        new_layer.weights = self._weights.copy()
+        new_layer.biases = self._bias.copy()
 
         return new_layer
 
@@ -104,7 +133,7 @@ class Dense(Layer):
             else numpy.zeros((1, shape[1]))
 
     def new_like_me(self) -> "Layer":
-        new_layer = type(self)(self._shape, self._activation, self._use_bias, self._sigma)
+        new_layer = self.shallow_clone()
 
         new_layer.weights = NumbersGenerator.weights(self._shape)
         new_layer.biases = NumbersGenerator.weights((1, self._shape[1])) \
@@ -121,6 +150,12 @@ class Dense(Layer):
 
         return self._activation(sample.dot(self._weights) + self._bias)
 
+    def batch_call(self, samples: numpy.ndarray, weights: numpy.ndarray, biases: numpy.ndarray) -> numpy.ndarray:
+        if len(samples.shape) == 2:
+            samples = numpy.expand_dims(samples, axis=1)
+
+        return self._activation(numpy.matmul(samples, weights) + biases)
+
 
 class Conv1D(Layer):
     def __init__(self, shape: tuple[int, ...], activation: Activation = None, use_bias: bool = True,
@@ -135,7 +170,7 @@ class Conv1D(Layer):
             else numpy.zeros((self._filters,))
 
     def new_like_me(self) -> "Layer":
-        new_layer = type(self)(self._shape, self._activation, self._use_bias, self._sigma)
+        new_layer = self.shallow_clone()
 
         new_layer.weights = NumbersGenerator.weights((self._filters, self._kernel_size))
         new_layer.biases = NumbersGenerator.weights((self._filters,)) \
@@ -157,6 +192,17 @@ class Conv1D(Layer):
 
         return result
 
+    def batch_call(self, samples: numpy.ndarray, weights: numpy.ndarray, biases: numpy.ndarray) -> numpy.ndarray:
+        if len(samples.shape) == 3:
+            if samples.shape[1] != 1:
+                raise ValueError(f"Expected second dimension of `samples` is 1. {samples.shape[1]} given instead!")
+
+            samples = samples[:, 0]
+
+        windows = numpy.lib.stride_tricks.sliding_window_view(samples, self._kernel_size, axis=-1)
+
+        return self._activation(numpy.einsum("pwk,pfk->pfw", windows, weights[..., ::-1]) + biases[..., None])
+
 
 class Argmax(Layer):
     def __init__(self, axis: int = -1, keepdims: bool = False, return_int: bool = False):
@@ -172,6 +218,14 @@ class Argmax(Layer):
         else:
             return numpy.argmax(sample, axis=self._axis, keepdims=self._keepdims)
 
+    def batch_call(self, samples: numpy.ndarray, weights: numpy.ndarray, biases: numpy.ndarray) -> numpy.ndarray:
+        axis = self._axis if self._axis < 0 else self._axis + 1
+
+        if self._return_int:
+            return numpy.argmax(samples, axis=axis)[:, 0]
+        else:
+            return numpy.argmax(samples, axis=axis, keepdims=self._keepdims)
+
     def new_like_me(self) -> "Layer":
         return copy.copy(self)
 
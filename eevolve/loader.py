@@ -1,13 +1,111 @@
+import hashlib
 import os
+from collections import OrderedDict
+from typing import Any
 
 import numpy
 import pygame
 
 
+class SurfaceCache:
+    """
+    Bounded least recently used cache of loaded surfaces.
+
+    Surfaces are keyed by their source, image path with modification time or hash of array content, target size
+    and pixel format, so agents created from the same image or bitmap share one surface instead of holding identical
+    pixel buffers. Cached surfaces are shared, drawing on them changes all agents which use them.
+
+    Example:
+
+    cache = SurfaceCache(capacity=16)
+    cache.put(key, surface)
+
+    cache.get(key) is surface    # True
+    cache.is_shared(surface)     # True
+    """
+
+    DEFAULT_CAPACITY = 256
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 0:
+            raise ValueError(f"Capacity must be non-negative. {capacity} given instead!")
+
+        self._capacity = capacity
+        self._surfaces: OrderedDict[Any, pygame.Surface] = OrderedDict()
+        self._keys: dict[int, Any] = {}
+
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Any) -> pygame.Surface | None:
+        surface = self._surfaces.get(key)
+
+        if surface is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._surfaces.move_to_end(key)
+
+        return surface
+
+    def put(self, key: Any, surface: pygame.Surface) -> None:
+        if self._capacity == 0:
+            return
+
+        self._surfaces[key] = surface
+        self._surfaces.move_to_end(key)
+        self._keys[id(surface)] = key
+
+        while len(self._surfaces) > self._capacity:
+            _, evicted = self._surfaces.popitem(last=False)
+            self._keys.pop(id(evicted), None)
+
+    def is_shared(self, surface: pygame.Surface) -> bool:
+        key = self._keys.get(id(surface))
+
+        return key is not None and self._surfaces.get(key) is surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self._keys.clear()
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int) -> None:
+        if value < 0:
+            raise ValueError(f"Capacity must be non-negative. {value} given instead!")
+
+        self._capacity = value
+
+        while len(self._surfaces) > self._capacity:
+            _, evicted = self._surfaces.popitem(last=False)
+            self._keys.pop(id(evicted), None)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
 class Loader:
+    cache = SurfaceCache()
+
     @staticmethod
     def load_surface(surface: str | pygame.Surface | numpy.ndarray,
-                     desired_size: tuple[int | float, int | float]) -> pygame.Surface | None:
+                     desired_size: tuple[int | float, int | float], private: bool = True) -> pygame.Surface | None:
         """
         Loads an image surface from a file, Pygame surface, or NumPy array
         and scales it to the desired size.
@@ -44,6 +142,11 @@ class Loader:
         :param desired_size:
             The desired size (width, height) to scale the image surface.
 
+        :param private:
+            Surfaces loaded from a file path or a NumPy array are cached in `Loader.cache`. If True, the caller gets
+            its own copy of the cached surface and may draw on it. If False, the cached surface is returned as is
+            and shared by all callers which load the same source, drawing on it changes all of them.
+
         :return:
             A Pygame surface scaled to the desired size if successful;
             otherwise, returns a new Pygame surface of the desired size
@@ -56,33 +159,68 @@ class Loader:
         if (isinstance(surface, str)
                 and os.path.exists(surface)
                 and pygame.image.get_extended()):
-            try:
-                image = pygame.image.load(surface)
-
-                if not all(desired_size):
-                    desired_size = image.size
-
-                if image.get_flags() & pygame.SRCALPHA:
-                    result = pygame.transform.scale(image, desired_size).convert_alpha()
-                else:
-                    result = pygame.transform.scale(image, desired_size).convert()
-            except pygame.error:
-                print(pygame.error)
-                raise ValueError("Surface image could not be loaded.")
+            key = ("path", os.path.realpath(surface), os.path.getmtime(surface), tuple(desired_size),
+                   Loader._display_format())
+            result = Loader.cache.get(key)
+
+            if result is None:
+                try:
+                    image = pygame.image.load(surface)
+
+                    if not all(desired_size):
+                        desired_size = image.size
+
+                    result = Loader.convert(pygame.transform.scale(image, desired_size))
+                except pygame.error:
+                    print(pygame.error)
+                    raise ValueError("Surface image could not be loaded.")
+
+                Loader.cache.put(key, result)
         elif isinstance(surface, pygame.Surface):
             if not all(desired_size):
                 desired_size = surface.size
 
-            result = pygame.transform.scale(surface, desired_size).convert_alpha() \
-                if surface.get_flags() & pygame.SRCALPHA \
-                else pygame.transform.scale(surface, desired_size).convert()
+            if Loader.cache.is_shared(surface) and surface.size == tuple(desired_size):
+                result = surface
+            else:
+                return Loader.convert(pygame.transform.scale(surface, desired_size))
         elif isinstance(surface, numpy.ndarray):
-            try:
-                result = pygame.surfarray.make_surface(surface).convert()
-            except pygame.error:
-                print(pygame.error)
-                raise ValueError("Surface image could not be loaded.")
+            key = ("array", surface.shape, surface.dtype.str,
+                   hashlib.blake2b(numpy.ascontiguousarray(surface).tobytes(), digest_size=16).digest(),
+                   Loader._display_format())
+            result = Loader.cache.get(key)
+
+            if result is None:
+                try:
+                    result = Loader.convert(pygame.surfarray.make_surface(surface))
+                except pygame.error:
+                    print(pygame.error)
+                    raise ValueError("Surface image could not be loaded.")
+
+                Loader.cache.put(key, result)
         else:
             raise ValueError("Surface image could not be loaded.")
 
-        return result if result is not None else pygame.Surface(desired_size).convert()
+        return result.copy() if private else result
+
+    @staticmethod
+    def is_shared(surface: pygame.Surface) -> bool:
+        return Loader.cache.is_shared(surface)
+
+    @staticmethod
+    def _display_format() -> bool:
+        return pygame.display.get_surface() is not None
+
+    @staticmethod
+    def convert(surface: pygame.Surface) -> pygame.Surface:
+        """
+        Converts the surface to the display pixel format for faster blitting, keeping per-pixel alpha if the surface
+        has it. Without a display surface, e.g. in headless mode, the surface is returned as is.
+
+        :param surface: Surface to convert.
+        :return: Converted surface.
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+
+        return surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
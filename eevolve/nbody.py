@@ -0,0 +1,187 @@
+import numpy
+
+
+class BarnesHut:
+    """
+    Approximate N-body accelerations with a Barnes-Hut quadtree.
+
+    Points are sorted by Morton code, so every quadtree node is a contiguous range of the sorted points and the whole
+    tree, node masses and centers of mass are built with array operations. The traversal is vectorized as well:
+    all (point, node) pairs of one tree level are tested at once, distant nodes are accepted as a single mass
+    in their center, close ones are replaced by their children.
+    """
+
+    DEFAULT_DEPTH = 20
+
+    @staticmethod
+    def accelerations(positions: numpy.ndarray, masses: numpy.ndarray | float, theta: float = 0.5,
+                      gravity: float = 1.0, softening: float = 1.0, depth: int = DEFAULT_DEPTH) -> numpy.ndarray:
+        """
+        Computes acceleration of every point caused by all other points, `gravity * m_j * r_ij / (|r_ij|^2 + e^2)^1.5`
+        summed over j. A node of side `s` at distance `d` from the point is approximated by its center of mass
+        when `s / d < theta`, `theta` equal to 0 gives exact all-pairs result.
+
+        Example:
+
+        positions = numpy.array([[0, 0], [10, 0]], dtype=float)
+        BarnesHut.accelerations(positions, numpy.array([1.0, 4.0]), softening=0.0)    # [[0.04, 0], [-0.01, 0]]
+
+        :param positions: Array of shape (N, 2) with points coordinates.
+        :param masses: Array of shape (N,) with points masses or a single mass of all points.
+        :param theta: Opening angle, greater values are faster and less accurate.
+        :param gravity: Gravitational constant.
+        :param softening: Softening length `e`, keeps accelerations finite when points get close.
+        :param depth: Maximum depth of the tree, points closer than `side / 2^depth` share a leaf and interact
+        directly.
+        :return: Array of shape (N, 2) with accelerations.
+        """
+        if theta < 0:
+            raise ValueError(f"Opening angle must be non-negative. {theta} given instead!")
+        if not 0 < depth <= 31:
+            raise ValueError(f"Depth must be in bounds [1, 31]. {depth} given instead!")
+
+        positions = numpy.asarray(positions, dtype=float).reshape(-1, 2)
+        masses = numpy.broadcast_to(numpy.asarray(masses, dtype=float), (len(positions),))
+        accelerations = numpy.zeros_like(positions)
+
+        if len(positions) < 2:
+            return accelerations
+
+        order, tree = BarnesHut._build(positions, masses, theta, depth)
+        starts, counts, node_masses, centers_x, centers_y, openings, children_starts, children_ends = tree
+
+        xs, ys = positions[:, 0].copy(), positions[:, 1].copy()
+        sorted_xs, sorted_ys = xs[order], ys[order]
+        sorted_masses = masses[order]
+        softening_squared = softening ** 2
+
+        points = numpy.arange(len(positions))
+        nodes = numpy.zeros_like(points)
+
+        while len(points) > 0:
+            deltas_x = centers_x[nodes] - xs[points]
+            deltas_y = centers_y[nodes] - ys[points]
+            distances_squared = deltas_x * deltas_x + deltas_y * deltas_y
+
+            node_openings = openings[nodes]
+            accepted = distances_squared > node_openings * numpy.abs(node_openings)
+
+            BarnesHut._accumulate(accelerations, points[accepted], deltas_x[accepted], deltas_y[accepted],
+                                  distances_squared[accepted], node_masses[nodes[accepted]], softening_squared)
+
+            opened = ~accepted
+            points, nodes = points[opened], nodes[opened]
+
+            leaves = children_starts[nodes] == children_ends[nodes]
+
+            if leaves.any():
+                leaf_nodes = nodes[leaves]
+                lengths = counts[leaf_nodes]
+
+                first = numpy.repeat(points[leaves], lengths)
+                second = BarnesHut._spans(starts[leaf_nodes], lengths)
+
+                deltas_x = sorted_xs[second] - xs[first]
+                deltas_y = sorted_ys[second] - ys[first]
+                BarnesHut._accumulate(accelerations, first, deltas_x, deltas_y, deltas_x * deltas_x + deltas_y * deltas_y,
+                                      sorted_masses[second], softening_squared)
+
+                points, nodes = points[~leaves], nodes[~leaves]
+
+            lengths = children_ends[nodes] - children_starts[nodes]
+            points = numpy.repeat(points, lengths)
+            nodes = BarnesHut._spans(children_starts[nodes], lengths)
+
+        return accelerations * gravity
+
+    @staticmethod
+    def _build(positions: numpy.ndarray, masses: numpy.ndarray, theta: float,
+               depth: int) -> tuple[numpy.ndarray, tuple[numpy.ndarray, ...]]:
+        lower = positions.min(axis=0)
+        side = max(float((positions.max(axis=0) - lower).max()), numpy.finfo(float).tiny)
+
+        resolution = 1 << depth
+        cells = numpy.minimum(((positions - lower) / side * resolution).astype(numpy.int64), resolution - 1)
+        codes = BarnesHut._morton(cells[:, 0]) | (BarnesHut._morton(cells[:, 1]) << 1)
+
+        order = numpy.argsort(codes, kind="stable")
+        codes, cells, sorted_positions = codes[order], cells[order], positions[order]
+
+        mass_sums = numpy.concatenate(([0.0], numpy.cumsum(masses[order])))
+        moment_sums = numpy.concatenate((numpy.zeros((1, 2)),
+                                         numpy.cumsum(sorted_positions * masses[order, None], axis=0)))
+
+        levels_starts, levels = [], []
+
+        for level in range(depth + 1):
+            keys = codes >> (2 * (depth - level))
+            levels_starts.append(numpy.concatenate(([0], numpy.flatnonzero(keys[1:] != keys[:-1]) + 1)))
+            levels.append(numpy.full(len(levels_starts[-1]), level))
+
+        offsets = numpy.cumsum([0] + [len(level_starts) for level_starts in levels_starts])
+        starts = numpy.concatenate(levels_starts)
+        ends = numpy.concatenate([numpy.append(level_starts[1:], len(codes)) for level_starts in levels_starts])
+        levels = numpy.concatenate(levels)
+
+        children_starts = numpy.zeros_like(starts)
+        children_ends = numpy.zeros_like(starts)
+
+        for level in range(depth):
+            parents = slice(offsets[level], offsets[level + 1])
+            children = levels_starts[level + 1]
+
+            children_starts[parents] = numpy.searchsorted(children, starts[parents]) + offsets[level + 1]
+            children_ends[parents] = numpy.searchsorted(children, ends[parents]) + offsets[level + 1]
+
+        counts = ends - starts
+        node_masses = mass_sums[ends] - mass_sums[starts]
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            centers = (moment_sums[ends] - moment_sums[starts]) / node_masses[:, None]
+
+        sides = side / numpy.left_shift(1, levels)
+        boxes_centers = lower + ((cells[starts] >> (depth - levels)[:, None]) + 0.5) * sides[:, None]
+
+        centers = numpy.where((node_masses[:, None] != 0) & (counts[:, None] > 1), centers, boxes_centers)
+        centers[counts == 1] = sorted_positions[starts[counts == 1]]
+
+        with numpy.errstate(divide="ignore"):
+            openings = sides / theta + numpy.sqrt(((centers - boxes_centers) ** 2).sum(axis=1))
+
+        openings[counts == 1] = -1.0
+
+        return order, (starts, counts, node_masses, centers[:, 0].copy(), centers[:, 1].copy(), openings,
+                       children_starts, children_ends)
+
+    @staticmethod
+    def _accumulate(accelerations: numpy.ndarray, points: numpy.ndarray, deltas_x: numpy.ndarray,
+                    deltas_y: numpy.ndarray, distances_squared: numpy.ndarray, masses: numpy.ndarray,
+                    softening_squared: float) -> None:
+        if len(points) == 0:
+            return
+
+        squared = distances_squared + softening_squared
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            scales = numpy.where(squared > 0, masses / (squared * numpy.sqrt(squared)), 0.0)
+
+        length = len(accelerations)
+
+        accelerations[:, 0] += numpy.bincount(points, deltas_x * scales, minlength=length)
+        accelerations[:, 1] += numpy.bincount(points, deltas_y * scales, minlength=length)
+
+    @staticmethod
+    def _morton(values: numpy.ndarray) -> numpy.ndarray:
+        values = values.astype(numpy.uint64)
+
+        for shift, mask in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF), (4, 0x0F0F0F0F0F0F0F0F),
+                            (2, 0x3333333333333333), (1, 0x5555555555555555)):
+            values = (values | (values << numpy.uint64(shift))) & numpy.uint64(mask)
+
+        return values.astype(numpy.int64)
+
+    @staticmethod
+    def _spans(starts: numpy.ndarray, lengths: numpy.ndarray) -> numpy.ndarray:
+        offsets = numpy.cumsum(lengths) - lengths
+
+        return numpy.arange(int(lengths.sum())) - numpy.repeat(offsets - starts, lengths)
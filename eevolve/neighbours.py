@@ -0,0 +1,341 @@
+import numpy
+
+
+class CellList:
+    FULL_STENCIL = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+    HALF_STENCIL = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+    @staticmethod
+    def radius_pairs(positions: numpy.ndarray, radius: float) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Finds all ordered pairs of points closer than or exactly at `radius` to each other.
+
+        Points are binned into square cells with side `radius`, sorted by cell and every point is matched against
+        the points of its own and eight surrounding cells with `searchsorted`, so no Python loop over the points
+        is involved.
+
+        Example:
+
+        positions = numpy.array([[0, 0], [3, 4], [100, 100]], dtype=float)
+        first, second, distances = CellList.radius_pairs(positions, 5.0)    # [0, 1], [1, 0], [5.0, 5.0]
+
+        :param positions: Array of shape (N, 2) with points coordinates.
+        :param radius: Maximum distance between paired points.
+        :return: Index arrays `first`, `second` and array of distances between them. Every pair is reported in
+        both orders, a point is never paired with itself.
+        """
+        if radius <= 0:
+            raise ValueError(f"Radius must be positive. {radius} given instead!")
+
+        positions = numpy.asarray(positions, dtype=float).reshape(-1, 2)
+        cells = numpy.floor(positions / radius).astype(numpy.int64)
+        first, second = CellList._stencil_pairs(cells, CellList.FULL_STENCIL)
+
+        mask = first != second
+        first, second = first[mask], second[mask]
+
+        distances = numpy.sqrt(((positions[first] - positions[second]) ** 2).sum(axis=1))
+        mask = distances <= radius
+
+        return first[mask], second[mask], distances[mask]
+
+    @staticmethod
+    def cutoff_pairs(positions: numpy.ndarray, radius: float) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Finds all unordered pairs of points closer than or exactly at `radius` to each other.
+
+        Same as `radius_pairs`, but every point is matched only against later points of its own cell and
+        the points of four of the eight surrounding cells, the other four see it from their side. So every pair
+        is found once and half of the candidates of the full stencil are never generated.
+
+        Example:
+
+        positions = numpy.array([[0, 0], [3, 4], [100, 100]], dtype=float)
+        first, second, distances = CellList.cutoff_pairs(positions, 5.0)    # [0], [1], [5.0]
+
+        :param positions: Array of shape (N, 2) with points coordinates.
+        :param radius: Maximum distance between paired points.
+        :return: Index arrays `first` and `second` and array of distances between them, every pair is reported
+        once, a point is never paired with itself.
+        """
+        if radius <= 0:
+            raise ValueError(f"Radius must be positive. {radius} given instead!")
+
+        positions = numpy.asarray(positions, dtype=float).reshape(-1, 2)
+        cells = numpy.floor(positions / radius).astype(numpy.int64)
+
+        first, second = CellList._stencil_pairs(cells, ((0, 0),))
+        mask = first < second
+        first, second = first[mask], second[mask]
+
+        neighbour_first, neighbour_second = CellList._stencil_pairs(cells, CellList.HALF_STENCIL)
+        first = numpy.concatenate((first, neighbour_first))
+        second = numpy.concatenate((second, neighbour_second))
+
+        distances = numpy.sqrt(((positions[first] - positions[second]) ** 2).sum(axis=1))
+        mask = distances <= radius
+
+        return first[mask], second[mask], distances[mask]
+
+    @staticmethod
+    def nearest(positions: numpy.ndarray, k: int, radius: float,
+                sentinel: int = -1) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Finds up to `k` nearest neighbours within `radius` for every point at once.
+
+        Example:
+
+        indexes, distances = CellList.nearest(positions, 16, 100.0)
+
+        :param positions: Array of shape (N, 2) with points coordinates.
+        :param k: Number of neighbours to find for every point.
+        :param radius: Maximum distance to a neighbour.
+        :param sentinel: Index used to pad rows of points which have less than `k` neighbours.
+        :return: Array of shape (N, k) with neighbour indexes sorted by distance and array of shape (N, k)
+        with distances to them, padded with `sentinel` and `inf` respectively.
+        """
+        if k < 0:
+            raise ValueError(f"`k` must be a non-negative integer. {k} given instead!")
+
+        positions = numpy.asarray(positions, dtype=float).reshape(-1, 2)
+        number = len(positions)
+
+        indexes = numpy.full((number, k), sentinel, dtype=numpy.intp)
+        distances = numpy.full((number, k), numpy.inf, dtype=float)
+
+        if number < 2 or k == 0:
+            return indexes, distances
+
+        first, second, pair_distances = CellList.radius_pairs(positions, radius)
+
+        order = numpy.lexsort((pair_distances, first))
+        first, second, pair_distances = first[order], second[order], pair_distances[order]
+
+        counts = numpy.bincount(first, minlength=number)
+        starts = numpy.cumsum(counts) - counts
+        ranks = numpy.arange(len(first)) - numpy.repeat(starts, counts)
+
+        mask = ranks < k
+        indexes[first[mask], ranks[mask]] = second[mask]
+        distances[first[mask], ranks[mask]] = pair_distances[mask]
+
+        return indexes, distances
+
+    @staticmethod
+    def cell_pairs(cells: numpy.ndarray, radius: int = 0) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Finds all ordered pairs of points whose integer cells differ by at most `radius` along both axes.
+
+        :param cells: Integer array of shape (N, 2) with cell indexes of the points.
+        :param radius: Number of surrounding cells to include, 0 pairs only points of the same cell.
+        :return: Index arrays `first` and `second` sorted by `first`, a point is never paired with itself.
+        """
+        if radius < 0:
+            raise ValueError(f"Radius must be a non-negative integer. {radius} given instead!")
+
+        return CellList.window_pairs(cells, -radius, radius)
+
+    @staticmethod
+    def window_pairs(cells: numpy.ndarray, lower: int, upper: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Finds all ordered pairs of points where the cell of the second point is shifted from the cell of the first
+        one by `lower` to `upper` inclusive along both axes. The relation is not symmetric unless `lower == -upper`.
+
+        :param cells: Integer array of shape (N, 2) with cell indexes of the points.
+        :param lower: Smallest shift of the cell.
+        :param upper: Largest shift of the cell.
+        :return: Index arrays `first` and `second` sorted by `first`, a point is never paired with itself.
+        """
+        if lower > upper:
+            raise ValueError(f"Lower shift must not exceed upper shift. {lower} > {upper} given instead!")
+
+        stencil = tuple((dx, dy) for dx in range(lower, upper + 1) for dy in range(lower, upper + 1))
+        first, second = CellList._stencil_pairs(numpy.asarray(cells, dtype=numpy.int64).reshape(-1, 2), stencil)
+
+        mask = first != second
+        order = numpy.argsort(first[mask], kind="stable")
+
+        return first[mask][order], second[mask][order]
+
+    @staticmethod
+    def to_csr(first: numpy.ndarray, second: numpy.ndarray, number: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Packs pairs sorted by `first` into compressed sparse rows.
+
+        Example:
+
+        offsets, neighbours = CellList.to_csr(first, second, len(positions))
+        neighbours_of_5 = neighbours[offsets[5]:offsets[6]]
+
+        :param first: Sorted index array of the first points of pairs.
+        :param second: Index array of the second points of pairs.
+        :param number: Total number of points.
+        :return: Array `offsets` of shape (number + 1,) and array of neighbour indexes.
+        """
+        offsets = numpy.zeros((number + 1,), dtype=numpy.intp)
+        numpy.cumsum(numpy.bincount(first, minlength=number), out=offsets[1:])
+
+        return offsets, numpy.asarray(second, dtype=numpy.intp)
+
+    @staticmethod
+    def _stencil_pairs(cells: numpy.ndarray,
+                       stencil: tuple[tuple[int, int], ...]) -> tuple[numpy.ndarray, numpy.ndarray]:
+        number = len(cells)
+
+        if number == 0:
+            return numpy.empty((0,), dtype=numpy.intp), numpy.empty((0,), dtype=numpy.intp)
+
+        reach = max(max(abs(dx), abs(dy)) for dx, dy in stencil)
+
+        cells = cells - cells.min(axis=0)
+
+        width = int(cells[:, 1].max()) + 2 * reach + 1
+        cell_ids = cells[:, 0] * width + cells[:, 1] + reach
+
+        order = numpy.argsort(cell_ids, kind="stable")
+        sorted_ids = cell_ids[order]
+
+        firsts, seconds = [], []
+
+        for dx, dy in stencil:
+            targets = cell_ids + dx * width + dy
+
+            starts = numpy.searchsorted(sorted_ids, targets, side="left")
+            counts = numpy.searchsorted(sorted_ids, targets, side="right") - starts
+            total = int(counts.sum())
+
+            if total == 0:
+                continue
+
+            offsets = numpy.cumsum(counts) - counts
+
+            firsts.append(numpy.repeat(numpy.arange(number), counts))
+            seconds.append(order[numpy.arange(total) - numpy.repeat(offsets - starts, counts)])
+
+        if not firsts:
+            return numpy.empty((0,), dtype=numpy.intp), numpy.empty((0,), dtype=numpy.intp)
+
+        return numpy.concatenate(firsts), numpy.concatenate(seconds)
+
+
+class VerletList:
+    """
+    Neighbour list with a skin, reused across frames.
+
+    Candidate pairs closer than `cutoff + skin` are found with `CellList.cutoff_pairs` and kept until any point has
+    moved more than `skin / 2` since the build, so no pair closer than `cutoff` can be missing from the candidates
+    until then. Every frame only the distances of the candidates are checked. The list is rebuilt as well when
+    the set or order of the points changes, e.g. when agents are added, removed or their store rows are swapped.
+
+    Example:
+
+    neighbours = eevolve.VerletList(cutoff=32.0, skin=8.0)
+    game = eevolve.Game(..., neighbour_list=neighbours)
+
+    game.run_steps(1000, 16)
+    print(neighbours.builds)
+    """
+
+    def __init__(self, cutoff: float, skin: float) -> None:
+        if cutoff <= 0:
+            raise ValueError(f"Cutoff must be positive. {cutoff} given instead!")
+        if skin < 0:
+            raise ValueError(f"Skin must be non-negative. {skin} given instead!")
+
+        self._cutoff = cutoff
+        self._skin = skin
+
+        self._reference: numpy.ndarray | None = None
+        self._keys: numpy.ndarray | None = None
+        self._first = numpy.empty((0,), dtype=numpy.intp)
+        self._second = numpy.empty((0,), dtype=numpy.intp)
+
+        self._builds = 0
+        self._updates = 0
+
+    def update(self, positions: numpy.ndarray, keys: numpy.ndarray | None = None) -> bool:
+        """
+        Rebuilds candidates if needed.
+
+        :param positions: Array of shape (N, 2) with current points coordinates.
+        :param keys: Array of shape (N,) with unique ids of the points, a change of ids rebuilds the list.
+        :return: True if the list was rebuilt.
+        """
+        positions = numpy.asarray(positions, dtype=float).reshape(-1, 2)
+        self._updates += 1
+
+        if not self._is_valid(positions, keys):
+            self.build(positions, keys)
+            return True
+
+        return False
+
+    def build(self, positions: numpy.ndarray, keys: numpy.ndarray | None = None) -> None:
+        positions = numpy.asarray(positions, dtype=float).reshape(-1, 2)
+
+        if len(positions) < 2:
+            first = second = numpy.empty((0,), dtype=numpy.intp)
+        else:
+            first, second, _ = CellList.cutoff_pairs(positions, self._cutoff + self._skin)
+
+        self._first, self._second = first, second
+        self._reference = positions.copy()
+        self._keys = None if keys is None else numpy.array(keys, copy=True)
+        self._builds += 1
+
+    def pairs(self, positions: numpy.ndarray, cutoff: float | None = None) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        :param positions: Array of shape (N, 2) with current points coordinates, the same as given to `update`.
+        :param cutoff: Maximum distance between paired points, not greater than `cutoff` of the list.
+        :return: Index arrays `first` and `second`, every pair closer than or exactly at `cutoff` is reported once.
+        """
+        cutoff = self._cutoff if cutoff is None else cutoff
+
+        if cutoff > self._cutoff:
+            raise ValueError(f"Cutoff must not be greater than {self._cutoff}. {cutoff} given instead!")
+
+        positions = numpy.asarray(positions, dtype=float).reshape(-1, 2)
+        deltas = positions[self._first] - positions[self._second]
+        mask = (deltas ** 2).sum(axis=1) <= cutoff ** 2
+
+        return self._first[mask], self._second[mask]
+
+    def _is_valid(self, positions: numpy.ndarray, keys: numpy.ndarray | None) -> bool:
+        if self._reference is None or len(self._reference) != len(positions):
+            return False
+
+        if (keys is None) != (self._keys is None) or (keys is not None and not numpy.array_equal(keys, self._keys)):
+            return False
+
+        if len(positions) == 0:
+            return True
+
+        displacements = ((positions - self._reference) ** 2).sum(axis=1)
+
+        return float(displacements.max()) <= (self._skin / 2) ** 2
+
+    def clear(self) -> None:
+        self._reference = None
+        self._keys = None
+        self._first = numpy.empty((0,), dtype=numpy.intp)
+        self._second = numpy.empty((0,), dtype=numpy.intp)
+
+    @property
+    def cutoff(self) -> float:
+        return self._cutoff
+
+    @property
+    def skin(self) -> float:
+        return self._skin
+
+    @property
+    def builds(self) -> int:
+        return self._builds
+
+    @property
+    def updates(self) -> int:
+        return self._updates
+
+    @property
+    def candidates(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        return self._first, self._second
@@ -4,6 +4,17 @@ import numpy
 
 
 class NumbersGenerator:
+    @staticmethod
+    def seed(seed: int | None) -> None:
+        """
+        Seeds the random state used by all generators of the package, `NumbersGenerator`, `PositionGenerator`,
+        `ColorGenerator` and brains initialization and mutation, to make simulation runs reproducible.
+
+        :param seed: Seed value, None reseeds from the operating system entropy.
+        :return: None
+        """
+        numpy.random.seed(seed)
+
     @staticmethod
     def uniform(shape: tuple[int, ...] = (), offset: float = 0.0, scaler: float = 1.0,
                 dtype: Any = numpy.float64) -> numpy.ndarray | float:
@@ -0,0 +1,113 @@
+from typing import Any
+
+
+class AgentPool:
+    """
+    Keeps dead agents removed from the `Board` and hands them out again as storage for new clones.
+
+    `Game` releases agents removed by its dead check into the pool, `Agent.clone`, and therefore `new_like_me` and
+    the default reproduce function, acquires an agent of the same type from the pool of the parent's store and
+    reinitializes it in place according to `Agent.CLONE_POLICY`: arrays and brain parameters are copied into
+    the existing buffers, lists are cleared instead of reallocated. Do not keep references to dead agents when
+    pooling is enabled, they come back to life as somebody's child.
+
+    Example:
+
+    pool = eevolve.AgentPool(capacity=512)
+    game = eevolve.Game(..., agent_pool=pool)
+
+    game.run_steps(10_000, 16)
+    print(pool.hit_rate, len(pool))
+    """
+
+    DEFAULT_CAPACITY = 1024
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 0:
+            raise ValueError(f"Capacity must be non-negative. {capacity} given instead!")
+
+        self._capacity = capacity
+        self._free: dict[type, list[Any]] = {}
+        self._size = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._released = 0
+        self._dropped = 0
+
+    def release(self, agent: Any) -> bool:
+        """
+        Puts the agent into the pool, it is dropped if the pool is full.
+
+        :param agent: Agent removed from the `Board`.
+        :return: True if the agent was pooled.
+        """
+        if self._size >= self._capacity:
+            self._dropped += 1
+            return False
+
+        self._free.setdefault(type(agent), []).append(agent)
+        self._size += 1
+        self._released += 1
+
+        return True
+
+    def acquire(self, agent_type: type) -> Any | None:
+        """
+        :param agent_type: Exact type of the agent to get.
+        :return: Pooled agent of the given type or None if there is no such agent.
+        """
+        free = self._free.get(agent_type)
+
+        if not free:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._size -= 1
+
+        return free.pop()
+
+    def clear(self) -> None:
+        self._free.clear()
+        self._size = 0
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "size": self._size,
+            "capacity": self._capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self.hit_rate,
+            "released": self._released,
+            "dropped": self._dropped,
+        }
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self._hits + self._misses
+
+        return self._hits / requests if requests > 0 else 0.0
+
+    @property
+    def released(self) -> int:
+        return self._released
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,210 @@
+from typing import Any, Sequence
+
+import numpy
+import pygame
+
+
+class Renderer:
+    """
+    Batched drawing helpers used by `Game`: agent sprites are submitted with one `Surface.fblits` call, rectangle
+    outlines and thick lines of the whole population are rasterized with NumPy directly into the surface pixels.
+    Surfaces which can not be referenced as a 2D pixel array, e.g. 24-bit ones, are drawn with `pygame.draw` calls
+    instead.
+    """
+
+    MAX_LINE_LENGTH = 4096
+
+    _DEFAULT_DRAW: dict[tuple[type, Any], bool] = {}
+
+    @staticmethod
+    def agent_blits(agents: Sequence[Any], positions: numpy.ndarray,
+                    default_draw: Any = None) -> tuple[list[tuple[pygame.Surface, Any]], list[Any]]:
+        """
+        Splits agents into a blit sequence and agents which override `draw` and must draw themselves.
+
+        Example:
+
+        sequence, custom = Renderer.agent_blits(store.agents, store.positions, Agent.draw)
+        display.fblits(sequence)
+
+        for agent in custom:
+            agent.draw(display)
+
+        :param agents: Agents to draw.
+        :param positions: Array of shape (N, 2) with top left corners of the agents.
+        :param default_draw: Default `draw` function, agents whose type overrides it are returned separately.
+        :return: Sequence of (surface, position) pairs and list of agents with custom `draw`.
+        """
+        sequence, custom = [], []
+        default_types = Renderer._DEFAULT_DRAW
+
+        for agent, position in zip(agents, positions.tolist()):
+            agent_type = type(agent)
+            is_default = default_types.get((agent_type, default_draw))
+
+            if is_default is None:
+                is_default = default_types[agent_type, default_draw] = \
+                    default_draw is None or agent_type.draw is default_draw
+
+            if is_default:
+                sequence.append((agent.surface, position))
+            else:
+                custom.append(agent)
+
+        return sequence, custom
+
+    @staticmethod
+    def rect_outlines(surface: pygame.Surface, rects: numpy.ndarray, colors: numpy.ndarray | Sequence[int]) -> None:
+        """
+        Draws one pixel wide outlines of rectangles.
+
+        :param surface: Surface to draw on.
+        :param rects: Array of shape (N, 4) with (x, y, width, height) rows.
+        :param colors: Array of shape (N, 3) with colors of the rectangles or a single color.
+        :return: None
+        """
+        rects = numpy.asarray(rects, dtype=float).reshape(-1, 4)
+        colors = numpy.broadcast_to(numpy.asarray(colors, dtype=numpy.uint8), (len(rects), 3))
+
+        if len(rects) == 0:
+            return
+
+        left, top = numpy.floor(rects[:, 0]).astype(numpy.intp), numpy.floor(rects[:, 1]).astype(numpy.intp)
+        right = left + numpy.maximum(numpy.round(rects[:, 2]).astype(numpy.intp), 1) - 1
+        bottom = top + numpy.maximum(numpy.round(rects[:, 3]).astype(numpy.intp), 1) - 1
+
+        widths, heights = right - left + 1, bottom - top + 1
+
+        x_spans = Renderer._spans(left, widths)
+        y_spans = Renderer._spans(top, heights)
+
+        xs = numpy.concatenate((x_spans, x_spans, numpy.repeat(left, heights), numpy.repeat(right, heights)))
+        ys = numpy.concatenate((numpy.repeat(top, widths), numpy.repeat(bottom, widths), y_spans, y_spans))
+
+        palette, indexes = numpy.unique(colors, axis=0, return_inverse=True)
+        indexes = indexes.reshape(-1)
+        pixel_indexes = numpy.concatenate((numpy.repeat(indexes, widths), numpy.repeat(indexes, widths),
+                                           numpy.repeat(indexes, heights), numpy.repeat(indexes, heights)))
+
+        if not Renderer._put_pixels(surface, xs, ys, palette, pixel_indexes):
+            for rect, color in zip(rects.tolist(), colors.tolist()):
+                pygame.draw.rect(surface, color, rect, width=1)
+
+    @staticmethod
+    def lines(surface: pygame.Surface, starts: numpy.ndarray, ends: numpy.ndarray, color: Sequence[int],
+              width: int = 1) -> None:
+        """
+        Draws lines `width` pixels thick, the thickness is added along the minor axis of every line like
+        `pygame.draw.line` does. Lines are clipped to the surface first, lines with non-finite ends are skipped and
+        lines still longer than `MAX_LINE_LENGTH` pixels are drawn with `pygame.draw.line`.
+
+        :param surface: Surface to draw on.
+        :param starts: Array of shape (N, 2) with start points.
+        :param ends: Array of shape (N, 2) with end points.
+        :param color: Color of all lines.
+        :param width: Width of the lines in pixels.
+        :return: None
+        """
+        starts = numpy.asarray(starts, dtype=float).reshape(-1, 2)
+        ends = numpy.asarray(ends, dtype=float).reshape(-1, 2)
+
+        starts, ends = Renderer._clip_lines(starts, ends, surface.get_size(), width // 2 + 1)
+        starts, ends = numpy.floor(starts), numpy.floor(ends)
+        deltas = ends - starts
+
+        long = numpy.abs(deltas).max(axis=1) > Renderer.MAX_LINE_LENGTH
+
+        if long.any():
+            for start, end in zip(starts[long].tolist(), ends[long].tolist()):
+                pygame.draw.line(surface, color, start, end, width)
+
+            starts, ends, deltas = starts[~long], ends[~long], deltas[~long]
+
+        if len(starts) == 0:
+            return
+
+        lengths = numpy.abs(deltas).max(axis=1).astype(numpy.intp) + 1
+
+        # Ends are whole pixels and steps are multiplied before the division, so the major axis advances by exactly
+        # one pixel per step, `steps / length * delta` may round below an integer and leave gaps.
+        steps = Renderer._spans(numpy.zeros_like(lengths), lengths)
+        shifts = steps[:, None] * numpy.repeat(deltas, lengths, axis=0) / \
+            numpy.repeat(numpy.maximum(lengths - 1, 1), lengths)[:, None]
+        points = numpy.floor(numpy.repeat(starts, lengths, axis=0) + shifts).astype(numpy.intp)
+
+        minor_axis = numpy.repeat(numpy.abs(deltas[:, 0]) >= numpy.abs(deltas[:, 1]), lengths).astype(numpy.intp)
+        offsets = numpy.arange(width) - width // 2
+
+        xs = (points[:, 0, None] + offsets[None, :] * (1 - minor_axis)[:, None]).reshape(-1)
+        ys = (points[:, 1, None] + offsets[None, :] * minor_axis[:, None]).reshape(-1)
+
+        palette = numpy.asarray(color, dtype=numpy.uint8).reshape(1, 3)
+
+        if not Renderer._put_pixels(surface, xs, ys, palette, numpy.zeros((len(xs),), dtype=numpy.intp)):
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                pygame.draw.line(surface, color, start, end, width)
+
+    @staticmethod
+    def _clip_lines(starts: numpy.ndarray, ends: numpy.ndarray, size: tuple[int, int],
+                    padding: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+        finite = numpy.isfinite(starts).all(axis=1) & numpy.isfinite(ends).all(axis=1)
+        starts, ends = starts[finite], ends[finite]
+        deltas = ends - starts
+
+        # Liang-Barsky clipping against the surface rect grown by `padding` pixels, so thick lines keep their
+        # edge pixels near the borders.
+        lower = numpy.full(len(starts), 0.0)
+        upper = numpy.full(len(starts), 1.0)
+        visible = numpy.ones(len(starts), dtype=bool)
+
+        for axis in (0, 1):
+            minimum, maximum = -padding, size[axis] - 1 + padding
+
+            for directions, distances in ((-deltas[:, axis], starts[:, axis] - minimum),
+                                          (deltas[:, axis], maximum - starts[:, axis])):
+                parallel = directions == 0
+                visible &= ~parallel | (distances >= 0)
+
+                with numpy.errstate(divide="ignore", invalid="ignore"):
+                    ratios = distances / directions
+
+                entering = directions < 0
+                lower = numpy.where(entering, numpy.maximum(lower, ratios), lower)
+                upper = numpy.where(~entering & ~parallel, numpy.minimum(upper, ratios), upper)
+
+        visible &= lower <= upper
+        starts, ends, deltas = starts[visible], ends[visible], deltas[visible]
+        lower, upper = lower[visible, None], upper[visible, None]
+
+        clipped_starts = numpy.where(lower > 0, starts + lower * deltas, starts)
+        clipped_ends = numpy.where(upper < 1, starts + upper * deltas, ends)
+
+        return clipped_starts, clipped_ends
+
+    @staticmethod
+    def _spans(starts: numpy.ndarray, lengths: numpy.ndarray) -> numpy.ndarray:
+        total = int(lengths.sum())
+        offsets = numpy.cumsum(lengths) - lengths
+
+        return numpy.arange(total) - numpy.repeat(offsets - starts, lengths)
+
+    @staticmethod
+    def _put_pixels(surface: pygame.Surface, xs: numpy.ndarray, ys: numpy.ndarray, palette: numpy.ndarray,
+                    indexes: numpy.ndarray) -> bool:
+        if surface.get_bytesize() not in (1, 2, 4):
+            return False
+
+        try:
+            pixels = pygame.surfarray.pixels2d(surface)
+        except (ValueError, pygame.error):
+            return False
+
+        mapped = numpy.array([surface.map_rgb(tuple(color)) for color in palette.tolist()], dtype=pixels.dtype)
+
+        width, height = surface.get_size()
+        mask = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+
+        pixels[xs[mask], ys[mask]] = mapped[indexes[mask]]
+        del pixels
+
+        return True
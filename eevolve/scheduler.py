@@ -0,0 +1,156 @@
+import heapq
+import itertools
+import time
+from typing import Callable, Any
+
+from eevolve.constants import HIGHEST_TASK_PRIORITY, LOWEST_TASK_PRIORITY
+from eevolve.stats import TimingStats
+from eevolve.task import Task
+
+
+class _ScheduledTask:
+    __slots__ = ("task", "invoke", "sequence", "last_time", "executions", "alive")
+
+    def __init__(self, task: Task, invoke: Callable[[Task], Any], sequence: int, last_time: float) -> None:
+        self.task = task
+        self.invoke = invoke
+        self.sequence = sequence
+        self.last_time = last_time
+        self.executions = 0
+        self.alive = True
+
+
+class TaskScheduler:
+    """
+    Runs tasks when they are due, keeping due times in one min-heap per priority.
+
+    Every task is registered with its invocation function, so nothing is decided per frame, and only tasks whose
+    due time has come are touched. Tasks of higher priority run first, due tasks of the same priority run in
+    the registration order. Removed tasks are dropped lazily when their heap entry comes up. If `stats` is given,
+    wall time of every task invocation is recorded into it with the task as a section key, the section is discarded
+    when the task is removed or dies.
+
+    Example:
+
+    scheduler = TaskScheduler()
+    scheduler.add(task, lambda t: t())
+
+    scheduler.advance(16)
+    scheduler.run_due()
+
+    print(scheduler.executions(task))
+    """
+
+    def __init__(self, stats: TimingStats = None) -> None:
+        self._stats = stats
+        self._time = 0.0
+        self._heaps: list[list[tuple[float, int, _ScheduledTask]]] = \
+            [[] for _ in range(LOWEST_TASK_PRIORITY - HIGHEST_TASK_PRIORITY + 1)]
+        self._entries: dict[Task, _ScheduledTask] = {}
+        self._sequence = itertools.count()
+
+    def add(self, task: Task, invoke: Callable[[Task], Any]) -> None:
+        """
+        Schedules the task, it becomes due after its interval elapses from now.
+
+        :param task: Task to schedule.
+        :param invoke: Function called with the task when it is due.
+        :return: None
+        """
+        previous = self._entries.pop(task, None)
+
+        if previous is not None:
+            previous.alive = False
+
+        entry = _ScheduledTask(task, invoke, next(self._sequence), self._time)
+
+        self._entries[task] = entry
+        heapq.heappush(self._heaps[task.priority], (self._time + task.interval, entry.sequence, entry))
+
+    def remove(self, task: Task) -> bool:
+        """
+        Unschedules the task and drops its timing statistics.
+
+        :param task: Task to remove.
+        :return: True if the task was scheduled, False otherwise.
+        """
+        entry = self._entries.pop(task, None)
+
+        if entry is None:
+            return False
+
+        entry.alive = False
+
+        if self._stats is not None:
+            self._stats.discard(task)
+
+        return True
+
+    def advance(self, delta_time_ms: int | float) -> None:
+        self._time += delta_time_ms
+
+    def run_due(self) -> None:
+        """
+        Invokes all due tasks, priority by priority, and reschedules them or drops the dead ones.
+
+        :return: None
+        """
+        for heap in self._heaps:
+            if not heap or heap[0][0] > self._time:
+                continue
+
+            due = []
+
+            while heap and heap[0][0] <= self._time:
+                entry = heapq.heappop(heap)[2]
+
+                if entry.alive:
+                    due.append(entry)
+
+            due.sort(key=lambda scheduled: scheduled.sequence)
+
+            for entry in due:
+                if not entry.alive:
+                    continue
+
+                task = entry.task
+                task.timer = self._time - entry.last_time
+
+                if self._stats is not None:
+                    start = time.perf_counter()
+                    entry.invoke(task)
+                    self._stats.record(task, time.perf_counter() - start)
+                else:
+                    entry.invoke(task)
+
+                entry.executions += 1
+                entry.last_time = self._time
+                task.timer = 0
+
+                if task.is_dead:
+                    self.remove(task)
+                elif entry.alive:
+                    heapq.heappush(heap, (self._time + task.interval, entry.sequence, entry))
+
+    def executions(self, task: Task) -> int:
+        entry = self._entries.get(task)
+
+        return entry.executions if entry is not None else 0
+
+    @property
+    def execution_counts(self) -> dict[Task, int]:
+        return {task: entry.executions for task, entry in self._entries.items()}
+
+    @property
+    def tasks(self) -> list[Task]:
+        return list(self._entries)
+
+    @property
+    def time(self) -> float:
+        return self._time
+
+    def __contains__(self, task: Task) -> bool:
+        return task in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,476 @@
+import math
+from itertools import combinations
+from typing import Any, Iterator, Sequence
+
+import numpy
+
+from eevolve.agent import Agent
+
+
+class SpatialIndex:
+    """
+    Base class for the structures `Board` keeps its agents in.
+
+    An index stores agents by their position (top left corner) and answers two kinds of queries: all agents whose
+    position lies inside a half-open region `[lower, upper)` and all pairs of agents that share a cell.
+    `Board` only talks to its agents storage through this interface, so every `board_checks` mode works with any
+    subclass.
+
+    Example:
+
+    index = QuadTreeIndex((0, 0, 1920, 1080))
+    board = Board((192, 108), 10, spatial_index=index)
+    """
+
+    def insert(self, agent: Agent | Any) -> None:
+        raise NotImplementedError
+
+    def remove(self, agent: Agent | Any) -> None:
+        raise NotImplementedError
+
+    def move(self, agent: Agent | Any) -> None:
+        """
+        Updates agent location in the index after its position has changed.
+
+        :param agent: Agent which is already stored in the index.
+        :return: None
+        """
+        raise NotImplementedError
+
+    def move_many(self, agents: Sequence[Agent | Any], positions: numpy.ndarray) -> None:
+        """
+        Updates locations of many agents at once.
+
+        :param agents: Agents which are already stored in the index.
+        :param positions: Array of shape (N, 2) with current agents positions, in the same order as `agents`.
+        :return: None
+        """
+        for agent in agents:
+            self.move(agent)
+
+    def query_range(self, lower: Sequence[float | int], upper: Sequence[float | int]) -> list[Agent | Any]:
+        raise NotImplementedError
+
+    def query_pairs(self) -> list[tuple[Agent | Any, Agent | Any]]:
+        raise NotImplementedError
+
+    def cells(self) -> Iterator[tuple[Any, tuple[float, float, float, float], list[Agent | Any]]]:
+        """
+        Iterates over index cells.
+
+        :return: Generator object that yields `(key, (x, y, width, height), agents)` for every cell.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __contains__(self, agent: Agent | Any) -> bool:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class HashedGridIndex(SpatialIndex):
+    """
+    Sparse uniform grid, only non-empty cells are stored in a dictionary keyed by cell coordinates.
+    Suits huge, mostly empty worlds where a dense grid would hold a lot of empty cells.
+
+    Every agent remembers its slot in the cell list, so removing it from a cell is a swap with the last agent
+    of that cell instead of a linear search.
+    """
+
+    def __init__(self, cell_size: tuple[int | float, int | float]) -> None:
+        if cell_size[0] <= 0 or cell_size[1] <= 0:
+            raise ValueError(f"Cell size must be positive. {cell_size} given instead!")
+
+        self._cell_width, self._cell_height = cell_size
+        self._cells: dict[tuple[int, int], list[Agent]] = {}
+        self._cell_of: dict[Agent, tuple[int, int]] = {}
+        self._slot_of: dict[Agent, int] = {}
+
+    def cell_index(self, position: Sequence[float | int]) -> tuple[int, int]:
+        return self._clamp(math.floor(position[0] / self._cell_width), math.floor(position[1] / self._cell_height))
+
+    def insert(self, agent: Agent | Any) -> None:
+        if agent in self._cell_of:
+            return
+
+        self._append(self.cell_index(agent.position), agent)
+
+    def remove(self, agent: Agent | Any) -> None:
+        key = self._cell_of.pop(agent, None)
+
+        if key is None:
+            return
+
+        self._discard(key, agent)
+
+    def move(self, agent: Agent | Any) -> None:
+        old_key = self._cell_of.get(agent)
+
+        if old_key is None:
+            return
+
+        new_key = self.cell_index(agent.position)
+
+        if old_key != new_key:
+            self._discard(old_key, agent)
+            self._append(new_key, agent)
+
+    def move_many(self, agents: Sequence[Agent | Any], positions: numpy.ndarray) -> None:
+        """
+        Re-bins all agents of the index in one pass. Cell indices of every agent are computed with a single NumPy
+        operation, agents are sorted by cell and every cell list is filled with one slice of the sorted agents.
+
+        If `agents` are not exactly all agents of the index, agents are moved one by one instead.
+        """
+        if len(agents) != len(self._cell_of) or len(agents) == 0:
+            super().move_many(agents, positions)
+            return
+
+        cells = numpy.floor(numpy.asarray(positions, dtype=float) /
+                            (self._cell_width, self._cell_height)).astype(numpy.int64)
+        cells = self._clamp_array(cells)
+
+        order = numpy.lexsort((cells[:, 1], cells[:, 0]))
+        cells = cells[order]
+
+        boundaries = numpy.flatnonzero(numpy.any(cells[1:] != cells[:-1], axis=1)) + 1
+        starts = numpy.concatenate(([0], boundaries))
+        ends = numpy.concatenate((boundaries, [len(cells)]))
+        slots = numpy.arange(len(cells)) - numpy.repeat(starts, ends - starts)
+
+        ordered = [agents[index] for index in order.tolist()]
+        keys = list(map(tuple, cells.tolist()))
+
+        self.clear()
+
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            self._bucket(keys[start]).extend(ordered[start:end])
+
+        self._cell_of.update(zip(ordered, keys))
+        self._slot_of.update(zip(ordered, slots.tolist()))
+
+    def query_range(self, lower: Sequence[float | int], upper: Sequence[float | int]) -> list[Agent | Any]:
+        result = []
+
+        x_min, y_min = self.cell_index(lower)
+        x_max, y_max = self._clamp(math.ceil(upper[0] / self._cell_width) - 1,
+                                   math.ceil(upper[1] / self._cell_height) - 1)
+
+        for i in range(x_min, x_max + 1):
+            inside_x = lower[0] <= i * self._cell_width and (i + 1) * self._cell_width <= upper[0]
+
+            for j in range(y_min, y_max + 1):
+                cell = self._cell_at(i, j)
+
+                if not cell:
+                    continue
+
+                if inside_x and lower[1] <= j * self._cell_height and (j + 1) * self._cell_height <= upper[1]:
+                    result.extend(cell)
+                else:
+                    result.extend(agent for agent in cell
+                                  if lower[0] <= agent.position[0] < upper[0]
+                                  and lower[1] <= agent.position[1] < upper[1])
+
+        return result
+
+    def query_pairs(self) -> list[tuple[Agent | Any, Agent | Any]]:
+        pairs = []
+
+        for _, _, cell in self.cells():
+            if len(cell) < 2:
+                continue
+
+            pairs.extend(combinations(cell, 2))
+
+        return pairs
+
+    def cells(self) -> Iterator[tuple[Any, tuple[float, float, float, float], list[Agent | Any]]]:
+        for (i, j), cell in self._cells.items():
+            yield (i, j), self._cell_bounds(i, j), cell
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._cell_of.clear()
+        self._slot_of.clear()
+
+    def _clamp(self, i: int, j: int) -> tuple[int, int]:
+        return i, j
+
+    def _clamp_array(self, cells: numpy.ndarray) -> numpy.ndarray:
+        return cells
+
+    def _cell_bounds(self, i: int, j: int) -> tuple[float, float, float, float]:
+        return i * self._cell_width, j * self._cell_height, self._cell_width, self._cell_height
+
+    def _cell_at(self, i: int, j: int) -> list[Agent] | None:
+        return self._cells.get((i, j))
+
+    def _bucket(self, key: tuple[int, int]) -> list[Agent]:
+        cell = self._cells.get(key)
+
+        if cell is None:
+            cell = self._cells[key] = []
+
+        return cell
+
+    def _append(self, key: tuple[int, int], agent: Agent) -> None:
+        cell = self._bucket(key)
+
+        self._cell_of[agent] = key
+        self._slot_of[agent] = len(cell)
+        cell.append(agent)
+
+    def _discard(self, key: tuple[int, int], agent: Agent) -> None:
+        cell = self._bucket(key)
+        slot = self._slot_of.pop(agent)
+        last = cell.pop()
+
+        if last is not agent:
+            cell[slot] = last
+            self._slot_of[last] = slot
+
+        if not cell:
+            self._drop(key)
+
+    def _drop(self, key: tuple[int, int]) -> None:
+        del self._cells[key]
+
+    @property
+    def cell_size(self) -> tuple[int | float, int | float]:
+        return self._cell_width, self._cell_height
+
+    def __contains__(self, agent: Agent | Any) -> bool:
+        return agent in self._cell_of
+
+    def __len__(self) -> int:
+        return len(self._cell_of)
+
+
+class GridIndex(HashedGridIndex):
+    """
+    Dense `cells_number x cells_number` grid of agent lists. Positions outside the grid are clamped
+    to the border cells.
+    """
+
+    def __init__(self, cell_size: tuple[int | float, int | float], cells_number: int) -> None:
+        super().__init__(cell_size)
+
+        if cells_number <= 0:
+            raise ValueError(f"Cells number must be positive. {cells_number} given instead!")
+
+        self._cells_number = cells_number
+        self._cells: list[list[list[Agent]]] = [[[] for _ in range(cells_number)] for _ in range(cells_number)]
+
+    def _clamp(self, i: int, j: int) -> tuple[int, int]:
+        return min(max(i, 0), self._cells_number - 1), min(max(j, 0), self._cells_number - 1)
+
+    def _clamp_array(self, cells: numpy.ndarray) -> numpy.ndarray:
+        return numpy.clip(cells, 0, self._cells_number - 1)
+
+    def cells(self) -> Iterator[tuple[Any, tuple[float, float, float, float], list[Agent | Any]]]:
+        for i, row in enumerate(self._cells):
+            for j, cell in enumerate(row):
+                yield (i, j), self._cell_bounds(i, j), cell
+
+    def clear(self) -> None:
+        for row in self._cells:
+            for cell in row:
+                cell.clear()
+
+        self._cell_of.clear()
+        self._slot_of.clear()
+
+    def _cell_at(self, i: int, j: int) -> list[Agent] | None:
+        return self._cells[i][j]
+
+    def _bucket(self, key: tuple[int, int]) -> list[Agent]:
+        return self._cells[key[0]][key[1]]
+
+    def _drop(self, key: tuple[int, int]) -> None:
+        pass
+
+    @property
+    def grid(self) -> list[list[list[Agent | Any]]]:
+        return self._cells
+
+
+class _QuadNode:
+    __slots__ = ("bounds", "depth", "parent", "agents", "children")
+
+    def __init__(self, bounds: tuple[float, float, float, float], depth: int,
+                 parent: "_QuadNode | None" = None) -> None:
+        self.bounds = bounds
+        self.depth = depth
+        self.parent = parent
+        self.agents: list[Agent] = []
+        self.children: list["_QuadNode"] | None = None
+
+
+class QuadTreeIndex(SpatialIndex):
+    """
+    Region quadtree, a leaf is split into four quadrants when it holds more than `capacity` agents and merged
+    back when its siblings become sparse. Suits strongly clustered populations, where dense cells of a uniform grid
+    would hold most of the agents. Leaves track agent slots the same way as `HashedGridIndex` cells.
+    """
+
+    def __init__(self, bounds: tuple[int | float, int | float, int | float, int | float],
+                 capacity: int = 8, max_depth: int = 8) -> None:
+        if bounds[2] <= 0 or bounds[3] <= 0:
+            raise ValueError(f"Quadtree bounds must have positive size. {bounds} given instead!")
+        if capacity < 1:
+            raise ValueError(f"Leaf capacity must be positive. {capacity} given instead!")
+
+        self._bounds = tuple(float(value) for value in bounds)
+        self._capacity = capacity
+        self._max_depth = max_depth
+
+        self._root = _QuadNode(self._bounds, 0)
+        self._leaf_of: dict[Agent, _QuadNode] = {}
+        self._slot_of: dict[Agent, int] = {}
+
+    def insert(self, agent: Agent | Any) -> None:
+        if agent in self._leaf_of:
+            return
+
+        self._insert(agent, self._find_leaf(agent.position))
+
+    def remove(self, agent: Agent | Any) -> None:
+        leaf = self._leaf_of.pop(agent, None)
+
+        if leaf is None:
+            return
+
+        self._discard(leaf, agent)
+        self._collapse(leaf.parent)
+
+    def move(self, agent: Agent | Any) -> None:
+        leaf = self._leaf_of.get(agent)
+
+        if leaf is None:
+            return
+
+        new_leaf = self._find_leaf(agent.position)
+
+        if new_leaf is not leaf:
+            self._discard(leaf, agent)
+            self._insert(agent, new_leaf)
+            self._collapse(leaf.parent)
+
+    def query_range(self, lower: Sequence[float | int], upper: Sequence[float | int]) -> list[Agent | Any]:
+        result = []
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            x, y, width, height = node.bounds
+
+            if x >= upper[0] or y >= upper[1] or x + width < lower[0] or y + height < lower[1]:
+                continue
+
+            if node.children is not None:
+                stack.extend(node.children)
+            else:
+                result.extend(agent for agent in node.agents
+                              if lower[0] <= agent.position[0] < upper[0]
+                              and lower[1] <= agent.position[1] < upper[1])
+
+        return result
+
+    def query_pairs(self) -> list[tuple[Agent | Any, Agent | Any]]:
+        pairs = []
+
+        for _, _, agents in self.cells():
+            if len(agents) < 2:
+                continue
+
+            pairs.extend(combinations(agents, 2))
+
+        return pairs
+
+    def cells(self) -> Iterator[tuple[Any, tuple[float, float, float, float], list[Agent | Any]]]:
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+
+            if node.children is not None:
+                stack.extend(node.children)
+            else:
+                yield node.bounds, node.bounds, node.agents
+
+    def clear(self) -> None:
+        self._root = _QuadNode(self._bounds, 0)
+        self._leaf_of.clear()
+        self._slot_of.clear()
+
+    def _find_leaf(self, position: Sequence[float | int]) -> _QuadNode:
+        node = self._root
+
+        while node.children is not None:
+            x, y, width, height = node.bounds
+            node = node.children[(position[0] >= x + width / 2) + 2 * (position[1] >= y + height / 2)]
+
+        return node
+
+    def _insert(self, agent: Agent, leaf: _QuadNode) -> None:
+        self._leaf_of[agent] = leaf
+        self._slot_of[agent] = len(leaf.agents)
+        leaf.agents.append(agent)
+
+        if len(leaf.agents) > self._capacity and leaf.depth < self._max_depth:
+            self._split(leaf)
+
+    def _split(self, node: _QuadNode) -> None:
+        x, y, width, height = node.bounds
+        half_width, half_height = width / 2, height / 2
+
+        node.children = [
+            _QuadNode((x, y, half_width, half_height), node.depth + 1, node),
+            _QuadNode((x + half_width, y, half_width, half_height), node.depth + 1, node),
+            _QuadNode((x, y + half_height, half_width, half_height), node.depth + 1, node),
+            _QuadNode((x + half_width, y + half_height, half_width, half_height), node.depth + 1, node),
+        ]
+
+        agents, node.agents = node.agents, []
+
+        for agent in agents:
+            self._insert(agent, self._find_leaf(agent.position))
+
+    def _collapse(self, node: _QuadNode | None) -> None:
+        while node is not None:
+            if any(child.children is not None for child in node.children):
+                return
+            if sum(len(child.agents) for child in node.children) > self._capacity:
+                return
+
+            for child in node.children:
+                for agent in child.agents:
+                    self._leaf_of[agent] = node
+                    self._slot_of[agent] = len(node.agents)
+                    node.agents.append(agent)
+
+            node.children = None
+            node = node.parent
+
+    def _discard(self, leaf: _QuadNode, agent: Agent) -> None:
+        slot = self._slot_of.pop(agent)
+        last = leaf.agents.pop()
+
+        if last is not agent:
+            leaf.agents[slot] = last
+            self._slot_of[last] = slot
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        return self._bounds
+
+    def __contains__(self, agent: Agent | Any) -> bool:
+        return agent in self._leaf_of
+
+    def __len__(self) -> int:
+        return len(self._leaf_of)
@@ -0,0 +1,144 @@
+from typing import Any, Sequence
+
+import numpy
+
+
+class TimingStats:
+    """
+    Rolling wall-time statistics of named sections: internal board phases, tasks, drawing and whole frames.
+
+    Every section keeps the total number of calls, total time and the last `window` samples in a ring buffer,
+    recording a sample is a couple of dictionary lookups and one array write, so statistics are cheap enough to stay
+    enabled. Sections are keyed by strings for internal phases and by `Task` objects for tasks, sections of removed
+    tasks are discarded, so no samples are kept for tasks that will never run again.
+
+    Example:
+
+    stats = game.stats
+
+    print(stats.percentiles("frame", (50, 99)))    # [0.0041 0.0093] seconds
+
+    for section, report in stats.report().items():
+        print(TimingStats.name_of(section), report["calls"], report["p95"])
+    """
+
+    DEFAULT_WINDOW = 240
+    DEFAULT_PERCENTILES = (50, 95, 99)
+
+    def __init__(self, window: int = DEFAULT_WINDOW, enabled: bool = True) -> None:
+        if window <= 0:
+            raise ValueError(f"Window must be positive. {window} given instead!")
+
+        self._window = window
+        self._enabled = enabled
+
+        self._samples: dict[Any, numpy.ndarray] = {}
+        self._calls: dict[Any, int] = {}
+        self._totals: dict[Any, float] = {}
+
+    def record(self, section: Any, seconds: float) -> None:
+        """
+        Adds one sample to the section, does nothing if statistics are disabled.
+
+        :param section: Section key.
+        :param seconds: Measured wall time in seconds.
+        :return: None
+        """
+        if not self._enabled:
+            return
+
+        samples = self._samples.get(section)
+
+        if samples is None:
+            samples = self._samples[section] = numpy.full((self._window,), numpy.nan)
+            self._calls[section] = 0
+            self._totals[section] = 0.0
+
+        calls = self._calls[section]
+        samples[calls % self._window] = seconds
+
+        self._calls[section] = calls + 1
+        self._totals[section] += seconds
+
+    def percentiles(self, section: Any, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> numpy.ndarray:
+        """
+        :param section: Section key.
+        :param percentiles: Percentiles to compute in range [0, 100].
+        :return: Percentiles of the last `window` samples in seconds, NaN for unknown sections.
+        """
+        samples = self._samples.get(section)
+
+        if samples is None or self._calls[section] == 0:
+            return numpy.full((len(percentiles),), numpy.nan)
+
+        return numpy.nanpercentile(samples, percentiles)
+
+    def mean(self, section: Any) -> float:
+        calls = self._calls.get(section, 0)
+
+        return self._totals[section] / calls if calls > 0 else 0.0
+
+    def calls(self, section: Any) -> int:
+        return self._calls.get(section, 0)
+
+    def total(self, section: Any) -> float:
+        return self._totals.get(section, 0.0)
+
+    def report(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> dict[Any, dict[str, float]]:
+        """
+        :param percentiles: Percentiles to compute for every section.
+        :return: Dictionary of sections with number of calls, total and mean time and rolling percentiles,
+        named `p50`, `p95`, etc., all times in seconds.
+        """
+        report = {}
+
+        for section in self._samples:
+            values = self.percentiles(section, percentiles)
+
+            report[section] = {
+                "calls": self._calls[section],
+                "total": self._totals[section],
+                "mean": self.mean(section),
+                **{f"p{percentile:g}": float(value) for percentile, value in zip(percentiles, values)}
+            }
+
+        return report
+
+    def discard(self, section: Any) -> None:
+        """
+        Forgets all samples of the section, does nothing for unknown sections.
+
+        :param section: Section key.
+        :return: None
+        """
+        self._samples.pop(section, None)
+        self._calls.pop(section, None)
+        self._totals.pop(section, None)
+
+    def clear(self) -> None:
+        self._samples.clear()
+        self._calls.clear()
+        self._totals.clear()
+
+    @staticmethod
+    def name_of(section: Any) -> str:
+        return section if isinstance(section, str) else getattr(section, "name", str(section))
+
+    @property
+    def sections(self) -> list[Any]:
+        return list(self._samples)
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+
+    def __len__(self) -> int:
+        return len(self._samples)
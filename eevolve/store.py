@@ -0,0 +1,287 @@
+import itertools
+import weakref
+from typing import Any
+
+import numpy
+
+
+class AgentStore:
+    """
+    Struct-of-arrays storage of agents physical state.
+
+    Positions, sizes, velocities, dead flags, border collision bitmasks and flags, board sector indexes,
+    collision radii and unique ids of all agents are kept in contiguous arrays, one row per agent. `Agent` objects
+    only keep a reference to the store and their row index, so whole populations can be processed with single NumPy
+    operations on `positions`, `velocities`, etc.
+
+    Agents which are not on a `Board` share one detached store returned by `AgentStore.detached`, `Board.add_agent`
+    moves the row into the board store and `Board.remove_agent` moves it back. Rows are removed with a swap of the last
+    row into the freed one, so row indexes of the remaining agents may change, arrays may be reallocated when
+    the store grows. Do not hold array views or row indexes across frames.
+
+    Example:
+
+    store = game.board.store
+
+    store.velocities[:] *= 0.99
+    fastest = store.agents[numpy.argmax((store.velocities ** 2).sum(axis=1))]
+    """
+
+    INITIAL_CAPACITY = 64
+    COLUMNS = ("_positions", "_sizes", "_velocities", "_dead", "_border", "_border_flags", "_sectors", "_radii",
+               "_uids")
+
+    _uid_counter = itertools.count()
+    _detached: "AgentStore | None" = None
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        capacity = max(capacity, 1)
+
+        self._length = 0
+        self._agents: list[Any] = []
+        self._pool = None
+
+        self._positions = numpy.zeros((capacity, 2), dtype=numpy.float64)
+        self._sizes = numpy.zeros((capacity, 2), dtype=numpy.float64)
+        self._velocities = numpy.zeros((capacity, 2), dtype=numpy.float64)
+        self._dead = numpy.zeros((capacity,), dtype=bool)
+        self._border = numpy.zeros((capacity,), dtype=numpy.uint8)
+        self._border_flags = numpy.zeros((capacity,), dtype=bool)
+        self._sectors = numpy.zeros((capacity, 2), dtype=numpy.int64)
+        self._radii = numpy.zeros((capacity,), dtype=numpy.float64)
+        self._uids = numpy.zeros((capacity,), dtype=numpy.int64)
+
+    def allocate(self, agent: Any) -> int:
+        """
+        Appends zero-filled row for the agent. The agent is not rebound, use `attach` to move an existing agent.
+
+        :param agent: Agent which will own the row.
+        :return: Index of the new row.
+        """
+        if self._length == len(self._positions):
+            self._grow(2 * len(self._positions))
+
+        row = self._length
+        self._length += 1
+        self._agents.append(agent)
+
+        for column in AgentStore.COLUMNS:
+            getattr(self, column)[row] = 0
+
+        self._sectors[row] = -1
+        self._radii[row] = numpy.nan
+
+        return row
+
+    def release(self, row: int) -> None:
+        """
+        Removes the row, the last row is moved into its place and its agent is rebound to the new row index.
+
+        :param row: Index of the row to remove.
+        :return: None
+        """
+        if row < 0 or row >= self._length:
+            raise ValueError(f"Row must be in bounds [0, {self._length}). {row} given instead!")
+
+        last = self._length - 1
+
+        if row != last:
+            for column in AgentStore.COLUMNS:
+                array = getattr(self, column)
+                array[row] = array[last]
+
+            moved = self._agents[last]
+            self._agents[row] = moved
+            moved._bind(self, row)
+
+        self._agents.pop()
+        self._length -= 1
+
+    def attach(self, agent: Any) -> None:
+        """
+        Moves agent row from its current store into this one.
+
+        :param agent: Agent to move.
+        :return: None
+        """
+        source, source_row = agent.store, agent.row
+
+        if source is self:
+            return
+
+        row = self.allocate(agent)
+
+        if source is not None:
+            self.copy_row(source, source_row, row)
+            source.release(source_row)
+
+        agent._bind(self, row)
+
+    def detach(self, agent: Any) -> None:
+        """
+        Moves agent row into the shared detached store.
+
+        :param agent: Agent to move.
+        :return: None
+        """
+        if agent.store is not self:
+            return
+
+        AgentStore.detached().attach(agent)
+
+    def copy_row(self, source: "AgentStore", source_row: int, row: int) -> None:
+        for column in AgentStore.COLUMNS:
+            getattr(self, column)[row] = getattr(source, column)[source_row]
+
+    @staticmethod
+    def new_uid() -> int:
+        return next(AgentStore._uid_counter)
+
+    @staticmethod
+    def detached() -> "AgentStore":
+        """
+        :return: Store shared by all agents which are not on a `Board`, it references agents weakly and frees rows
+        of garbage collected agents.
+        """
+        if AgentStore._detached is None:
+            AgentStore._detached = _DetachedStore()
+
+        return AgentStore._detached
+
+    def _grow(self, capacity: int) -> None:
+        for column in AgentStore.COLUMNS:
+            array = getattr(self, column)
+            grown = numpy.zeros((capacity, *array.shape[1:]), dtype=array.dtype)
+            grown[:self._length] = array[:self._length]
+
+            setattr(self, column, grown)
+
+    @property
+    def agents(self) -> list[Any]:
+        return self._agents
+
+    @property
+    def positions(self) -> numpy.ndarray:
+        return self._positions[:self._length]
+
+    @property
+    def sizes(self) -> numpy.ndarray:
+        return self._sizes[:self._length]
+
+    @property
+    def velocities(self) -> numpy.ndarray:
+        return self._velocities[:self._length]
+
+    @property
+    def dead(self) -> numpy.ndarray:
+        return self._dead[:self._length]
+
+    @property
+    def border(self) -> numpy.ndarray:
+        return self._border[:self._length]
+
+    @property
+    def border_flags(self) -> numpy.ndarray:
+        """
+        Border collisions set through `Agent.colliding_border` without a direction, they are not part of `border`
+        bitmasks and are cleared when agents move.
+        """
+        return self._border_flags[:self._length]
+
+    @property
+    def sectors(self) -> numpy.ndarray:
+        return self._sectors[:self._length]
+
+    @property
+    def radii(self) -> numpy.ndarray:
+        """
+        Collision radii of `SHAPE_CIRCLE` agents, NaN where the circle inscribed into the agent rectangle is used.
+        """
+        return self._radii[:self._length]
+
+    @property
+    def uids(self) -> numpy.ndarray:
+        return self._uids[:self._length]
+
+    @property
+    def capacity(self) -> int:
+        return len(self._positions)
+
+    @property
+    def pool(self) -> Any:
+        """
+        `AgentPool` used by `Agent.clone` to recycle agents for clones of the agents of this store, or None.
+        """
+        return self._pool
+
+    @pool.setter
+    def pool(self, value: Any) -> None:
+        self._pool = value
+
+    def __len__(self) -> int:
+        return self._length
+
+
+class _DetachedStore(AgentStore):
+    """
+    Store of agents which are not on a `Board`. Agents are referenced weakly, rows of collected agents are released
+    lazily by the next `allocate`, because weak reference callbacks may run in the middle of another store operation.
+    Until then `agents` has None in their rows.
+    """
+
+    def __init__(self, capacity: int = AgentStore.INITIAL_CAPACITY) -> None:
+        super().__init__(capacity)
+
+        self._references: list[weakref.ref] = []
+        self._rows: dict[int, int] = {}
+        self._collected: list[weakref.ref] = []
+
+    def allocate(self, agent: Any) -> int:
+        self._release_collected()
+
+        row = super().allocate(agent)
+        self._agents[row] = None
+
+        reference = weakref.ref(agent, self._collected.append)
+        self._references.append(reference)
+        self._rows[id(reference)] = row
+
+        return row
+
+    def release(self, row: int) -> None:
+        if row < 0 or row >= self._length:
+            raise ValueError(f"Row must be in bounds [0, {self._length}). {row} given instead!")
+
+        last = self._length - 1
+        reference = self._references[row]
+
+        if row != last:
+            for column in AgentStore.COLUMNS:
+                array = getattr(self, column)
+                array[row] = array[last]
+
+            moved = self._references[last]
+            self._references[row] = moved
+            self._rows[id(moved)] = row
+
+            agent = moved()
+
+            if agent is not None:
+                agent._bind(self, row)
+
+        del self._rows[id(reference)]
+        self._references.pop()
+        self._agents.pop()
+        self._length -= 1
+
+    def _release_collected(self) -> None:
+        while self._collected:
+            reference = self._collected.pop()
+            row = self._rows.get(id(reference))
+
+            if row is not None and self._references[row] is reference:
+                self.release(row)
+
+    @property
+    def agents(self) -> list[Any]:
+        return [reference() for reference in self._references]
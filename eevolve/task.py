@@ -1,5 +1,6 @@
 from typing import Callable, Any
 
+import numpy
 from numpy.random.mtrand import Sequence
 
 from eevolve.agent import Agent
@@ -82,10 +83,52 @@ class Task:
         self._args = args
         self._kwargs = kwargs
 
+        self._slices = 1
+        self._slice = 0
+        self._clock = 0.0
+        self._slice_times = [0.0]
+
+    def _set_slices(self, slices: int) -> None:
+        if not isinstance(slices, int) or slices < 1:
+            raise ValueError(f"Slices number must be a positive integer. {slices} given instead!")
+
+        self._slices = slices
+        # Slice k first runs `(k + 1) * interval` after the task is added, backdating its previous run by a whole
+        # period makes the first elapsed time equal to `period`, as without slicing.
+        interval = self._period_ms / slices
+        self._slice_times = [(index + 1) * interval - self._period_ms for index in range(slices)]
+
+    def next_slice(self) -> tuple[int, float]:
+        """
+        Advances the task to its next slice, called once per invocation of a sliced task.
+
+        :return: Index of the slice to process and seconds elapsed since the same slice was processed last time.
+        """
+        self._clock += self._timer
+
+        index = self._slice
+        elapsed = self._clock - self._slice_times[index]
+
+        self._slice_times[index] = self._clock
+        self._slice = (index + 1) % self._slices
+
+        return index, elapsed / 1000.0
+
     @property
     def period(self) -> float:
         return self._period_ms
 
+    @property
+    def interval(self) -> float:
+        """
+        :return: Milliseconds between invocations of the task, `period` divided by the number of slices.
+        """
+        return self._period_ms / self._slices
+
+    @property
+    def slices(self) -> int:
+        return self._slices
+
     @property
     def timer(self) -> float:
         return self._timer
@@ -110,6 +153,10 @@ class Task:
     def priority(self) -> int:
         return self._priority
 
+    @property
+    def name(self) -> str:
+        return getattr(self._function, "__name__", type(self._function).__name__)
+
     def __call__(self, *args, **kwargs) -> Any:
         if self._execution_number == 0:
             return
@@ -137,9 +184,23 @@ class CollisionTask(Task):
 
 
 class AgentTask(Task):
+    """
+    The handler is called for every board agent with the agent and the elapsed time in seconds.
+
+    With `slices` greater than 1 the population is split by agent unique ids into `slices` groups and only one group
+    is processed per invocation, every `period_ms / slices` milliseconds, so every agent is still handled once per
+    `period_ms`, but the work is spread over the period instead of spiking once. The elapsed time passed
+    to the handler is the time since the group of the agent was processed last time.
+
+    Example:
+
+    game.add_task(eevolve.AgentTask(decide_handler, 250, slices=4))    # a quarter of agents every 62.5 ms
+    """
+
     def __init__(self, function: Callable[[Agent | Any, float], Any], period_ms: int, execution_number: int = -1,
-                 priority: int = HIGHEST_TASK_PRIORITY, *args, **kwargs):
+                 priority: int = HIGHEST_TASK_PRIORITY, *args, slices: int = 1, **kwargs):
         super().__init__(function, period_ms, execution_number, priority, *args, **kwargs)
+        self._set_slices(slices)
 
 
 class FrameEndTask(Task):
@@ -161,6 +222,137 @@ class BorderCollisionTask(Task):
         super().__init__(function, period_ms, execution_number, priority, *args, **kwargs)
 
 class AroundAgentTask(Task):
+    """
+    The handler is called for every board agent with the agent, the agents around it and the elapsed time
+    in seconds. `slices` spreads the population over the period the same way as in `AgentTask`.
+    """
+
     def __init__(self, function: Callable[[Agent | Any, Sequence[Agent | Any], float], Any], period_ms: int, execution_number: int = -1,
+                 priority: int = HIGHEST_TASK_PRIORITY, *args, slices: int = 1, **kwargs):
+        super().__init__(function, period_ms, execution_number, priority, *args, **kwargs)
+        self._set_slices(slices)
+
+
+class BatchAgentTask(Task):
+    """
+    Batched counterpart of `AgentTask`, the handler is called once per period for the whole population with
+    an array of `board.store` rows and the elapsed time.
+
+    Example:
+
+    def friction_handler(indexes: numpy.ndarray, dt: float) -> None:
+        game.board.store.velocities[indexes] *= 1.0 - 0.5 * dt
+    """
+
+    def __init__(self, function: Callable[[numpy.ndarray, float], Any], period_ms: int, execution_number: int = -1,
                  priority: int = HIGHEST_TASK_PRIORITY, *args, **kwargs):
         super().__init__(function, period_ms, execution_number, priority, *args, **kwargs)
+
+
+class BatchAroundAgentTask(Task):
+    """
+    Batched counterpart of `AroundAgentTask`, the handler gets an array of `board.store` rows, neighbours of all
+    agents packed into compressed sparse rows `(offsets, neighbours)` and the elapsed time. Neighbours of the agent
+    `indexes[i]` are `neighbours[offsets[i]:offsets[i + 1]]`.
+
+    Example:
+
+    def crowd_handler(indexes: numpy.ndarray, around: tuple[numpy.ndarray, numpy.ndarray], dt: float) -> None:
+        offsets, neighbours = around
+        crowd = numpy.diff(offsets)
+    """
+
+    def __init__(self, function: Callable[[numpy.ndarray, tuple[numpy.ndarray, numpy.ndarray], float], Any],
+                 period_ms: int, execution_number: int = -1, priority: int = HIGHEST_TASK_PRIORITY, *args, **kwargs):
+        super().__init__(function, period_ms, execution_number, priority, *args, **kwargs)
+
+
+class BatchPairTask(Task):
+    """
+    Batched counterpart of `PairTask`, the handler gets two arrays of `board.store` rows, `first[i]` and `second[i]`
+    are the agents of the i-th sector pair, and the elapsed time.
+    """
+
+    def __init__(self, function: Callable[[numpy.ndarray, numpy.ndarray, float], Any], period_ms: int,
+                 execution_number: int = -1, priority: int = HIGHEST_TASK_PRIORITY, *args, **kwargs):
+        super().__init__(function, period_ms, execution_number, priority, *args, **kwargs)
+
+
+class BatchCollisionTask(Task):
+    """
+    Batched counterpart of `CollisionTask`, the handler gets two arrays of `board.store` rows of the collided pairs
+    and the elapsed time.
+    """
+
+    def __init__(self, function: Callable[[numpy.ndarray, numpy.ndarray, float], Any], period_ms: int,
+                 execution_number: int = -1, priority: int = HIGHEST_TASK_PRIORITY, *args, **kwargs):
+        super().__init__(function, period_ms, execution_number, priority, *args, **kwargs)
+
+
+class NBodyTask(Task):
+    """
+    Built-in gravity-like interaction of all board agents with each other. Every period accelerations of the agents
+    centers are computed with `BarnesHut.accelerations` and `velocities` of the whole `board.store` are increased by
+    `accelerations * dt` at once. The handler, if given, is called afterwards with an array of `board.store` rows,
+    the accelerations and the elapsed time.
+
+    Example:
+
+    game.add_task(eevolve.NBodyTask(None, 0, theta=0.7, gravity=10.0, masses="mass"))
+
+    :param theta: Opening angle of the Barnes-Hut approximation, 0 gives exact all-pairs forces.
+    :param gravity: Gravitational constant.
+    :param softening: Softening length, keeps accelerations finite when agents get close.
+    :param masses: Masses of the agents: a single mass of all agents, a name of the agents attribute to read
+    the masses from, or a function which gets `board.store` and returns array of the masses.
+    """
+
+    def __init__(self, function: Callable[[numpy.ndarray, numpy.ndarray, float], Any] | None, period_ms: int,
+                 execution_number: int = -1, priority: int = HIGHEST_TASK_PRIORITY, *args,
+                 theta: float = 0.5, gravity: float = 1.0, softening: float = 1.0,
+                 masses: float | str | Callable[[Any], numpy.ndarray] = 1.0, **kwargs):
+        if theta < 0:
+            raise ValueError(f"Opening angle must be non-negative. {theta} given instead!")
+        if softening < 0:
+            raise ValueError(f"Softening must be non-negative. {softening} given instead!")
+
+        super().__init__(function if function is not None else NBodyTask._no_handler, period_ms, execution_number,
+                         priority, *args, **kwargs)
+
+        self._theta = theta
+        self._gravity = gravity
+        self._softening = softening
+        self._masses = masses
+
+    def masses_of(self, store: Any) -> numpy.ndarray | float:
+        """
+        :param store: `AgentStore` of the board.
+        :return: Array of masses of the store agents or a single mass of all of them.
+        """
+        if isinstance(self._masses, str):
+            return numpy.fromiter((getattr(agent, self._masses) for agent in store.agents), dtype=float,
+                                  count=len(store))
+        elif callable(self._masses):
+            return self._masses(store)
+        else:
+            return self._masses
+
+    @staticmethod
+    def _no_handler(*_args) -> None:
+        pass
+
+    @property
+    def theta(self) -> float:
+        return self._theta
+
+    @property
+    def gravity(self) -> float:
+        return self._gravity
+
+    @property
+    def softening(self) -> float:
+        return self._softening
+
+    @property
+    def name(self) -> str:
+        return "n_body" if self._function is NBodyTask._no_handler else super().name
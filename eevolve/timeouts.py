@@ -0,0 +1,153 @@
+import heapq
+from typing import Any
+
+
+class CollisionTimeouts:
+    """
+    Collision cooldowns of agent pairs, only pairs whose cooldown is still active are stored.
+
+    Every agent with an active cooldown gets a compact integer id, ids are reused after all pairs of the agent
+    expired. A pair is keyed by both ids packed into one integer, expiry times are kept in a min-heap, so advancing
+    the clock only touches the pairs which actually expire.
+
+    Example:
+
+    timeouts = CollisionTimeouts()
+    timeouts.activate(agent_1, agent_2, 250)
+
+    timeouts.advance(100)
+    timeouts.is_active(agent_2, agent_1)    # True
+
+    timeouts.advance(150)
+    timeouts.is_active(agent_1, agent_2)    # False
+    """
+
+    ID_BITS = 32
+
+    def __init__(self) -> None:
+        self._time = 0.0
+        self._expires: dict[int, float] = {}
+        self._heap: list[tuple[float, int]] = []
+
+        self._ids: dict[Any, int] = {}
+        self._agent_of: list[Any] = []
+        self._free_ids: list[int] = []
+        self._pairs_of: dict[int, set[int]] = {}
+
+    def is_active(self, agent: Any, other: Any) -> bool:
+        first, second = self._ids.get(agent), self._ids.get(other)
+
+        if first is None or second is None:
+            return False
+
+        return self.pair_key(first, second) in self._expires
+
+    def activate(self, agent: Any, other: Any, timeout: int | float) -> None:
+        """
+        Starts cooldown of the pair, which is active until clock advances by `timeout`.
+        Non-positive timeout does not store anything.
+
+        :param agent: First agent of the pair.
+        :param other: Second agent of the pair.
+        :param timeout: Cooldown duration, in the same units as `advance` argument.
+        :return: None
+        """
+        if timeout <= 0:
+            return
+
+        first, second = self._acquire_id(agent), self._acquire_id(other)
+        key = self.pair_key(first, second)
+        expires = self._time + timeout
+
+        self._expires[key] = expires
+        self._pairs_of[first].add(key)
+        self._pairs_of[second].add(key)
+
+        heapq.heappush(self._heap, (expires, key))
+
+    def advance(self, delta_time: int | float) -> None:
+        self._time += delta_time
+
+        while self._heap and self._heap[0][0] <= self._time:
+            expires, key = heapq.heappop(self._heap)
+
+            if self._expires.get(key) == expires:
+                self._drop(key)
+
+    def purge(self, agent: Any) -> None:
+        """
+        Removes all pairs which involve given agent.
+
+        :param agent: Agent to forget.
+        :return: None
+        """
+        agent_id = self._ids.get(agent)
+
+        if agent_id is None:
+            return
+
+        for key in list(self._pairs_of[agent_id]):
+            self._drop(key)
+
+    def clear(self) -> None:
+        self._expires.clear()
+        self._heap.clear()
+        self._ids.clear()
+        self._agent_of.clear()
+        self._free_ids.clear()
+        self._pairs_of.clear()
+
+    @staticmethod
+    def pair_key(first: int, second: int) -> int:
+        if first > second:
+            first, second = second, first
+
+        return (first << CollisionTimeouts.ID_BITS) | second
+
+    def _acquire_id(self, agent: Any) -> int:
+        agent_id = self._ids.get(agent)
+
+        if agent_id is not None:
+            return agent_id
+
+        if self._free_ids:
+            agent_id = self._free_ids.pop()
+            self._agent_of[agent_id] = agent
+        else:
+            agent_id = len(self._agent_of)
+            self._agent_of.append(agent)
+
+        self._ids[agent] = agent_id
+        self._pairs_of[agent_id] = set()
+
+        return agent_id
+
+    def _drop(self, key: int) -> None:
+        del self._expires[key]
+
+        mask = (1 << CollisionTimeouts.ID_BITS) - 1
+
+        for agent_id in (key >> CollisionTimeouts.ID_BITS, key & mask):
+            pairs = self._pairs_of.get(agent_id)
+
+            if pairs is None:
+                continue
+
+            pairs.discard(key)
+
+            if not pairs:
+                self._release_id(agent_id)
+
+    def _release_id(self, agent_id: int) -> None:
+        del self._pairs_of[agent_id]
+        del self._ids[self._agent_of[agent_id]]
+
+        self._agent_of[agent_id] = None
+        self._free_ids.append(agent_id)
+
+    @property
+    def time(self) -> float:
+        return self._time
+
+    def __len__(self) -> int:
+        return len(self._expires)
@@ -8,6 +8,8 @@ class Simulation:
     WINDOW_SIZE = (1920, 1080)
     WINDOW_CAPTION = "Gravity"
     WINDOW_BACKGROUND = numpy.full((*WINDOW_SIZE, 3), (123, 123, 123), dtype=numpy.uint8)
+    THETA = 0.7
+    SOFTENING = 10.0
 
     def __init__(self, agents_number: int) -> None:
         self._game = eevolve.Game(self.WINDOW_SIZE, self.WINDOW_SIZE, self.WINDOW_CAPTION, self.WINDOW_BACKGROUND, 10,
@@ -18,15 +20,6 @@ class Simulation:
     def init_movement_handler(agent: SpaceAgent, dt: float) -> None:
         agent.accelerate_by(agent.velocity * dt)
 
-    @staticmethod
-    def movement_handler(pair: tuple[SpaceAgent, SpaceAgent], dt: float) -> None:
-        agent_1, agent_2 = pair
-
-        force = (agent_1.mass * agent_2.mass) / eevolve.Math.distance(agent_1, agent_2) ** 2
-
-        agent_1.accelerate_toward(agent_2, force / agent_2.mass * dt)
-        agent_2.accelerate_toward(agent_1, force / agent_1.mass * dt)
-
     @staticmethod
     def board_handler(agent: eevolve.Agent) -> None:
         collisions = [(1, -1), (-1, 1), (1, -1), (-1, 1)]
@@ -62,8 +55,8 @@ class Simulation:
         tasks = (
             eevolve.AgentTask(self.init_movement_handler, 0, execution_number=1,
                                       priority=eevolve.HIGHEST_TASK_PRIORITY + 2),
-            eevolve.PairTask(self.movement_handler, 0,
-                                     priority=eevolve.HIGHEST_TASK_PRIORITY + 2),
+            eevolve.NBodyTask(None, 0, priority=eevolve.HIGHEST_TASK_PRIORITY + 2, theta=self.THETA,
+                              softening=self.SOFTENING, masses="mass"),
             eevolve.BorderCollisionTask(self.board_handler, 0, priority=eevolve.HIGHEST_TASK_PRIORITY + 2),
             eevolve.CollisionTask(self.collision_handler, 0),
         )
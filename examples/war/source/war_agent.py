@@ -7,6 +7,8 @@ import eevolve
 
 
 class WarAgent(eevolve.Agent):
+    CLONE_POLICY = {"_health": eevolve.CLONE_COPY, "_damage": eevolve.CLONE_COPY}
+
     def __init__(self, agent_size: tuple[int | float, int | float],
                  agent_position: tuple[int | float, int | float] | numpy.ndarray, agent_name: str,
                  agent_surface: str | pygame.Surface | numpy.ndarray, brain: eevolve.Brain,
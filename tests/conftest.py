@@ -0,0 +1,48 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import numpy
+import pytest
+
+import eevolve
+
+
+@pytest.fixture(autouse=True)
+def repository_root(monkeypatch: pytest.MonkeyPatch) -> str:
+    # Examples and benchmark scenarios load their assets by paths relative to the repository root.
+    monkeypatch.chdir(ROOT)
+
+    return ROOT
+
+
+@pytest.fixture
+def rng() -> numpy.random.Generator:
+    return numpy.random.default_rng(0)
+
+
+def random_agents(rng: numpy.random.Generator, number: int, area: float = 400.0, sizes: tuple[int, int] = (4, 30),
+                  agent_type: type = eevolve.Agent) -> list[eevolve.Agent]:
+    agents = []
+
+    for _ in range(number):
+        size = tuple(rng.integers(sizes[0], sizes[1], 2).tolist())
+        position = tuple(rng.uniform(0, area - max(size) - 1, 2).tolist())
+        agents.append(agent_type(size, position))
+
+    return agents
+
+
+def pair_set(pairs) -> set[frozenset[int]]:
+    return {frozenset((id(agent), id(other))) for agent, other in pairs}
+
+
+def row_pair_set(first: numpy.ndarray, second: numpy.ndarray) -> set[frozenset[int]]:
+    return {frozenset(pair) for pair in zip(first.tolist(), second.tolist())}
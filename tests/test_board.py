@@ -0,0 +1,150 @@
+import itertools
+
+import numpy
+import pytest
+
+import eevolve
+from conftest import random_agents, row_pair_set
+
+
+def twin_boards(rng: numpy.random.Generator, number: int = 200) -> tuple[eevolve.Board, eevolve.Board]:
+    agents = random_agents(rng, number)
+    twins = [eevolve.Agent(agent.size, agent.position) for agent in agents]
+
+    for agent, twin in zip(agents, twins):
+        agent.velocity = twin.velocity = rng.normal(0, 400, 2)
+
+    boards = eevolve.Board((64, 64), 7), eevolve.Board((64, 64), 7)
+    boards[0].add_agents(agents)
+    boards[1].add_agents(twins)
+
+    return boards
+
+
+def centers_of(board: eevolve.Board) -> numpy.ndarray:
+    return board.store.positions + board.store.sizes / 2
+
+
+def test_move_agents_matches_agent_move(rng: numpy.random.Generator) -> None:
+    vectorized, reference = twin_boards(rng)
+
+    for _ in range(5):
+        vectorized.move_agents(0.25)
+
+        for agent in list(reference.agents):
+            reference.move_agent(agent, 0.25)
+
+        for agent, twin in zip(vectorized.store.agents, reference.store.agents):
+            assert agent.position == pytest.approx(twin.position)
+            assert agent.collision_directions == twin.collision_directions
+            assert agent.colliding_border == twin.colliding_border
+            assert agent.sector_index == twin.sector_index
+
+        assert [id(agent) for agent in vectorized.border_colliding()] == \
+               [id(agent) for agent in vectorized.store.agents if agent.colliding_border]
+
+
+@pytest.mark.parametrize("radius", [0, 1, 2])
+def test_scan_around_agents_window(rng: numpy.random.Generator, radius: int) -> None:
+    board = eevolve.Board((64, 64), 7)
+    board.add_agents(random_agents(rng, 150))
+
+    board.scan_around_agents(radius)
+    reach = max(radius, 1)
+
+    for agent, around in board.agents.items():
+        x_i, y_i = agent.sector_index
+        expected = {id(other) for other in board.agents if other is not agent
+                    and x_i - radius <= other.sector_index[0] < x_i + reach
+                    and y_i - radius <= other.sector_index[1] < y_i + reach}
+
+        assert {id(other) for other in around} == expected
+
+
+@pytest.mark.parametrize("radius", [0, 1, 2])
+def test_around_agents_matches_scan(rng: numpy.random.Generator, radius: int) -> None:
+    board = eevolve.Board((64, 64), 7, spatial_index="hashed_grid")
+    board.add_agents(random_agents(rng, 150))
+    board.scan_around_agents(radius)
+
+    rows, (offsets, neighbours) = board.around_agents(radius)
+    agents = board.store.agents
+
+    for row in rows.tolist():
+        found = sorted(neighbours[offsets[row]:offsets[row + 1]].tolist())
+
+        assert found == sorted(other.row for other in board.agents[agents[row]])
+
+
+def test_sector_pair_rows_match_sector_pairs(rng: numpy.random.Generator) -> None:
+    board = eevolve.Board((64, 64), 7, spatial_index="hashed_grid")
+    board.add_agents(random_agents(rng, 150))
+    board.check_sector_pairs()
+
+    first, second = board.sector_pair_rows()
+
+    assert row_pair_set(first, second) == {frozenset((agent.row, other.row)) for agent, other in board.sector_pairs}
+
+
+def test_cutoff_pairs_match_brute_force(rng: numpy.random.Generator) -> None:
+    board = eevolve.Board((64, 64), 7)
+    board.add_agents(random_agents(rng, 200))
+
+    centers = centers_of(board)
+    first, second = board.cutoff_pairs(40.0)
+
+    expected = {frozenset((i, j)) for i, j in itertools.combinations(range(len(centers)), 2)
+                if numpy.hypot(*(centers[i] - centers[j])) <= 40.0}
+
+    assert len(first) == len(expected)
+    assert row_pair_set(first, second) == expected
+
+
+def test_nearest_neighbours_match_brute_force(rng: numpy.random.Generator) -> None:
+    board = eevolve.Board((64, 64), 7)
+    board.add_agents(random_agents(rng, 150))
+
+    centers = centers_of(board)
+    indexes, distances = board.nearest_neighbours(5, 60.0)
+
+    for row, center in enumerate(centers):
+        all_distances = numpy.hypot(*(centers - center).T)
+        all_distances[row] = numpy.inf
+
+        expected = numpy.sort(all_distances[all_distances <= 60.0])[:5]
+        found = distances[row][indexes[row] != -1]
+
+        assert found == pytest.approx(expected)
+        assert all_distances[indexes[row][:len(found)]] == pytest.approx(found)
+
+
+def test_gather_fills_missing_neighbours() -> None:
+    board = eevolve.Board((64, 64), 2)
+    board.add_agents([eevolve.Agent((10, 10), (i * 20, 0), f"agent_{i}") for i in range(3)])
+
+    indexes = numpy.array([[1, -1], [2, 0]])
+
+    assert board.gather("name", indexes, fill="").tolist() == [["agent_1", ""], ["agent_2", "agent_0"]]
+    assert board.gather(lambda agent: agent.position[0], indexes).tolist() == [[20.0, 0.0], [40.0, 0.0]]
+
+
+def test_neighbour_list_matches_cutoff_pairs(rng: numpy.random.Generator) -> None:
+    neighbours = eevolve.VerletList(cutoff=40.0, skin=10.0)
+    board = eevolve.Board((64, 64), 7, neighbour_list=neighbours)
+    agents = random_agents(rng, 150)
+    board.add_agents(agents)
+
+    for agent in agents:
+        agent.velocity = rng.normal(0, 5, 2)
+
+    for step in range(10):
+        board.move_agents(0.1)
+
+        if step == 5:
+            board.remove_agent(board.store.agents[0])
+
+        first, second = board.neighbour_rows()
+
+        assert row_pair_set(first, second) == row_pair_set(*board.cutoff_pairs(40.0))
+
+    assert neighbours.builds < neighbours.updates
@@ -0,0 +1,72 @@
+import numpy
+import pytest
+
+import eevolve
+from benchmarks.scenarios import Scenarios
+
+
+def population(number: int) -> list[eevolve.Brain]:
+    brains = [Scenarios.war_brain()]
+    brains.extend(brains[0].new_like_me() for _ in range(number - 1))
+
+    return brains
+
+
+def test_population_matches_per_brain_decisions(rng: numpy.random.Generator) -> None:
+    brains = population(50)
+    observations = rng.normal(0, 1, (50, 16))
+
+    batched = eevolve.PopulationBrain(brains)(observations)
+    expected = numpy.array([brain(observation) for brain, observation in zip(brains, observations)])
+
+    assert numpy.array_equal(batched, expected)
+
+
+def test_population_outputs_match_before_argmax(rng: numpy.random.Generator) -> None:
+    brains = [eevolve.Brain(None) for _ in range(20)]
+
+    for brain in brains:
+        brain.add_layers([
+            eevolve.Dense((6, 4), activation=eevolve.Tanh()),
+            eevolve.Dense((4, 3), activation=eevolve.Sigmoid()),
+        ])
+
+    observations = rng.normal(0, 1, (20, 6))
+    batched = eevolve.PopulationBrain(brains)
+
+    batched.forward(observations)
+
+    for member, (brain, observation) in enumerate(zip(brains, observations)):
+        brain.forward(observation)
+
+        assert numpy.ravel(batched.output[member]) == pytest.approx(numpy.ravel(brain.output))
+
+
+def test_population_shares_genomes_with_brains(rng: numpy.random.Generator) -> None:
+    brains = population(10)
+    batched = eevolve.PopulationBrain(brains)
+
+    batched.mutate()
+
+    for member, brain in enumerate(brains):
+        for layer, weights, biases in zip(brain.layers, batched.weights, batched.biases):
+            assert numpy.array_equal(layer.weights, weights[member])
+            assert numpy.array_equal(layer.biases, biases[member])
+
+    before = batched.weights[0].copy()
+    brains[3].mutate()
+
+    assert numpy.array_equal(brains[3].layers[0].weights, batched.weights[0][3])
+    assert not numpy.array_equal(before[3], batched.weights[0][3])
+    assert numpy.array_equal(numpy.delete(before, 3, axis=0), numpy.delete(batched.weights[0], 3, axis=0))
+
+
+def test_genome_round_trip() -> None:
+    brain = Scenarios.war_brain()
+    brain.flatten()
+    other = brain.new_like_me()
+
+    assert not brain.same_genome(other)
+    assert other.copy_from(brain)
+    assert brain.same_genome(other)
+    assert brain.genome is not other.genome
@@ -0,0 +1,162 @@
+import itertools
+
+import numpy
+import pygame
+import pytest
+
+import eevolve
+from conftest import pair_set, random_agents, row_pair_set
+
+
+class CircleAgent(eevolve.Agent):
+    COLLISION_SHAPE = eevolve.SHAPE_CIRCLE
+
+
+class CustomAgent(eevolve.Agent):
+    def is_collide(self, agent: eevolve.Agent) -> bool:
+        return self.rect.colliderect(agent.rect)
+
+
+def brute_force_collisions(agents: list[eevolve.Agent]) -> set[frozenset[int]]:
+    # A custom agent decides alone, the same as in `Board.check_collision`.
+    return {frozenset((id(agent), id(other))) for agent, other in itertools.combinations(agents, 2)
+            if (other.is_collide(agent) if isinstance(other, CustomAgent) else agent.is_collide(other))}
+
+
+def board_with(agents: list[eevolve.Agent], **kwargs) -> eevolve.Board:
+    board = eevolve.Board((64, 64), 7, collision_timeout=0, **kwargs)
+    board.add_agents(agents)
+
+    return board
+
+
+def test_sweep_and_prune_matches_colliderect(rng: numpy.random.Generator) -> None:
+    boxes = numpy.hstack((rng.uniform(0, 300, (300, 2)), rng.integers(0, 25, (300, 2)))).astype(float)
+    boxes[:10, 2:] = 0.0
+
+    first, second = eevolve.SweepAndPrune.overlapping_pairs(boxes)
+    rects = [pygame.FRect(*box) for box in boxes.tolist()]
+
+    expected = {frozenset((i, j)) for i, j in itertools.combinations(range(len(boxes)), 2)
+                if rects[i].colliderect(rects[j])}
+
+    assert len(first) == len(row_pair_set(first, second))
+    assert row_pair_set(first, second) == expected
+
+
+@pytest.mark.parametrize("spatial_index", ["grid", "hashed_grid", "quadtree"])
+@pytest.mark.parametrize("collision_backend", ["sectors", "sweep_and_prune"])
+def test_board_collisions_match_brute_force(rng: numpy.random.Generator, spatial_index: str,
+                                            collision_backend: str) -> None:
+    agents = random_agents(rng, 150)
+    board = board_with(agents, spatial_index=spatial_index, collision_backend=collision_backend)
+
+    for _ in range(3):
+        for agent in agents:
+            agent.velocity = rng.normal(0, 200, 2)
+
+        board.move_agents(0.1)
+        board.check_collision()
+
+        assert pair_set(board.collided) == brute_force_collisions(agents)
+
+
+@pytest.mark.parametrize("spatial_index", ["grid", "hashed_grid", "quadtree"])
+def test_custom_shapes_use_index_candidates(rng: numpy.random.Generator, spatial_index: str) -> None:
+    agents = random_agents(rng, 60) + random_agents(rng, 60, agent_type=CustomAgent) + \
+             random_agents(rng, 60, agent_type=CircleAgent)
+    board = board_with(agents, spatial_index=spatial_index)
+
+    board.check_collision()
+
+    assert pair_set(board.collided) == brute_force_collisions(agents)
+
+
+@pytest.mark.parametrize("collision_backend", ["sectors", "sweep_and_prune"])
+def test_circle_radius_matches_brute_force(rng: numpy.random.Generator, collision_backend: str) -> None:
+    agents = random_agents(rng, 80, agent_type=CircleAgent) + random_agents(rng, 20, agent_type=CustomAgent)
+
+    for agent in agents[:80:2]:
+        agent.collision_radius = float(rng.uniform(1, 40))
+
+    board = board_with(agents, collision_backend=collision_backend)
+    board.check_collision()
+
+    expected = set()
+
+    for agent, other in itertools.combinations(agents, 2):
+        if isinstance(agent, CustomAgent) or isinstance(other, CustomAgent):
+            if agent.rect.colliderect(other.rect):
+                expected.add(frozenset((id(agent), id(other))))
+            continue
+
+        distance = numpy.hypot(*(numpy.add(agent.position, numpy.divide(agent.size, 2)) -
+                                 numpy.add(other.position, numpy.divide(other.size, 2))))
+
+        if distance <= agent.collision_radius + other.collision_radius:
+            expected.add(frozenset((id(agent), id(other))))
+
+    assert pair_set(board.collided) == expected
+
+
+def test_collision_radius_defaults_to_inscribed_circle() -> None:
+    agent = CircleAgent((10, 20), (0, 0))
+
+    assert agent.collision_radius == 5.0
+
+    agent.collision_radius = 12.0
+    assert agent.collision_radius == 12.0
+
+    agent.collision_radius = None
+    assert agent.collision_radius == 5.0
+
+    with pytest.raises(ValueError):
+        agent.collision_radius = -1.0
+
+
+def test_collide_mask_mixed_shapes() -> None:
+    boxes = numpy.array([[0, 0, 9, 9], [8, 8, 10, 10], [9, 0, 10, 10]], dtype=float)
+    shapes = numpy.array([eevolve.SHAPE_AABB, eevolve.SHAPE_CIRCLE, eevolve.SHAPE_CIRCLE])
+    first, second = numpy.array([0, 0, 1]), numpy.array([1, 2, 2])
+
+    mask = eevolve.CollisionShapes.collide_mask(boxes, shapes, first, second)
+
+    assert mask.tolist() == [False, True, True]
+
+
+def test_collision_timeouts_suppress_repeated_pairs() -> None:
+    agents = [eevolve.Agent((10, 10), (0, 0)), eevolve.Agent((10, 10), (5, 5))]
+    board = eevolve.Board((64, 64), 2, collision_timeout=100)
+    board.add_agents(agents)
+
+    board.check_collision()
+    assert len(board.collided) == 1
+
+    board.decrease_timeout(50)
+    board.check_collision()
+    assert len(board.collided) == 0
+
+    board.decrease_timeout(50)
+    board.check_collision()
+    assert len(board.collided) == 1
+
+
+def test_collision_timeouts_expire_and_reuse_ids() -> None:
+    timeouts = eevolve.CollisionTimeouts()
+    agents = [object() for _ in range(4)]
+
+    timeouts.activate(agents[0], agents[1], 100)
+    timeouts.activate(agents[2], agents[1], 50)
+    timeouts.activate(agents[2], agents[3], 0)
+
+    assert timeouts.is_active(agents[1], agents[0])
+    assert not timeouts.is_active(agents[2], agents[3])
+    assert len(timeouts) == 2
+
+    timeouts.advance(50)
+    assert not timeouts.is_active(agents[1], agents[2])
+    assert timeouts.is_active(agents[0], agents[1])
+
+    timeouts.purge(agents[0])
+    assert not timeouts.is_active(agents[0], agents[1])
+    assert len(timeouts) == 0
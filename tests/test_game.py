@@ -0,0 +1,93 @@
+import functools
+
+import numpy
+import pytest
+
+import eevolve
+from benchmarks.scenarios import Scenarios
+
+
+def war_state(agents_number: int, steps: int, seed: int) -> numpy.ndarray:
+    game = Scenarios.war(agents_number, seed)
+    game.run_steps(steps, Scenarios.STEP_MS)
+
+    store = game.board.store
+    state = numpy.hstack((store.positions, store.velocities))
+
+    return state[numpy.lexsort(state.T[::-1])]
+
+
+def headless_game(**kwargs) -> eevolve.Game:
+    return eevolve.Game((128, 128), (128, 128), "test", Scenarios.BACKGROUND, 2, headless=True, **kwargs)
+
+
+def test_seeded_runs_are_reproducible() -> None:
+    first = war_state(200, 150, seed=7)
+
+    assert numpy.array_equal(first, war_state(200, 150, seed=7))
+    assert not numpy.array_equal(first, war_state(200, 150, seed=8))
+
+
+def test_agent_pool_does_not_change_seeded_result(monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = war_state(300, 200, seed=3)
+
+    pool = eevolve.AgentPool()
+    monkeypatch.setattr(eevolve, "Game", functools.partial(eevolve.Game, agent_pool=pool))
+
+    assert numpy.array_equal(war_state(300, 200, seed=3), expected)
+    assert pool.hits > 0
+
+
+def test_steps_use_fixed_timestep() -> None:
+    elapsed = []
+    game = headless_game(seed=0)
+    game.add_task(eevolve.Task(lambda: elapsed.append(game.time), 0))
+
+    game.run_steps(5, 16)
+
+    assert elapsed == [16.0, 32.0, 48.0, 64.0, 80.0]
+
+
+def test_fast_forward_defaults_timestep_without_fps_limit() -> None:
+    game = eevolve.Game((128, 128), (128, 128), "test", Scenarios.BACKGROUND, 2, fps_limit=0, fast_forward=True,
+                        steps_per_frame=4)
+    game.add_task(eevolve.Task(lambda: game.stop() if game.time >= 4 * 1000 / 60 else None, 0))
+
+    game.run()
+
+    assert game.frame_steps == 4
+    assert game.time == pytest.approx(4 * 1000 / 60)
+
+
+def test_fast_forward_stops_between_sub_steps() -> None:
+    calls = []
+    game = eevolve.Game((128, 128), (128, 128), "test", Scenarios.BACKGROUND, 2, fps_limit=0, fast_forward=True,
+                        steps_per_frame=10)
+
+    def handler() -> None:
+        calls.append(game.time)
+
+        if len(calls) == 3:
+            game.stop()
+
+    game.add_task(eevolve.Task(handler, 0))
+    game.run()
+
+    assert len(calls) == 3
+    assert game.frame_steps == 3
+
+
+def test_sliced_agent_task_handles_every_agent_once_per_period() -> None:
+    handled = []
+    game = headless_game(seed=0)
+    game.add_agents(30, eevolve.AgentGenerator.default(game, 30))
+    game.add_task(eevolve.AgentTask(lambda agent, dt: handled.append((agent, dt)), 64, slices=4))
+
+    game.run_steps(8, 16)
+
+    agents = [agent for agent, _ in handled]
+
+    assert len(handled) == 60
+    assert sorted(map(id, agents[:30])) == sorted(map(id, game.board.agents))
+    assert sorted(map(id, agents[30:])) == sorted(map(id, game.board.agents))
+    assert [dt for _, dt in handled] == pytest.approx([0.064] * 60)
@@ -0,0 +1,40 @@
+import numpy
+import pytest
+
+import eevolve
+
+
+def direct_accelerations(positions: numpy.ndarray, masses: numpy.ndarray, gravity: float,
+                         softening: float) -> numpy.ndarray:
+    deltas = positions[None, :, :] - positions[:, None, :]
+    factors = gravity * masses[None, :] / ((deltas ** 2).sum(axis=2) + softening ** 2) ** 1.5
+    numpy.fill_diagonal(factors, 0.0)
+
+    return (factors[:, :, None] * deltas).sum(axis=1)
+
+
+def test_zero_theta_matches_direct_sum(rng: numpy.random.Generator) -> None:
+    positions = rng.uniform(0, 1000, (300, 2))
+    masses = rng.uniform(1, 10, 300)
+
+    result = eevolve.BarnesHut.accelerations(positions, masses, theta=0.0, gravity=2.0, softening=3.0)
+
+    assert result == pytest.approx(direct_accelerations(positions, masses, 2.0, 3.0), rel=1e-9, abs=1e-12)
+
+
+def test_opening_angle_bounds_error(rng: numpy.random.Generator) -> None:
+    positions = rng.uniform(0, 1000, (500, 2))
+    masses = numpy.full(500, 5.0)
+
+    expected = direct_accelerations(positions, masses, 1.0, 1.0)
+    result = eevolve.BarnesHut.accelerations(positions, 5.0, theta=0.5)
+
+    errors = numpy.linalg.norm(result - expected, axis=1) / numpy.linalg.norm(expected, axis=1)
+
+    assert numpy.median(errors) < 0.01
+
+
+def test_coincident_points_stay_finite() -> None:
+    positions = numpy.zeros((4, 2))
+
+    assert numpy.isfinite(eevolve.BarnesHut.accelerations(positions, 1.0)).all()
@@ -0,0 +1,77 @@
+import numpy
+import pygame
+
+import eevolve
+
+
+class DrawingAgent(eevolve.Agent):
+    def draw(self, surface: pygame.Surface) -> None:
+        pass
+
+
+def pixels_of(surface: pygame.Surface) -> numpy.ndarray:
+    return pygame.surfarray.array3d(surface)
+
+
+def test_rect_outlines_match_pygame(rng: numpy.random.Generator) -> None:
+    # Outlines do not overlap, the batched drawing does not keep the order of overlapping pixels. Rectangles
+    # start inside the surface like sectors and agents do, some of them cross its right and bottom edges.
+    corners = numpy.array([(x, y) for x in range(0, 100, 20) for y in range(0, 100, 20)], dtype=float)
+    rects = numpy.hstack((corners, rng.integers(1, 20, (len(corners), 2)))).astype(float)
+    colors = rng.integers(0, 255, (len(corners), 3))
+
+    batched, reference = pygame.Surface((90, 90)), pygame.Surface((90, 90))
+
+    eevolve.Renderer.rect_outlines(batched, rects, colors)
+
+    for rect, color in zip(rects.tolist(), colors.tolist()):
+        pygame.draw.rect(reference, color, rect, width=1)
+
+    assert numpy.array_equal(pixels_of(batched), pixels_of(reference))
+
+
+def test_lines_stay_inside_surface() -> None:
+    surface = pygame.Surface((64, 64))
+    starts = numpy.array([[10, 10], [-1e12, 32], [0, 0], [5, 5]], dtype=float)
+    ends = numpy.array([[50, 20], [1e12, 32], [numpy.inf, 0], [5, 5]], dtype=float)
+
+    eevolve.Renderer.lines(surface, starts, ends, (255, 255, 255), width=3)
+    pixels = pixels_of(surface)[:, :, 0]
+
+    assert pixels[10, 10] == 255 and pixels[50, 20] == 255
+    assert (pixels[:, 32] == 255).all()
+    assert pixels[5, 5] == 255
+
+
+def test_lines_have_no_gaps(rng: numpy.random.Generator) -> None:
+    surface = pygame.Surface((200, 200))
+    starts, ends = rng.uniform(-50, 250, (30, 2)), rng.uniform(-50, 250, (30, 2))
+
+    for start, end in zip(starts, ends):
+        surface.fill((0, 0, 0))
+        eevolve.Renderer.lines(surface, start[None], end[None], (255, 255, 255))
+
+        pixels = numpy.argwhere(pixels_of(surface)[:, :, 0] == 255)
+
+        if len(pixels) == 0:
+            continue
+
+        axis = int(numpy.abs(end - start).argmax())
+        covered = numpy.unique(pixels[:, axis])
+
+        assert numpy.array_equal(covered, numpy.arange(covered.min(), covered.max() + 1))
+
+
+def test_agent_blits_separate_custom_draw() -> None:
+    agents = [eevolve.Agent((4, 4), (1, 2)), DrawingAgent((4, 4), (3, 4))]
+    positions = numpy.array([agent.position for agent in agents], dtype=float)
+
+    sequence, custom = eevolve.Renderer.agent_blits(agents, positions, eevolve.Agent.draw)
+
+    assert sequence == [(agents[0].surface, [1.0, 2.0])]
+    assert custom == [agents[1]]
+
+    sequence, custom = eevolve.Renderer.agent_blits(agents, positions, DrawingAgent.draw)
+
+    assert [surface for surface, _ in sequence] == [agents[1].surface]
+    assert custom == [agents[0]]
@@ -0,0 +1,58 @@
+import pytest
+
+import eevolve
+
+
+def test_tasks_run_by_period_and_priority() -> None:
+    calls = []
+    scheduler = eevolve.TaskScheduler()
+
+    fast = eevolve.Task(lambda: calls.append("fast"), 10, priority=eevolve.LOWEST_TASK_PRIORITY)
+    slow = eevolve.Task(lambda: calls.append("slow"), 30)
+    scheduler.add(fast, lambda task: task())
+    scheduler.add(slow, lambda task: task())
+
+    for _ in range(6):
+        scheduler.advance(10)
+        scheduler.run_due()
+
+    assert scheduler.executions(fast) == 6
+    assert scheduler.executions(slow) == 2
+    assert calls[2:4] == ["slow", "fast"]
+
+
+def test_finished_and_removed_tasks_drop_stats() -> None:
+    stats = eevolve.TimingStats()
+    scheduler = eevolve.TaskScheduler(stats)
+
+    once = eevolve.Task(lambda: None, 0, execution_number=1)
+    removed = eevolve.Task(lambda: None, 0)
+    scheduler.add(once, lambda task: task())
+    scheduler.add(removed, lambda task: task())
+
+    scheduler.advance(1)
+    scheduler.run_due()
+
+    assert once not in scheduler
+    assert once not in stats.sections
+    assert removed in stats.sections
+
+    assert scheduler.remove(removed)
+    assert removed not in stats.sections
+    assert len(scheduler) == 0
+
+
+@pytest.mark.parametrize("slices", [1, 3, 4])
+def test_slices_elapse_whole_period(slices: int) -> None:
+    task = eevolve.AgentTask(lambda agent, dt: None, 120, slices=slices)
+
+    scheduler = eevolve.TaskScheduler()
+    indexes = []
+    scheduler.add(task, lambda t: indexes.append(t.next_slice()))
+
+    for _ in range(slices * 3):
+        scheduler.advance(120 / slices)
+        scheduler.run_due()
+
+    assert [index for index, _ in indexes] == [step % slices for step in range(slices * 3)]
+    assert [dt for _, dt in indexes] == pytest.approx([0.12] * (slices * 3))
@@ -0,0 +1,81 @@
+import itertools
+
+import numpy
+import pytest
+
+import eevolve
+from conftest import pair_set, random_agents
+
+
+def create_index(name: str) -> eevolve.SpatialIndex:
+    if name == "grid":
+        return eevolve.GridIndex((50, 50), 8)
+    elif name == "hashed_grid":
+        return eevolve.HashedGridIndex((50, 50))
+    else:
+        return eevolve.QuadTreeIndex((0, 0, 400, 400), capacity=4)
+
+
+def moved_index(rng: numpy.random.Generator, name: str) -> tuple[eevolve.SpatialIndex, list[eevolve.Agent]]:
+    index = create_index(name)
+    agents = random_agents(rng, 300)
+
+    for agent in agents:
+        index.insert(agent)
+
+    for agent in agents[:100]:
+        agent.move_to(tuple(rng.uniform(0, 370, 2).tolist()))
+        index.move(agent)
+
+    for agent in agents[100:150]:
+        index.remove(agent)
+
+    agents = agents[:100] + agents[150:]
+
+    for agent in agents[100:200]:
+        agent.move_to(tuple(rng.uniform(0, 370, 2).tolist()))
+
+    index.move_many(agents[100:200], numpy.array([agent.position for agent in agents[100:200]]))
+
+    return index, agents
+
+
+@pytest.mark.parametrize("name", ["grid", "hashed_grid", "quadtree"])
+def test_query_range_matches_brute_force(rng: numpy.random.Generator, name: str) -> None:
+    index, agents = moved_index(rng, name)
+
+    assert len(index) == len(agents)
+
+    for _ in range(50):
+        lower = rng.uniform(-20, 400, 2)
+        upper = lower + rng.uniform(0, 200, 2)
+
+        expected = {id(agent) for agent in agents if (lower <= agent.position).all() and (agent.position < upper).all()}
+        found = index.query_range(lower.tolist(), upper.tolist())
+
+        assert len(found) == len(expected)
+        assert {id(agent) for agent in found} == expected
+
+
+@pytest.mark.parametrize("name", ["grid", "hashed_grid", "quadtree"])
+def test_query_pairs_are_pairs_of_cells(rng: numpy.random.Generator, name: str) -> None:
+    index, agents = moved_index(rng, name)
+
+    cells = [agents_of_cell for _, _, agents_of_cell in index.cells()]
+
+    assert sorted(id(agent) for cell in cells for agent in cell) == sorted(id(agent) for agent in agents)
+    assert pair_set(index.query_pairs()) == {frozenset((id(agent), id(other))) for cell in cells
+                                             for agent, other in itertools.combinations(cell, 2)}
+
+
+@pytest.mark.parametrize("name", ["grid", "hashed_grid"])
+def test_grid_pairs_share_sector(rng: numpy.random.Generator, name: str) -> None:
+    index, agents = moved_index(rng, name)
+
+    def cell_of(agent: eevolve.Agent) -> tuple[int, int]:
+        return tuple(numpy.floor(numpy.divide(agent.position, 50)).astype(int).tolist())
+
+    expected = {frozenset((id(agent), id(other))) for agent, other in itertools.combinations(agents, 2)
+                if cell_of(agent) == cell_of(other)}
+
+    assert pair_set(index.query_pairs()) == expected
@@ -0,0 +1,84 @@
+import gc
+
+import numpy
+
+import eevolve
+
+
+def test_remove_swaps_last_row_into_freed_one() -> None:
+    board = eevolve.Board((64, 64), 4)
+    agents = [eevolve.Agent((10, 10), (i * 20, i * 10)) for i in range(5)]
+    board.add_agents(agents)
+
+    positions = {id(agent): agent.position for agent in agents}
+    board.remove_agent(agents[1])
+
+    assert len(board.store) == 4
+    assert agents[4].row == 1
+    assert agents[1].store is eevolve.AgentStore.detached()
+    assert agents[1].position == positions[id(agents[1])]
+
+    for row, agent in enumerate(board.store.agents):
+        assert agent.row == row
+        assert agent.position == positions[id(agent)]
+        assert tuple(board.store.positions[row].tolist()) == positions[id(agent)]
+
+
+def test_store_grows_and_keeps_rows() -> None:
+    board = eevolve.Board((64, 64), 4)
+    agents = [eevolve.Agent((4, 4), (i % 200, i // 200)) for i in range(eevolve.AgentStore.INITIAL_CAPACITY * 3)]
+    board.add_agents(agents)
+
+    assert board.store.capacity >= len(agents)
+    assert [agent.position for agent in agents] == [(i % 200, i // 200) for i in range(len(agents))]
+
+
+def test_detached_store_releases_collected_agents() -> None:
+    detached = eevolve.AgentStore.detached()
+
+    gc.collect()
+    eevolve.Agent((1, 1), (0, 0))
+    baseline = len(detached)
+
+    for _ in range(1000):
+        eevolve.Agent((1, 1), (0, 0))
+
+    gc.collect()
+    eevolve.Agent((1, 1), (0, 0))
+
+    assert len(detached) <= baseline + 1
+
+
+def test_rect_writes_through() -> None:
+    agent = eevolve.Agent((10, 20), (5, 5))
+
+    agent.rect.x = 30
+    assert agent.position == (30, 5)
+
+    agent.rect.move_ip(1, 2)
+    assert agent.position == (31, 7)
+
+    agent.rect.width = 12
+    assert agent.size == (12, 20)
+
+
+def test_colliding_border_flag_is_separate_from_directions() -> None:
+    board = eevolve.Board((64, 64), 2)
+    agent = eevolve.Agent((10, 10), (50, 50))
+    board.add_agent(agent)
+
+    agent.colliding_border = True
+    assert agent.colliding_border
+    assert agent.collision_directions == []
+    assert board.border_colliding() == [agent]
+
+    board.move_agents(0.016)
+    assert not agent.colliding_border
+
+    agent.velocity = numpy.array([-10_000.0, 0.0])
+    board.move_agents(0.016)
+    assert agent.collision_directions == [eevolve.COLLISION_LEFT]
+
+    agent.colliding_border = False
+    assert not agent.colliding_border
+    assert board.border_colliding() == []